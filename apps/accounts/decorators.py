@@ -2,11 +2,12 @@ from functools import wraps
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
-from django.core.cache import cache
 from django.http import HttpResponse
 from django.shortcuts import redirect
 from django.urls import reverse
-import time
+import math
+
+from .ratelimit import TOKEN_BUCKET, Limiter
 
 
 def role_required(*roles):
@@ -40,20 +41,25 @@ class SeekerRequiredMixin(RoleRequiredMixin):
     allowed_roles = ("seeker",)
 
 
-def rate_limit(key="rl", rate=5, period=60):
+def rate_limit(key="rl", rate=5, period=60, algorithm=TOKEN_BUCKET, methods=None):
     """
-    Limit a view to `rate` requests per `period` seconds per user/IP.
+    Limit a view to `rate` requests per `period` seconds per user/IP, using
+    apps.accounts.ratelimit (`methods`, e.g. ("POST",), limits only those).
+    Refused requests get a 429 with Retry-After.
     """
+    limiter = Limiter(rate, period, algorithm=algorithm)
+
     def decorator(view_func):
         @wraps(view_func)
         def _wrapped(request, *args, **kwargs):
+            if methods and request.method not in methods:
+                return view_func(request, *args, **kwargs)
             ident = request.user.id if request.user.is_authenticated else request.META.get("REMOTE_ADDR", "anon")
-            bucket = int(time.time() // period)
-            cache_key = f"{key}:{ident}:{bucket}"
-            count = cache.get(cache_key, 0)
-            if count >= rate:
-                return HttpResponse("Prea multe cereri. Încearcă mai târziu.", status=429)
-            cache.set(cache_key, count + 1, timeout=period)
+            decision = limiter.hit(f"{key}:{ident}")
+            if not decision.allowed:
+                response = HttpResponse("Prea multe cereri. Încearcă mai târziu.", status=429)
+                response["Retry-After"] = str(max(1, math.ceil(decision.retry_after)))
+                return response
             return view_func(request, *args, **kwargs)
         return _wrapped
     return decorator
@@ -0,0 +1,221 @@
+"""
+Rate limiting.
+
+Two algorithms, both applied atomically by the backend:
+
+- "token_bucket": `rate` tokens refilled evenly over `period`; bursts up
+  to `rate`, no double burst at window edges.
+- "sliding_window": a log of hit timestamps; at most `rate` hits in any
+  `period` seconds.
+
+RedisBackend runs each check as one Lua script (one round trip, atomic across
+all workers, clocked by the Redis server). MemoryBackend is the in-process
+stand-in used by tests and dev; the backend class is settings.RATELIMIT_BACKEND.
+
+Limiter adds two in-process shortcuts in front of the backend:
+- callers refused by the backend are refused locally until their
+  retry_after has passed, so a flood costs no round trips;
+- for fast refilling buckets (LEASE_MIN_REFILL tokens/s and up), tokens
+  are leased: one round trip takes up to LEASE_FRACTION of the bucket, later
+  hits in this process spend the lease locally for LEASE_TTL seconds. Leased
+  tokens are already taken from the shared bucket, so the global limit is
+  never exceeded. A lease is never larger than what refills in LEASE_TTL, so
+  tokens that expire unspent cost at most one LEASE_TTL of capacity; slow
+  buckets (20/hour) are not leased at all.
+"""
+import logging
+import math
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+TOKEN_BUCKET = "token_bucket"
+SLIDING_WINDOW = "sliding_window"
+ALGORITHMS = (TOKEN_BUCKET, SLIDING_WINDOW)
+
+KEY_PREFIX = "rl:"
+LEASE_FRACTION = 0.1
+LEASE_TTL = 1.0
+# Below this refill rate (tokens per second) ask the backend on every hit
+LEASE_MIN_REFILL = 5.0
+MAX_LOCAL_KEYS = 10000
+
+
+@dataclass
+class Decision:
+    allowed: bool
+    remaining: int
+    retry_after: float = 0.0
+
+
+class MemoryBackend:
+    """Per-process backend (tests, dev, single worker). Atomic through one lock."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._logs: Dict[str, deque] = {}
+
+    def take(self, key: str, rate: int, period: float, want: int = 1) -> Tuple[int, float]:
+        """Token bucket: returns (granted, tokens left)."""
+        refill = rate / period
+        with self._lock:
+            now = self.clock()
+            tokens, ts = self._buckets.get(key, (rate, now))
+            tokens = min(rate, tokens + max(0.0, now - ts) * refill)
+            granted = min(want, math.floor(tokens))
+            tokens -= granted
+            self._buckets[key] = (tokens, now)
+        return granted, tokens
+
+    def log(self, key: str, rate: int, period: float) -> Tuple[bool, int, float]:
+        """Sliding window log: returns (allowed, remaining, retry_after)."""
+        with self._lock:
+            now = self.clock()
+            hits = self._logs.setdefault(key, deque())
+            while hits and hits[0] <= now - period:
+                hits.popleft()
+            if len(hits) < rate:
+                hits.append(now)
+                return True, rate - len(hits), 0.0
+            return False, 0, hits[0] + period - now
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+            self._logs.clear()
+
+
+_TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local refill = tonumber(ARGV[2])
+local want = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * refill)
+local granted = math.min(want, math.floor(tokens))
+tokens = tokens - granted
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / refill * 1000))
+return {granted, tostring(tokens)}
+"""
+
+_SLIDING_WINDOW_LUA = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+if count < limit then
+  redis.call('ZADD', KEYS[1], now, ARGV[3])
+  redis.call('PEXPIRE', KEYS[1], window)
+  return {1, limit - count - 1, 0}
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return {0, 0, tonumber(oldest[2]) + window - now}
+"""
+
+
+class RedisBackend:
+    """Shared backend: one atomic Lua script per check, on settings.RATELIMIT_REDIS_URL."""
+
+    def __init__(self, url: Optional[str] = None):
+        import redis
+
+        self.client = redis.Redis.from_url(url or settings.RATELIMIT_REDIS_URL)
+        self._take = self.client.register_script(_TOKEN_BUCKET_LUA)
+        self._log = self.client.register_script(_SLIDING_WINDOW_LUA)
+
+    def take(self, key, rate, period, want=1):
+        granted, tokens = self._take(keys=[key], args=[rate, rate / period, want])
+        return int(granted), float(tokens)
+
+    def log(self, key, rate, period):
+        allowed, remaining, retry_ms = self._log(keys=[key], args=[rate, int(period * 1000), uuid.uuid4().hex])
+        return bool(allowed), int(remaining), int(retry_ms) / 1000
+
+
+@lru_cache(maxsize=1)
+def get_backend():
+    return import_string(getattr(settings, "RATELIMIT_BACKEND", "apps.accounts.ratelimit.MemoryBackend"))()
+
+
+class Limiter:
+    def __init__(self, rate: int, period: float, algorithm: str = TOKEN_BUCKET, backend=None,
+                 clock: Callable[[], float] = time.monotonic):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown rate limit algorithm: {algorithm}")
+        self.rate = rate
+        self.period = period
+        self.algorithm = algorithm
+        self._backend = backend
+        self.clock = clock
+        refill = rate / period
+        self.lease_size = max(1, int(min(rate * LEASE_FRACTION, refill * LEASE_TTL))) if refill >= LEASE_MIN_REFILL else 1
+        self._lock = threading.Lock()
+        self._blocked: Dict[str, float] = {}
+        self._leases: Dict[str, Tuple[int, float]] = {}
+
+    @property
+    def backend(self):
+        return self._backend or get_backend()
+
+    def _local(self, key: str, now: float) -> Optional[Decision]:
+        with self._lock:
+            until = self._blocked.get(key)
+            if until is not None:
+                if now < until:
+                    return Decision(False, 0, until - now)
+                del self._blocked[key]
+            tokens, expires = self._leases.get(key, (0, 0.0))
+            if tokens and now < expires:
+                self._leases[key] = (tokens - 1, expires)
+                return Decision(True, tokens - 1)
+        return None
+
+    def _remote(self, key: str, now: float) -> Decision:
+        if self.algorithm == SLIDING_WINDOW:
+            allowed, remaining, retry_after = self.backend.log(key, self.rate, self.period)
+            decision = Decision(allowed, remaining, retry_after)
+        else:
+            granted, tokens = self.backend.take(key, self.rate, self.period, want=self.lease_size)
+            if granted > 1:
+                with self._lock:
+                    self._leases[key] = (granted - 1, now + LEASE_TTL)
+                    if len(self._leases) > MAX_LOCAL_KEYS:
+                        self._leases = {k: v for k, v in self._leases.items() if v[1] > now}
+            retry_after = 0.0 if granted else (1 - tokens) * self.period / self.rate
+            decision = Decision(granted > 0, int(tokens), retry_after)
+        if not decision.allowed:
+            with self._lock:
+                self._blocked[key] = now + decision.retry_after
+                if len(self._blocked) > MAX_LOCAL_KEYS:
+                    self._blocked = {k: t for k, t in self._blocked.items() if t > now}
+        return decision
+
+    def hit(self, key: str) -> Decision:
+        key = KEY_PREFIX + key
+        now = self.clock()
+        decision = self._local(key, now)
+        if decision is not None:
+            return decision
+        try:
+            return self._remote(key, now)
+        except Exception:
+            # Fail open: a backend outage must not lock everyone out
+            logger.exception("Rate limit backend unavailable")
+            return Decision(True, self.rate)
@@ -14,7 +14,9 @@ from django.shortcuts import redirect, render
 from django.urls import reverse, resolve, Resolver404
 import json
 
+from .decorators import rate_limit
 from .forms import LoginForm, SignupForm, SeekerProfileForm
+from .ratelimit import SLIDING_WINDOW
 from .models import SeekerProfile
 
 
@@ -129,6 +131,8 @@ def quick_apply_prep(request):
     return JsonResponse({"ok": True, "quick_apply_ready": profile.quick_apply_ready})
 
 
+# Sliding window: no burst of guesses at window edges
+@rate_limit(key="login", rate=10, period=5 * 60, algorithm=SLIDING_WINDOW, methods=("POST",))
 def login_view(request):
     next_url = request.GET.get("next") or request.POST.get("next") or reverse("home")
     if request.user.is_authenticated:
@@ -0,0 +1,182 @@
+"""
+Retention for the raw Event table.
+
+Events are bucketed by calendar month of created_at. Once a month is older
+than ANALYTICS_EVENT_RETENTION_MONTHS it is closed: `archive_month()` streams
+its rows (keyset on id) into a gzip JSON-lines file under
+ANALYTICS_ARCHIVE_ROOT, swaps the file in atomically and only then deletes
+the rows it wrote, by id chunks read back from the file (a row committed late
+inside the archived id range stays for the next part). Only events already
+folded into the rollups (below the rollup watermark) are archived, so reports
+never lose data.
+
+Mass DELETEs leave dead tuples and a bloated created_at index behind; on
+Postgres `archive()` ends with `compact()` (VACUUM ANALYZE, then REINDEX
+CONCURRENTLY) whenever it moved rows. Native range partitions would make
+retention a DROP TABLE, but Postgres requires the partition key in every
+unique index, i.e. a (id, created_at) primary key, which the single-column
+pk the ORM (and the rollup/archive keysets on id) rely on rules out.
+
+A month can have several parts: events replayed late for an archived month
+go to a new `events-YYYY-MM-<first id>.jsonl.gz` file on the next run.
+`read_archive()` re-queries archived periods from those files.
+"""
+import gzip
+import json
+import os
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import Event, RollupWatermark
+from .rollups import WATERMARK
+
+ARCHIVE_ROOT = Path(getattr(settings, "ANALYTICS_ARCHIVE_ROOT", settings.BASE_DIR / "var" / "analytics-archive"))
+RETENTION_MONTHS = getattr(settings, "ANALYTICS_EVENT_RETENTION_MONTHS", 3)
+CHUNK_SIZE = 5000
+
+FIELDS = ("id", "name", "user_id", "path", "ip", "user_agent", "request_id", "properties", "created_at")
+
+
+def month_start(year: int, month: int) -> datetime:
+    return timezone.make_aware(datetime.combine(date(year, month, 1), time.min))
+
+
+def next_month(year: int, month: int) -> Tuple[int, int]:
+    return (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def month_range(year: int, month: int) -> Tuple[datetime, datetime]:
+    return month_start(year, month), month_start(*next_month(year, month))
+
+
+def closed_before(retention_months: Optional[int] = None) -> Tuple[int, int]:
+    """First month still kept in the hot table."""
+    retention_months = RETENTION_MONTHS if retention_months is None else retention_months
+    today = timezone.localdate()
+    index = today.year * 12 + today.month - 1 - retention_months
+    return index // 12, index % 12 + 1
+
+
+def closed_months(retention_months: Optional[int] = None) -> List[Tuple[int, int]]:
+    """Months older than the retention window that still have events."""
+    keep_from = month_start(*closed_before(retention_months))
+    oldest = Event.objects.filter(created_at__lt=keep_from).order_by("created_at").values_list("created_at", flat=True).first()
+    if oldest is None:
+        return []
+    oldest = timezone.localtime(oldest)
+    months = []
+    year, month = oldest.year, oldest.month
+    while month_start(year, month) < keep_from:
+        months.append((year, month))
+        year, month = next_month(year, month)
+    return months
+
+
+def _archivable(year: int, month: int):
+    start, end = month_range(year, month)
+    rolled_up = RollupWatermark.objects.filter(name=WATERMARK).values_list("last_event_id", flat=True).first() or 0
+    return Event.objects.filter(created_at__gte=start, created_at__lt=end, id__lte=rolled_up)
+
+
+def _row(event: dict) -> str:
+    return json.dumps({**event, "created_at": event["created_at"].isoformat()}, default=str)
+
+
+def archive_month(year: int, month: int, root: Optional[Path] = None, chunk_size: Optional[int] = None) -> int:
+    """Move one month's events to a compressed archive part; returns how many were moved."""
+    root = Path(root or ARCHIVE_ROOT)
+    chunk_size = chunk_size or CHUNK_SIZE
+    events = _archivable(year, month)
+    first = events.order_by("id").values_list("id", flat=True).first()
+    if first is None:
+        return 0
+    root.mkdir(parents=True, exist_ok=True)
+    path = root / f"events-{year:04d}-{month:02d}-{first}.jsonl.gz"
+    tmp = path.with_name(path.name + ".tmp")
+    last_id, count = first - 1, 0
+    with gzip.open(tmp, "wt", encoding="utf-8") as out:
+        while True:
+            rows = list(events.filter(id__gt=last_id).order_by("id").values(*FIELDS)[:chunk_size])
+            if not rows:
+                break
+            out.write("\n".join(_row(row) for row in rows) + "\n")
+            last_id = rows[-1]["id"]
+            count += len(rows)
+    os.replace(tmp, path)
+
+    # Rows are only deleted once their archive file is in place, and only
+    # those actually written to it
+    for ids in _archived_ids(path, chunk_size):
+        Event.objects.filter(id__in=ids).delete()
+    return count
+
+
+def _archived_ids(path: Path, chunk_size: int) -> Iterator[List[int]]:
+    ids = []
+    with gzip.open(path, "rt", encoding="utf-8") as src:
+        for line in src:
+            if line.strip():
+                ids.append(json.loads(line)["id"])
+            if len(ids) >= chunk_size:
+                yield ids
+                ids = []
+    if ids:
+        yield ids
+
+
+def compact() -> bool:
+    """Reclaim the space of archived rows (Postgres only; must run outside a transaction)."""
+    if connection.vendor != "postgresql" or not connection.get_autocommit():
+        return False
+    table = connection.ops.quote_name(Event._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(f"VACUUM (ANALYZE) {table}")
+        cursor.execute(f"REINDEX TABLE CONCURRENTLY {table}")
+    return True
+
+
+def archive(retention_months: Optional[int] = None, root: Optional[Path] = None, progress=None,
+            compact_table: bool = True) -> dict:
+    """Archive every closed month, then compact the table. Returns {"months": n, "events": n}."""
+    stats = {"months": 0, "events": 0}
+    for year, month in closed_months(retention_months):
+        moved = archive_month(year, month, root=root)
+        if moved:
+            stats["months"] += 1
+            stats["events"] += moved
+        if progress:
+            progress(year, month, moved)
+    if stats["events"] and compact_table:
+        compact()
+    return stats
+
+
+def _parts(start: date, end: date, root: Path) -> List[Path]:
+    paths = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        paths.extend(sorted(root.glob(f"events-{year:04d}-{month:02d}-*.jsonl.gz")))
+        year, month = next_month(year, month)
+    return paths
+
+
+def read_archive(start: date, end: date, name: Optional[str] = None, root: Optional[Path] = None) -> Iterator[dict]:
+    """Archived events with start <= local date of created_at <= end (optionally one event name)."""
+    root = Path(root or ARCHIVE_ROOT)
+    for path in _parts(start, end, root):
+        with gzip.open(path, "rt", encoding="utf-8") as src:
+            for line in src:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                if name and row["name"] != name:
+                    continue
+                row["created_at"] = parse_datetime(row["created_at"])
+                if start <= timezone.localdate(row["created_at"]) <= end:
+                    yield row
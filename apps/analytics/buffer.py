@@ -0,0 +1,302 @@
+"""
+Buffered event ingestion.
+
+`log_event` only builds a plain dict and appends it to a bounded in-process
+queue; a daemon thread drains the queue and writes it with one bulk_create
+per ANALYTICS_BUFFER_BATCH_SIZE events, or every ANALYTICS_BUFFER_FLUSH_INTERVAL
+seconds, whichever comes first.
+
+- Backpressure: when the queue is full (database down or too slow) new
+  events are dropped and counted instead of blocking the request.
+- Failed flushes are written to a JSON-lines spool file under
+  ANALYTICS_SPOOL_DIR; `manage.py replay_event_spool` loads them later.
+- Whatever is still queued is flushed at interpreter exit. The process-wide
+  buffer also rewrites its counters (see `stats()`) to a small ledger file in
+  the spool directory after every flush and removes it on a clean exit, so a
+  ledger left behind by a dead process records how many events were still
+  queued when it was killed; `reap_ledgers()` (run by replay_event_spool)
+  logs and removes those. Events enqueued after the last ledger write (at
+  most one flush interval) are not covered.
+- The counters are also logged on every flush that dropped, spooled or
+  failed events.
+
+ANALYTICS_BUFFER_MODE = "sync" writes each event immediately (tests, dev).
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils.dateparse import parse_datetime
+
+from .models import Event
+
+logger = logging.getLogger("analytics")
+
+MODE_SYNC = "sync"
+MODE_BUFFER = "buffer"
+
+MAX_SIZE = getattr(settings, "ANALYTICS_BUFFER_MAX_SIZE", 10000)
+BATCH_SIZE = getattr(settings, "ANALYTICS_BUFFER_BATCH_SIZE", 500)
+FLUSH_INTERVAL = getattr(settings, "ANALYTICS_BUFFER_FLUSH_INTERVAL", 2.0)
+SPOOL_DIR = Path(getattr(settings, "ANALYTICS_SPOOL_DIR", settings.BASE_DIR / "var" / "analytics-spool"))
+SPOOL_SUFFIX = ".jsonl"
+LEDGER_PREFIX = "ledger-"
+
+
+def to_event(row: dict) -> Event:
+    return Event(**row)
+
+
+def write_events(rows: List[dict]) -> int:
+    Event.objects.bulk_create([to_event(row) for row in rows], batch_size=BATCH_SIZE)
+    return len(rows)
+
+
+def spool(rows: List[dict], spool_dir: Optional[Path] = None) -> Path:
+    """Write rows to a new spool file (atomically, so replay never sees half a file)."""
+    spool_dir = Path(spool_dir or SPOOL_DIR)
+    spool_dir.mkdir(parents=True, exist_ok=True)
+    path = spool_dir / f"events-{os.getpid()}-{uuid.uuid4().hex}{SPOOL_SUFFIX}"
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as out:
+        for row in rows:
+            out.write(json.dumps({**row, "created_at": row["created_at"].isoformat()}, default=str) + "\n")
+    os.replace(tmp, path)
+    return path
+
+
+def replay_spool(spool_dir: Optional[Path] = None, batch_size: Optional[int] = None) -> dict:
+    """
+    Load every spool file into the database, deleting each once written.
+
+    Each file is written in one transaction, so a failure part way through
+    leaves the file to be replayed whole instead of duplicating its first
+    batches.
+    """
+    spool_dir = Path(spool_dir or SPOOL_DIR)
+    batch_size = batch_size or BATCH_SIZE
+    stats = {"files": 0, "events": 0}
+    if not spool_dir.is_dir():
+        return stats
+    for path in sorted(spool_dir.glob(f"*{SPOOL_SUFFIX}")):
+        with open(path, encoding="utf-8") as src:
+            rows = [json.loads(line) for line in src if line.strip()]
+        for row in rows:
+            row["created_at"] = parse_datetime(row["created_at"])
+        with transaction.atomic():
+            for start in range(0, len(rows), batch_size):
+                write_events(rows[start:start + batch_size])
+        path.unlink()
+        stats["files"] += 1
+        stats["events"] += len(rows)
+    return stats
+
+
+def in_flight(counts: dict) -> int:
+    """Events accepted by a buffer but neither written, spooled nor given up on."""
+    return counts["enqueued"] - counts["flushed"] - counts["spooled"] - counts["failed"]
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def reap_ledgers(spool_dir: Optional[Path] = None) -> int:
+    """Log and remove the ledgers of dead processes; returns the events they lost."""
+    spool_dir = Path(spool_dir or SPOOL_DIR)
+    lost = 0
+    if not spool_dir.is_dir():
+        return lost
+    for path in sorted(spool_dir.glob(f"{LEDGER_PREFIX}*.json")):
+        try:
+            with open(path, encoding="utf-8") as src:
+                counts = json.load(src)
+        except (OSError, ValueError):
+            logger.exception("Unreadable analytics buffer ledger %s", path)
+            continue
+        if counts["pid"] == os.getpid() or _pid_alive(counts["pid"]):
+            continue
+        missing = in_flight(counts)
+        if missing > 0:
+            logger.error("analytics buffer of pid %s died with %d events queued: %s", counts["pid"], missing, counts)
+            lost += missing
+        path.unlink()
+    return lost
+
+
+class EventBuffer:
+    def __init__(self, max_size: int = MAX_SIZE, batch_size: int = BATCH_SIZE,
+                 flush_interval: float = FLUSH_INTERVAL, ledger_path: Optional[Path] = None):
+        self.queue = queue.Queue(maxsize=max_size)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.ledger_path = ledger_path
+        # dropped: rejected by a full queue; failed: neither written nor spooled
+        self.counts = {"enqueued": 0, "flushed": 0, "spooled": 0, "dropped": 0, "failed": 0}
+        self._reported = (0, 0, 0)
+        self._persisted = None
+        # _lock serialises flushes; _counts_lock guards counts, taken by request threads too
+        self._lock = threading.Lock()
+        self._counts_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="analytics-flusher", daemon=True)
+        self._thread.start()
+
+    def put(self, row: dict) -> bool:
+        # Counted together with the put, so a concurrent flush never sees the
+        # event written before it was enqueued
+        with self._counts_lock:
+            try:
+                self.queue.put_nowait(row)
+            except queue.Full:
+                self.counts["dropped"] += 1
+                return False
+            self.counts["enqueued"] += 1
+        return True
+
+    def _count(self, name: str, n: int) -> None:
+        with self._counts_lock:
+            self.counts[name] += n
+
+    def _drain(self) -> List[dict]:
+        rows = []
+        while len(rows) < self.batch_size:
+            try:
+                rows.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return rows
+
+    def flush(self) -> int:
+        """Write everything queued so far; returns the number of events handled."""
+        handled = 0
+        with self._lock:
+            while True:
+                rows = self._drain()
+                if not rows:
+                    break
+                try:
+                    self._count("flushed", write_events(rows))
+                except Exception:
+                    logger.exception("Event flush failed, spooling %d events", len(rows))
+                    try:
+                        spool(rows)
+                        self._count("spooled", len(rows))
+                    except OSError:
+                        logger.exception("Could not spool events")
+                        self._count("failed", len(rows))
+                handled += len(rows)
+        self._report()
+        return handled
+
+    def _report(self) -> None:
+        stats = self.stats()
+        lost = (stats["dropped"], stats["spooled"], stats["failed"])
+        if lost != self._reported:
+            self._reported = lost
+            logger.warning("analytics buffer %s", stats)
+
+    def persist(self) -> None:
+        """Rewrite the ledger file when the counters changed since the last write."""
+        if self.ledger_path is None:
+            return
+        with self._counts_lock:
+            counts = dict(self.counts)
+        if counts == self._persisted:
+            return
+        try:
+            self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.ledger_path.with_name(self.ledger_path.name + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as out:
+                json.dump({**counts, "pid": os.getpid()}, out)
+            os.replace(tmp, self.ledger_path)
+            self._persisted = counts
+        except OSError:
+            logger.exception("Could not write analytics buffer ledger")
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            deadline = time.monotonic() + self.flush_interval
+            while self.queue.qsize() < self.batch_size and time.monotonic() < deadline:
+                if self._stop.wait(0.05):
+                    break
+            try:
+                self.flush()
+            finally:
+                close_old_connections()
+            self.persist()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.flush()
+        if self.ledger_path is None:
+            return
+        with self._counts_lock:
+            counts = dict(self.counts)
+        if in_flight(counts) == 0:
+            # Clean exit: nothing left for reap_ledgers() to report
+            self.ledger_path.unlink(missing_ok=True)
+        else:
+            self.persist()
+
+    def stats(self) -> dict:
+        with self._counts_lock:
+            counts = dict(self.counts)
+        return {**counts, "pending": self.queue.qsize(), "pid": os.getpid()}
+
+
+_buffer: Optional[EventBuffer] = None
+_buffer_pid: Optional[int] = None
+_buffer_lock = threading.Lock()
+
+
+def get_buffer() -> EventBuffer:
+    """The process-wide buffer, (re)started lazily so forked workers get their own thread."""
+    global _buffer, _buffer_pid
+    pid = os.getpid()
+    if _buffer is None or _buffer_pid != pid:
+        with _buffer_lock:
+            if _buffer is None or _buffer_pid != pid:
+                if _buffer is None:
+                    atexit.register(_shutdown)
+                _buffer = EventBuffer(ledger_path=SPOOL_DIR / f"{LEDGER_PREFIX}{pid}.json")
+                _buffer.start()
+                _buffer_pid = pid
+    return _buffer
+
+
+def _shutdown() -> None:
+    # A forked child inherits the parent's queue copy; only the owner flushes it
+    if _buffer is not None and _buffer_pid == os.getpid():
+        _buffer.stop()
+
+
+def record(row: dict) -> None:
+    if getattr(settings, "ANALYTICS_BUFFER_MODE", MODE_BUFFER) == MODE_SYNC:
+        write_events([row])
+    else:
+        get_buffer().put(row)
+
+
+def stats() -> Optional[dict]:
+    return _buffer.stats() if _buffer is not None and _buffer_pid == os.getpid() else None
@@ -0,0 +1,87 @@
+"""
+Materialized site counters (home page stats).
+
+Counters are rows in SiteCounter, adjusted with atomic F() updates by the
+signal handlers in apps/analytics/signals.py. `reconcile()` recomputes them
+from the source tables to correct any drift (raw SQL, failed transactions,
+bulk updates that slipped past the signals).
+"""
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import SiteCounter
+
+JOBS_ACTIVE = "jobs_active"
+COMPANIES = "companies"
+
+
+def applications_month_key(when: Optional[datetime] = None) -> str:
+    when = timezone.localtime(when or timezone.now())
+    return f"applications_month:{when:%Y-%m}"
+
+
+def increment(key: str, delta: int = 1) -> None:
+    if not delta:
+        return
+    if SiteCounter.objects.filter(key=key).update(value=F("value") + delta):
+        return
+    # First touch of this counter: seed it from the source of truth rather
+    # than from the delta, so it is correct right away.
+    set_value(key, compute(key))
+
+
+def set_value(key: str, value: int) -> None:
+    try:
+        with transaction.atomic():
+            SiteCounter.objects.update_or_create(key=key, defaults={"value": value})
+    except IntegrityError:
+        # Concurrent first write; the other one wins, both computed the same thing
+        pass
+
+
+def compute(key: str) -> int:
+    from apps.applications.models import Application
+    from apps.companies.models import Company
+    from apps.jobs.models import Job, PUBLIC_JOB_CONDITION
+
+    if key == JOBS_ACTIVE:
+        return Job.objects.filter(PUBLIC_JOB_CONDITION).count()
+    if key == COMPANIES:
+        return Company.objects.count()
+    if key.startswith("applications_month:"):
+        year, month = (int(part) for part in key.split(":", 1)[1].split("-"))
+        start = timezone.make_aware(datetime(year, month, 1))
+        end = timezone.make_aware(datetime(year + month // 12, month % 12 + 1, 1))
+        return Application.objects.filter(created_at__gte=start, created_at__lt=end).count()
+    raise KeyError(key)
+
+
+def get_counters(keys: Iterable[str]) -> Dict[str, int]:
+    """Read several counters in one query; missing ones are computed and stored."""
+    keys = list(keys)
+    values = dict(SiteCounter.objects.filter(key__in=keys).values_list("key", "value"))
+    for key in keys:
+        if key not in values:
+            values[key] = compute(key)
+            set_value(key, values[key])
+    return values
+
+
+def reconcile(keys: Optional[Iterable[str]] = None) -> Dict[str, tuple]:
+    """
+    Recompute counters (default: the home page ones) and store the exact
+    values. Returns {key: (stored, actual)} for the counters that had drifted.
+    """
+    keys = list(keys or (JOBS_ACTIVE, COMPANIES, applications_month_key()))
+    stored = dict(SiteCounter.objects.filter(key__in=keys).values_list("key", "value"))
+    drift = {}
+    for key in keys:
+        actual = compute(key)
+        if stored.get(key) != actual:
+            drift[key] = (stored.get(key), actual)
+            set_value(key, actual)
+    return drift
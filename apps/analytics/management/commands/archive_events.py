@@ -0,0 +1,24 @@
+from django.core.management import BaseCommand
+
+from apps.analytics import archive
+
+
+class Command(BaseCommand):
+    help = "Move events of months past the retention window to compressed archive files."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--retention-months", type=int, default=archive.RETENTION_MONTHS)
+        parser.add_argument("--dry-run", action="store_true", help="Only list the closed months")
+        parser.add_argument("--no-compact", action="store_true", help="Skip VACUUM/REINDEX after archiving (Postgres)")
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            for year, month in archive.closed_months(options["retention_months"]):
+                self.stdout.write(f"{year:04d}-{month:02d}")
+            return
+
+        def progress(year, month, moved):
+            self.stdout.write(f"{year:04d}-{month:02d}: {moved} events archived")
+
+        stats = archive.archive(options["retention_months"], progress=progress, compact_table=not options["no_compact"])
+        self.stdout.write(self.style.SUCCESS(f"Done: {stats['events']} events from {stats['months']} months."))
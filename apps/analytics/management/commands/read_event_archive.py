@@ -0,0 +1,27 @@
+import json
+
+from django.core.management import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from apps.analytics.archive import read_archive
+
+
+class Command(BaseCommand):
+    help = "Print archived events between two dates (inclusive) as JSON lines."
+
+    def add_arguments(self, parser):
+        parser.add_argument("start", help="YYYY-MM-DD")
+        parser.add_argument("end", help="YYYY-MM-DD")
+        parser.add_argument("--name", default=None, help="Only this event name")
+        parser.add_argument("--count", action="store_true", help="Print only the number of events")
+
+    def handle(self, *args, **options):
+        start, end = parse_date(options["start"]), parse_date(options["end"])
+        if not start or not end:
+            raise CommandError("Dates must be YYYY-MM-DD.")
+        rows = read_archive(start, end, name=options["name"])
+        if options["count"]:
+            self.stdout.write(str(sum(1 for _ in rows)))
+            return
+        for row in rows:
+            self.stdout.write(json.dumps(row, default=str))
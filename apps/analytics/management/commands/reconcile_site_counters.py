@@ -0,0 +1,13 @@
+from django.core.management import BaseCommand
+
+from apps.analytics.counters import reconcile
+
+
+class Command(BaseCommand):
+    help = "Recompute the home page site counters and fix any drift."
+
+    def handle(self, *args, **options):
+        drift = reconcile()
+        for key, (stored, actual) in sorted(drift.items()):
+            self.stdout.write(f"{key}: {stored} -> {actual}")
+        self.stdout.write(self.style.SUCCESS(f"Done: {len(drift)} counters corrected."))
@@ -0,0 +1,17 @@
+from django.core.management import BaseCommand
+
+from apps.analytics.buffer import SPOOL_DIR, reap_ledgers, replay_spool
+
+
+class Command(BaseCommand):
+    help = "Load analytics events spooled to disk after failed flushes and report events lost on crashes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dir", default=str(SPOOL_DIR), help="Spool directory")
+
+    def handle(self, *args, **options):
+        lost = reap_ledgers(options["dir"])
+        if lost:
+            self.stdout.write(self.style.WARNING(f"{lost} events were lost by buffers of crashed processes."))
+        stats = replay_spool(options["dir"])
+        self.stdout.write(self.style.SUCCESS(f"Done: {stats['events']} events from {stats['files']} files."))
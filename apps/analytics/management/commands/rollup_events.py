@@ -0,0 +1,20 @@
+from django.core.management import BaseCommand
+
+from apps.analytics import rollups
+
+
+class Command(BaseCommand):
+    help = "Fold analytics events above the watermark into the daily rollup tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=rollups.BATCH_SIZE, help="Event ids per transaction")
+        parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches")
+
+    def handle(self, *args, **options):
+        def progress(stats):
+            self.stdout.write(f"batch {stats['batches']}: {stats['events']} events, up to id {stats['last_event_id']}")
+
+        stats = rollups.run(options["batch_size"], options["max_batches"], progress=progress)
+        self.stdout.write(self.style.SUCCESS(
+            f"Done: {stats['events']} events in {stats['batches']} batches, watermark {stats['last_event_id']}."
+        ))
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0003_event_created_at_default'),
+        ('companies', '0001_initial'),
+        ('jobs', '0012_saved_searches'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True)),
+                ('last_event_id', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='EventDailyCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64)),
+                ('day', models.DateField()),
+                ('count', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('name', 'day'), name='event_daily_count_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='CompanyDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('applies', models.PositiveIntegerField(default=0)),
+                ('jobs_posted', models.PositiveIntegerField(default=0)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='companies.company')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('company', 'day'), name='company_daily_stat_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='JobDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('applies', models.PositiveIntegerField(default=0)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='jobs.job')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('job', 'day'), name='job_daily_stat_uniq')],
+            },
+        ),
+    ]
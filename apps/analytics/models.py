@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 class Event(models.Model):
     name = models.CharField(max_length=64, db_index=True)
@@ -9,10 +10,79 @@ class Event(models.Model):
     user_agent = models.TextField(blank=True)
     request_id = models.CharField(max_length=64, blank=True, db_index=True)
     properties = models.JSONField(default=dict, blank=True)
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Set when the event happens, not when the buffered insert runs
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
 
     class Meta:
         ordering = ["-created_at"]
 
     def __str__(self):
         return f"{self.name} ({self.created_at:%Y-%m-%d %H:%M})"
+
+
+class SiteCounter(models.Model):
+    """
+    Materialized site-wide totals for the home page (active jobs, companies,
+    applications per month), maintained by apps.analytics.signals.
+    """
+    key = models.CharField(max_length=64, unique=True)
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.key}={self.value}"
+
+
+class JobDailyStat(models.Model):
+    """Per job and day view/apply totals, maintained by apps.analytics.rollups."""
+    job = models.ForeignKey("jobs.Job", on_delete=models.CASCADE, related_name="daily_stats")
+    day = models.DateField()
+    views = models.PositiveIntegerField(default=0)
+    applies = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["job", "day"], name="job_daily_stat_uniq")]
+
+    def __str__(self):
+        return f"job {self.job_id} {self.day}: {self.views}/{self.applies}"
+
+
+class CompanyDailyStat(models.Model):
+    company = models.ForeignKey("companies.Company", on_delete=models.CASCADE, related_name="daily_stats")
+    day = models.DateField()
+    views = models.PositiveIntegerField(default=0)
+    applies = models.PositiveIntegerField(default=0)
+    jobs_posted = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["company", "day"], name="company_daily_stat_uniq")]
+
+    def __str__(self):
+        return f"company {self.company_id} {self.day}: {self.views}/{self.applies}"
+
+
+class EventDailyCount(models.Model):
+    name = models.CharField(max_length=64)
+    day = models.DateField()
+    count = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["name", "day"], name="event_daily_count_uniq")]
+
+    def __str__(self):
+        return f"{self.name} {self.day}: {self.count}"
+
+
+class RollupWatermark(models.Model):
+    """Highest Event id already folded into the rollups."""
+    name = models.CharField(max_length=64, unique=True)
+    last_event_id = models.BigIntegerField(default=0)
+    # Ids up to safe_event_id are committed; horizon_event_id was the max id
+    # at horizon_at and becomes safe once it is old enough (see rollups.run)
+    safe_event_id = models.BigIntegerField(default=0)
+    horizon_event_id = models.BigIntegerField(default=0)
+    horizon_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name}@{self.last_event_id}"
@@ -0,0 +1,181 @@
+"""
+Incremental daily rollups of analytics events.
+
+`run()` folds raw Event rows into three small tables: per job/day
+(JobDailyStat), per company/day (CompanyDailyStat) and per event name/day
+(EventDailyCount). It only reads events above the RollupWatermark id, one id
+range at a time; each range is aggregated in the database (GROUP BY name,
+day, job) and added to the rollups in the same transaction that advances the
+watermark, so a crashed run never double-counts.
+
+Watermarking on id rather than created_at also picks up events that arrive
+late (buffered, replayed from the spool): they are added to the day they
+happened. Ids are handed out before commit, so with several processes
+flushing at once a lower id can become visible after a higher one; a run
+therefore only folds up to an id that was already the maximum SETTLE_SECONDS
+ago (the horizon), by which time the inserts holding lower ids have committed. Dashboards read the rollups only, so a report costs one indexed
+range scan of at most `days` rows whatever the size of the event table.
+"""
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.jobs.models import Job
+from .models import CompanyDailyStat, Event, EventDailyCount, JobDailyStat, RollupWatermark
+
+WATERMARK = "events"
+BATCH_SIZE = 50000
+SETTLE_SECONDS = getattr(settings, "ANALYTICS_ROLLUP_SETTLE_SECONDS", 60)
+MAX_DAYS = 365
+
+# Event name -> rollup field it feeds (the event carries properties.job_id)
+JOB_EVENTS = {"job_view": "views", "job_apply": "applies"}
+COMPANY_EVENTS = {**JOB_EVENTS, "job_posted": "jobs_posted"}
+
+
+def _job_id(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _add(model, key_field: str, increments: Dict[tuple, Dict[str, int]]) -> None:
+    """Add `increments` ({(key, day): {field: n}}) to `model`, creating missing rows."""
+    if not increments:
+        return
+    existing = {
+        (getattr(row, key_field), row.day): row
+        for row in model.objects.select_for_update().filter(
+            **{f"{key_field}__in": {k for k, _ in increments}, "day__in": {d for _, d in increments}}
+        )
+    }
+    fields = sorted({f for counts in increments.values() for f in counts})
+    created, updated = [], []
+    for (key, day), counts in increments.items():
+        row = existing.get((key, day))
+        if row is None:
+            row = model(**{key_field: key, "day": day})
+            created.append(row)
+        else:
+            updated.append(row)
+        for field, n in counts.items():
+            setattr(row, field, getattr(row, field) + n)
+    model.objects.bulk_create(created, batch_size=1000)
+    if updated:
+        model.objects.bulk_update(updated, fields, batch_size=1000)
+
+
+def _fold(low: int, high: int) -> int:
+    """Roll up events with low < id <= high; returns how many were read."""
+    events = Event.objects.filter(id__gt=low, id__lte=high).annotate(day=TruncDate("created_at")).order_by()
+
+    by_name = {}
+    total = 0
+    for row in events.values("name", "day").annotate(n=Count("id")):
+        by_name[(row["name"], row["day"])] = {"count": row["n"]}
+        total += row["n"]
+
+    per_job = []
+    for row in (
+        events.filter(name__in=list(COMPANY_EVENTS))
+        .values("name", "day", "properties__job_id").annotate(n=Count("id"))
+    ):
+        job_id = _job_id(row["properties__job_id"])
+        if job_id is not None:
+            per_job.append((row["name"], row["day"], job_id, row["n"]))
+
+    # Events of deleted jobs only count towards the per-name totals
+    companies = dict(Job.objects.filter(id__in={r[2] for r in per_job}).values_list("id", "company_id"))
+    by_job: Dict[tuple, Dict[str, int]] = {}
+    by_company: Dict[tuple, Dict[str, int]] = {}
+    for name, day, job_id, n in per_job:
+        if job_id not in companies:
+            continue
+        if name in JOB_EVENTS:
+            counts = by_job.setdefault((job_id, day), {})
+            counts[JOB_EVENTS[name]] = counts.get(JOB_EVENTS[name], 0) + n
+        counts = by_company.setdefault((companies[job_id], day), {})
+        counts[COMPANY_EVENTS[name]] = counts.get(COMPANY_EVENTS[name], 0) + n
+
+    _add(EventDailyCount, "name", by_name)
+    _add(JobDailyStat, "job_id", by_job)
+    _add(CompanyDailyStat, "company_id", by_company)
+    return total
+
+
+def _safe_target(settle_seconds: int) -> int:
+    """Highest event id known to have no uncommitted ids below it."""
+    current = Event.objects.aggregate(m=Max("id"))["m"] or 0
+    if settle_seconds <= 0:
+        return current
+    now = timezone.now()
+    with transaction.atomic():
+        watermark, _ = RollupWatermark.objects.select_for_update().get_or_create(name=WATERMARK)
+        if watermark.horizon_at is not None and watermark.horizon_at <= now - timedelta(seconds=settle_seconds):
+            watermark.safe_event_id = max(watermark.safe_event_id, watermark.horizon_event_id)
+            watermark.horizon_at = None
+        if watermark.horizon_at is None and current > watermark.safe_event_id:
+            watermark.horizon_event_id, watermark.horizon_at = current, now
+        watermark.save(update_fields=["safe_event_id", "horizon_event_id", "horizon_at", "updated_at"])
+        return watermark.safe_event_id
+
+
+def run(batch_size: Optional[int] = None, max_batches: Optional[int] = None, progress=None,
+        settle_seconds: Optional[int] = None) -> dict:
+    """
+    Fold every settled event above the watermark into the rollups, `batch_size`
+    ids per transaction. Returns {"batches", "events", "last_event_id"}.
+    """
+    batch_size = batch_size or BATCH_SIZE
+    stats = {"batches": 0, "events": 0, "last_event_id": 0}
+    target = _safe_target(SETTLE_SECONDS if settle_seconds is None else settle_seconds)
+    while max_batches is None or stats["batches"] < max_batches:
+        with transaction.atomic():
+            watermark, _ = RollupWatermark.objects.select_for_update().get_or_create(name=WATERMARK)
+            low = watermark.last_event_id
+            stats["last_event_id"] = low
+            if low >= target:
+                break
+            high = min(low + batch_size, target)
+            stats["events"] += _fold(low, high)
+            watermark.last_event_id = high
+            watermark.save(update_fields=["last_event_id", "updated_at"])
+        stats["batches"] += 1
+        stats["last_event_id"] = high
+        if progress:
+            progress(dict(stats))
+    return stats
+
+
+def date_range(days: int, end: Optional[date] = None) -> Tuple[date, date]:
+    days = max(1, min(days, MAX_DAYS))
+    end = end or timezone.localdate()
+    return end - timedelta(days=days - 1), end
+
+
+def series(queryset, start: date, end: date, fields: Iterable[str]) -> List[dict]:
+    """Daily rows between start and end (inclusive), with zeros for missing days."""
+    fields = list(fields)
+    rows = {
+        row["day"]: row
+        for row in queryset.filter(day__gte=start, day__lte=end).values("day").annotate(**{f"total_{f}": Sum(f) for f in fields})
+    }
+    out = []
+    day = start
+    while day <= end:
+        row = rows.get(day, {})
+        out.append({"day": day.isoformat(), **{f: row.get(f"total_{f}") or 0 for f in fields}})
+        day += timedelta(days=1)
+    return out
+
+
+def summarize(points: List[dict]) -> dict:
+    views = sum(p["views"] for p in points)
+    applies = sum(p["applies"] for p in points)
+    return {"views": views, "applies": applies, "conversion": round(applies / views, 4) if views else 0.0}
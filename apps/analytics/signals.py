@@ -0,0 +1,67 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.applications.models import Application
+from apps.companies.models import Company
+from apps.jobs.bulk import jobs_bulk_changed
+from apps.jobs.models import Job
+from . import counters
+
+
+def _is_public(is_active, moderation_status) -> bool:
+    return bool(is_active) and moderation_status == Job.MOD_APPROVED
+
+
+@receiver(pre_save, sender=Job)
+def remember_job_visibility(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    old = None
+    if instance.pk:
+        old = Job.objects.filter(pk=instance.pk).values_list("is_active", "moderation_status").first()
+    instance._was_public = _is_public(*old) if old else False
+
+
+@receiver(post_save, sender=Job)
+def count_job_visibility(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    now_public = _is_public(instance.is_active, instance.moderation_status)
+    counters.increment(counters.JOBS_ACTIVE, int(now_public) - int(getattr(instance, "_was_public", False)))
+
+
+@receiver(post_delete, sender=Job)
+def count_job_deleted(sender, instance, **kwargs):
+    if _is_public(instance.is_active, instance.moderation_status):
+        counters.increment(counters.JOBS_ACTIVE, -1)
+
+
+@receiver(jobs_bulk_changed)
+def count_jobs_bulk(sender, job_ids, reason, public_delta=None, **kwargs):
+    # Senders report how many rows changed visibility; recount only if one can't
+    if public_delta is None:
+        counters.set_value(counters.JOBS_ACTIVE, counters.compute(counters.JOBS_ACTIVE))
+    else:
+        counters.increment(counters.JOBS_ACTIVE, public_delta)
+
+
+@receiver(post_save, sender=Company)
+def count_company_created(sender, instance, raw=False, created=False, **kwargs):
+    if created and not raw:
+        counters.increment(counters.COMPANIES, 1)
+
+
+@receiver(post_delete, sender=Company)
+def count_company_deleted(sender, instance, **kwargs):
+    counters.increment(counters.COMPANIES, -1)
+
+
+@receiver(post_save, sender=Application)
+def count_application_created(sender, instance, raw=False, created=False, **kwargs):
+    if created and not raw:
+        counters.increment(counters.applications_month_key(instance.created_at), 1)
+
+
+@receiver(post_delete, sender=Application)
+def count_application_deleted(sender, instance, **kwargs):
+    counters.increment(counters.applications_month_key(instance.created_at), -1)
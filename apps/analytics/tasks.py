@@ -0,0 +1,18 @@
+from celery import shared_task
+
+from apps.analytics import archive, counters, rollups
+
+
+@shared_task
+def reconcile_site_counters():
+    return {key: list(values) for key, values in counters.reconcile().items()}
+
+
+@shared_task
+def rollup_events():
+    return rollups.run()
+
+
+@shared_task
+def archive_events():
+    return archive.archive()
@@ -0,0 +1,9 @@
+from django.urls import path
+from . import views
+
+app_name = "analytics"
+
+urlpatterns = [
+    path("api/jobs/<int:job_id>/", views.job_stats, name="job_stats"),
+    path("api/companies/<int:company_id>/", views.company_stats, name="company_stats"),
+]
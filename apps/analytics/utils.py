@@ -1,6 +1,9 @@
 import logging
 from typing import Any, Dict
-from .models import Event
+
+from django.utils import timezone
+
+from . import buffer
 
 logger = logging.getLogger("analytics")
 
@@ -14,15 +17,18 @@ def log_event(request, name: str, properties: Dict[str, Any] | None = None):
     props = properties or {}
     rid = getattr(request, "request_id", "") or request.META.get("HTTP_X_REQUEST_ID", "")
     ua = request.META.get("HTTP_USER_AGENT", "")
-    Event.objects.create(
-        name=name,
-        user=request.user if getattr(request, "user", None) and request.user.is_authenticated else None,
-        path=getattr(request, "path", "") or "",
-        ip=_get_client_ip(request),
-        user_agent=ua,
-        request_id=rid,
-        properties=props,
-    )
+    user = getattr(request, "user", None)
+    # Queued for a batched insert (see apps.analytics.buffer), not written here
+    buffer.record({
+        "name": name,
+        "user_id": user.id if user is not None and user.is_authenticated else None,
+        "path": getattr(request, "path", "") or "",
+        "ip": _get_client_ip(request),
+        "user_agent": ua,
+        "request_id": rid,
+        "properties": props,
+        "created_at": timezone.now(),
+    })
     logger.info(
         "event name=%s request_id=%s path=%s user=%s",
         name,
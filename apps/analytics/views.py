@@ -0,0 +1,55 @@
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from apps.companies.models import Company
+from apps.jobs.models import Job
+from . import rollups
+from .models import CompanyDailyStat, JobDailyStat, RollupWatermark
+
+DEFAULT_DAYS = 30
+
+
+def _days(request) -> int:
+    try:
+        return int(request.GET.get("days") or DEFAULT_DAYS)
+    except ValueError:
+        return DEFAULT_DAYS
+
+
+def _report(request, queryset, fields, **extra) -> JsonResponse:
+    start, end = rollups.date_range(_days(request))
+    points = rollups.series(queryset, start, end, fields)
+    watermark = RollupWatermark.objects.filter(name=rollups.WATERMARK).values_list("updated_at", flat=True).first()
+    return JsonResponse({
+        "ok": True,
+        **extra,
+        "from": start.isoformat(),
+        "to": end.isoformat(),
+        "totals": rollups.summarize(points),
+        "days": points,
+        "updated_at": watermark.isoformat() if watermark else None,
+    })
+
+
+@login_required
+@require_GET
+def job_stats(request, job_id: int):
+    """Daily views/applies of one of the employer's jobs (?days=N, default 30)."""
+    job = Job.objects.filter(id=job_id, company__owner=request.user).only("id").first()
+    if job is None:
+        return JsonResponse({"ok": False, "error": "not_found"}, status=404)
+    return _report(request, JobDailyStat.objects.filter(job_id=job.id), ("views", "applies"), job_id=job.id)
+
+
+@login_required
+@require_GET
+def company_stats(request, company_id: int):
+    """Daily views/applies/jobs posted across one of the employer's companies."""
+    company = Company.objects.filter(id=company_id, owner=request.user).only("id").first()
+    if company is None:
+        return JsonResponse({"ok": False, "error": "not_found"}, status=404)
+    return _report(
+        request, CompanyDailyStat.objects.filter(company_id=company.id),
+        ("views", "applies", "jobs_posted"), company_id=company.id,
+    )
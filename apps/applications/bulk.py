@@ -0,0 +1,60 @@
+"""
+Status changes for many applications at once (employer inbox triage).
+
+`change_statuses()` reads the requested rows of one company in a single
+locked query (which is also the ownership check), then issues one UPDATE per
+target status and adjusts the status counters with the summed deltas, all in
+one transaction. QuerySet.update() bypasses the model signals, so the
+counters are kept here instead of in apps/applications/signals.py.
+"""
+from collections import Counter, defaultdict
+from typing import Dict, Optional
+
+from django.db import transaction
+
+from . import counters, exports
+from .models import Application
+
+MAX_ITEMS = 1000
+
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+NOT_FOUND = "not_found"
+
+
+def change_statuses(company_id: int, changes: Dict[int, str]) -> Dict[int, str]:
+    """Apply {application_id: status}; returns {application_id: UPDATED | UNCHANGED | NOT_FOUND}."""
+    results = {app_id: NOT_FOUND for app_id in changes}
+    with transaction.atomic():
+        # Applications of other companies are simply not found
+        rows = (
+            Application.objects.select_for_update()
+            .filter(company_id=company_id, id__in=list(changes))
+            .values_list("id", "job_id", "status")
+        )
+        by_status = defaultdict(list)
+        deltas = Counter()
+        for app_id, job_id, old in rows:
+            new = changes[app_id]
+            if old == new:
+                results[app_id] = UNCHANGED
+                continue
+            results[app_id] = UPDATED
+            by_status[new].append(app_id)
+            deltas[(company_id, job_id, old)] -= 1
+            deltas[(company_id, job_id, new)] += 1
+        for status, ids in by_status.items():
+            Application.objects.filter(id__in=ids).update(status=status)
+        counters.apply_deltas(deltas)
+    return results
+
+
+def matching(company_id: int, target: str, status: str = "", job_id: Optional[int] = None) -> Optional[Dict[int, str]]:
+    """{id: target} for the inbox filter's applications not yet in `target`; None above MAX_ITEMS."""
+    ids = list(
+        exports.filter_applications(company_id, status, job_id)
+        .exclude(status=target).order_by("-id").values_list("id", flat=True)[:MAX_ITEMS + 1]
+    )
+    if len(ids) > MAX_ITEMS:
+        return None
+    return {app_id: target for app_id in ids}
@@ -0,0 +1,121 @@
+"""
+Application counts per status for the employer inbox tabs.
+
+ApplicationStatusCounter keeps one row per (company, job, status) plus a
+company-wide row (job=None) per status, so a tab badge is a read of at most
+len(STATUS_CHOICES) rows. Saves and deletes adjust the rows with F() updates
+from apps/applications/signals.py, inside the caller's transaction; the views
+wrap status changes in transaction.atomic so a status and its counters
+change together. `reconcile()` recomputes rows from the applications table.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+
+from .models import Application, ApplicationStatusCounter
+
+Key = Tuple[int, Optional[int], str]
+
+RECONCILE_CHUNK_SIZE = 500
+
+
+def _counter_rows(company_id: int, job_id: Optional[int], status: str):
+    # job=None must be an explicit isnull filter to hit the company-wide row
+    rows = ApplicationStatusCounter.objects.filter(company_id=company_id, status=status)
+    return rows.filter(job_id=job_id) if job_id else rows.filter(job__isnull=True)
+
+
+def compute(company_id: int, job_id: Optional[int], status: str) -> int:
+    apps = Application.objects.filter(company_id=company_id, status=status)
+    return (apps.filter(job_id=job_id) if job_id else apps).count()
+
+
+def _seed(company_id: int, job_id: Optional[int], status: str, delta: int) -> None:
+    # First touch of a row: start from the source of truth, which already
+    # includes the change being counted
+    try:
+        with transaction.atomic():
+            ApplicationStatusCounter.objects.create(
+                company_id=company_id, job_id=job_id, status=status, count=compute(company_id, job_id, status)
+            )
+    except IntegrityError:
+        # Created concurrently without our (uncommitted) row: count it now
+        _counter_rows(company_id, job_id, status).update(count=F("count") + delta)
+
+
+def apply_deltas(deltas: Dict[Key, int]) -> None:
+    """Add {(company_id, job_id, status): delta} to the job rows and the company-wide rows."""
+    merged: Dict[Key, int] = defaultdict(int)
+    for (company_id, job_id, status), delta in deltas.items():
+        merged[(company_id, job_id, status)] += delta
+        merged[(company_id, None, status)] += delta
+    for (company_id, job_id, status), delta in merged.items():
+        if not delta:
+            continue
+        if _counter_rows(company_id, job_id, status).update(count=F("count") + delta):
+            continue
+        if delta > 0:
+            _seed(company_id, job_id, status, delta)
+        # A missing row on a decrement (job being deleted) is left to reconcile()
+
+
+def status_counts(company_id: int, job_id: Optional[int] = None) -> Dict[str, int]:
+    """{status: count} for the company, or one of its jobs; statuses without rows are 0."""
+    rows = ApplicationStatusCounter.objects.filter(company_id=company_id)
+    rows = rows.filter(job_id=job_id) if job_id else rows.filter(job__isnull=True)
+    counts = {code: 0 for code, _ in Application.STATUS_CHOICES}
+    counts.update(rows.values_list("status", "count"))
+    return counts
+
+
+def job_status_counts(job_ids: Iterable[int]) -> Dict[int, Dict[str, int]]:
+    """{job_id: {status: count}} for several jobs in one query (dashboard)."""
+    job_ids = list(job_ids)
+    counts = {job_id: {code: 0 for code, _ in Application.STATUS_CHOICES} for job_id in job_ids}
+    for job_id, status, n in ApplicationStatusCounter.objects.filter(job_id__in=job_ids).values_list("job_id", "status", "count"):
+        counts[job_id][status] = n
+    return counts
+
+
+def _actual(company_ids) -> Dict[Key, int]:
+    actual: Dict[Key, int] = defaultdict(int)
+    rows = (
+        Application.objects.filter(company_id__in=company_ids)
+        .order_by().values("company_id", "job_id", "status").annotate(n=Count("id"))
+    )
+    for row in rows:
+        actual[(row["company_id"], row["job_id"], row["status"])] += row["n"]
+        actual[(row["company_id"], None, row["status"])] += row["n"]
+    return actual
+
+
+def reconcile(company_ids: Optional[Iterable[int]] = None) -> int:
+    """Rewrite the counters of `company_ids` (default: all companies); returns rows corrected."""
+    from apps.companies.models import Company
+
+    if company_ids is None:
+        company_ids = Company.objects.order_by("id").values_list("id", flat=True)
+    company_ids = list(company_ids)
+    corrected = 0
+    for start in range(0, len(company_ids), RECONCILE_CHUNK_SIZE):
+        chunk = company_ids[start:start + RECONCILE_CHUNK_SIZE]
+        with transaction.atomic():
+            actual = _actual(chunk)
+            stored = {
+                (row.company_id, row.job_id, row.status): row
+                for row in ApplicationStatusCounter.objects.select_for_update().filter(company_id__in=chunk)
+            }
+            changed, created = [], []
+            for key, row in stored.items():
+                value = actual.pop(key, 0)
+                if row.count != value:
+                    row.count = value
+                    changed.append(row)
+            for (company_id, job_id, status), value in actual.items():
+                created.append(ApplicationStatusCounter(company_id=company_id, job_id=job_id, status=status, count=value))
+            ApplicationStatusCounter.objects.bulk_update(changed, ["count"], batch_size=1000)
+            ApplicationStatusCounter.objects.bulk_create(created, batch_size=1000)
+            corrected += len(changed) + len(created)
+    return corrected
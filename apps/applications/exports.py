@@ -0,0 +1,146 @@
+"""
+CSV exports of a company's applications.
+
+Rows come from a values_list projection (no model instances) read in keyset
+chunks on id, newest first, so memory stays flat whatever the size:
+
+- up to EXPORT_SYNC_LIMIT rows are streamed straight to the browser
+  (StreamingHttpResponse, one yield per chunk);
+- larger exports become an ApplicationExport job: a worker writes the same
+  CSV gzip-compressed to private storage (APPLICATION_EXPORT_ROOT, uuid
+  file names, no public URL) and emails the requester a link to the
+  download view, the only way to fetch it.
+
+The row count used to pick the path comes from the status counters, so the
+decision itself costs one small read.
+"""
+import csv
+import gzip
+import os
+import tempfile
+from datetime import timedelta
+from typing import Dict, Iterator, Optional
+
+from django.conf import settings
+from django.core.files import File
+from django.core.mail import EmailMessage
+from django.urls import reverse
+from django.utils import timezone
+
+from . import counters
+from .models import Application, ApplicationExport
+
+EXPORT_SYNC_LIMIT = getattr(settings, "APPLICATION_EXPORT_SYNC_LIMIT", 50000)
+CHUNK_SIZE = 2000
+EXPORT_TTL = timedelta(days=7)
+HEADER = ["Job", "Candidat", "Email", "Trimis", "Status"]
+COLUMNS = ("id", "job__title", "seeker__username", "seeker__email", "created_at", "status")
+STATUS_LABELS = dict(Application.STATUS_CHOICES)
+
+
+def filter_applications(company_id: int, status: str = "", job_id: Optional[int] = None):
+    qs = Application.objects.filter(company_id=company_id)
+    if status:
+        qs = qs.filter(status=status)
+    if job_id:
+        qs = qs.filter(job_id=job_id)
+    return qs
+
+
+def estimated_rows(company_id: int, status: str = "", job_id: Optional[int] = None) -> int:
+    counts = counters.status_counts(company_id, job_id)
+    return counts.get(status, 0) if status else sum(counts.values())
+
+
+class _Line:
+    """File-like sink that hands back what csv.writer writes."""
+
+    def write(self, value):
+        return value
+
+
+def csv_chunks(queryset, label_map: Dict[str, str], chunk_size: Optional[int] = None,
+               stats: Optional[dict] = None) -> Iterator[str]:
+    """The CSV as text, one string per chunk of rows (header first); counts rows into stats["rows"]."""
+    chunk_size = chunk_size or CHUNK_SIZE
+    writer = csv.writer(_Line())
+    yield writer.writerow(HEADER)
+    tz = timezone.get_current_timezone()
+    rows = queryset.order_by("-id").values_list(*COLUMNS)
+    last_id = None
+    while True:
+        batch = list((rows.filter(id__lt=last_id) if last_id else rows)[:chunk_size])
+        if not batch:
+            return
+        yield "".join(
+            writer.writerow([title or "", username or "", email or "",
+                             f"{created.astimezone(tz):%Y-%m-%d %H:%M}" if created else "",
+                             label_map.get(status, status)])
+            for _, title, username, email, created, status in batch
+        )
+        if stats is not None:
+            stats["rows"] = stats.get("rows", 0) + len(batch)
+        last_id = batch[-1][0]
+
+
+def run_export(export_id: int) -> Optional[ApplicationExport]:
+    """Write the export to storage as .csv.gz and email the requester; returns the export."""
+    export = ApplicationExport.objects.select_related("requested_by", "company").filter(
+        id=export_id, status=ApplicationExport.STATUS_PENDING
+    ).first()
+    if export is None:
+        return None
+    export.status = ApplicationExport.STATUS_RUNNING
+    export.save(update_fields=["status"])
+    queryset = filter_applications(export.company_id, export.filters.get("status", ""), export.filters.get("job"))
+    stats = {"rows": 0}
+    # Spooled through a temp file: storage backends want a complete file
+    fd, path = tempfile.mkstemp(suffix=".csv.gz")
+    try:
+        with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8", newline="") as out:
+            for chunk in csv_chunks(queryset, STATUS_LABELS, stats=stats):
+                out.write(chunk)
+        with open(path, "rb") as src:
+            export.file.save("export.csv.gz", File(src), save=False)
+        export.status = ApplicationExport.STATUS_DONE
+    except Exception:
+        export.status = ApplicationExport.STATUS_FAILED
+        raise
+    finally:
+        os.unlink(path)
+        export.row_count = stats["rows"]
+        export.finished_at = timezone.now()
+        export.save(update_fields=["status", "file", "row_count", "finished_at"])
+    notify_ready(export)
+    return export
+
+
+def download_name(export: ApplicationExport) -> str:
+    return f"aplicatii-{export.company.slug}-{export.created_at:%Y%m%d}.csv.gz"
+
+
+def notify_ready(export: ApplicationExport) -> None:
+    user = export.requested_by
+    if not user.email:
+        return
+    url = settings.SITE_URL.rstrip("/") + reverse("applications:export_download", kwargs={"pk": export.pk})
+    EmailMessage(
+        subject=f"[Export aplicații] {export.row_count} rânduri pentru {export.company.name}",
+        body=(
+            f"Bună {user.username},\n\nExportul cerut este gata ({export.row_count} aplicații).\n"
+            f"Descarcă fișierul (disponibil {EXPORT_TTL.days} zile): {url}\n\nEchipa JobBoard\n"
+        ),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+    ).send(fail_silently=True)
+
+
+def purge_expired(now=None) -> int:
+    """Delete exports (and their files) older than EXPORT_TTL."""
+    cutoff = (now or timezone.now()) - EXPORT_TTL
+    expired = list(ApplicationExport.objects.filter(created_at__lt=cutoff))
+    for export in expired:
+        if export.file:
+            export.file.delete(save=False)
+    ApplicationExport.objects.filter(id__in=[e.id for e in expired]).delete()
+    return len(expired)
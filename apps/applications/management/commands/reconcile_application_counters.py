@@ -0,0 +1,14 @@
+from django.core.management import BaseCommand
+
+from apps.applications.counters import reconcile
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-status application counters behind the inbox tabs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--company", type=int, action="append", help="Only this company id (repeatable)")
+
+    def handle(self, *args, **options):
+        corrected = reconcile(options["company"])
+        self.stdout.write(self.style.SUCCESS(f"Done: {corrected} counter rows corrected."))
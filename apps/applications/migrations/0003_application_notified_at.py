@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def mark_existing_notified(apps, schema_editor):
+    # Applications from before the digest are not mailed retroactively
+    Application = apps.get_model("applications", "Application")
+    Application.objects.update(notified_at=models.F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0002_applicationanswer'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='notified_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Angajator notificat la'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(condition=models.Q(('notified_at__isnull', True)), fields=['job'], name='application_notify_idx'),
+        ),
+        migrations.RunPython(mark_existing_notified, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0003_application_notified_at'),
+        ('companies', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Nullable first; filled by 0005 and made NOT NULL by 0006, each in its
+        # own transaction (Postgres can't ALTER a table with deferred FK checks pending)
+        migrations.AddField(
+            model_name='application',
+            name='company',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='applications', to='companies.company', verbose_name='Companie'),
+        ),
+    ]
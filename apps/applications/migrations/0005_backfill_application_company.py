@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:43
+
+from django.db import migrations, models
+
+
+def copy_job_company(apps, schema_editor):
+    Application = apps.get_model("applications", "Application")
+    Job = apps.get_model("jobs", "Job")
+    Application.objects.filter(company__isnull=True).update(
+        company_id=models.Subquery(Job.objects.filter(pk=models.OuterRef("job_id")).values("company_id")[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0004_application_company'),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_job_company, migrations.RunPython.noop),
+    ]
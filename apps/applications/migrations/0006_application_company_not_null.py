@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0005_backfill_application_company'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='application',
+            name='company',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='applications', to='companies.company', verbose_name='Companie'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['company', 'status', '-id'], name='application_inbox_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['company', 'job', '-id'], name='application_inbox_job_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def fill_counters(apps, schema_editor):
+    Application = apps.get_model("applications", "Application")
+    ApplicationStatusCounter = apps.get_model("applications", "ApplicationStatusCounter")
+    totals = {}
+    rows = Application.objects.order_by().values("company_id", "job_id", "status").annotate(n=models.Count("id"))
+    for row in rows:
+        for key in ((row["company_id"], row["job_id"], row["status"]), (row["company_id"], None, row["status"])):
+            totals[key] = totals.get(key, 0) + row["n"]
+    ApplicationStatusCounter.objects.bulk_create(
+        [ApplicationStatusCounter(company_id=c, job_id=j, status=s, count=n) for (c, j, s), n in totals.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0006_application_company_not_null'),
+        ('companies', '0001_initial'),
+        ('jobs', '0012_saved_searches'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationStatusCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='companies.company')),
+                ('job', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='jobs.job')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(condition=models.Q(('job__isnull', False)), fields=('company', 'job', 'status'), name='application_counter_job_uniq'), models.UniqueConstraint(condition=models.Q(('job__isnull', True)), fields=('company', 'status'), name='application_counter_company_uniq')],
+            },
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:04
+
+import apps.applications.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0008_application_export'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='applicationexport',
+            name='file',
+            field=models.FileField(blank=True, storage=apps.applications.models.PrivateExportStorage(), upload_to=apps.applications.models.export_upload_to),
+        ),
+    ]
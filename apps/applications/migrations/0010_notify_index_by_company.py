@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0009_private_export_storage'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='application',
+            name='application_notify_idx',
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(condition=models.Q(('notified_at__isnull', True)), fields=['company', 'created_at'], name='application_notify_idx'),
+        ),
+    ]
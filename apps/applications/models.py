@@ -1,4 +1,8 @@
+import os
+import uuid
+
 from django.conf import settings
+from django.core.files.storage import FileSystemStorage
 from django.db import models
 
 
@@ -17,6 +21,13 @@ class Application(models.Model):
         related_name="applications",
         verbose_name="Job",
     )
+    # Copy of job.company for the employer inbox (set on save, synced when a job moves)
+    company = models.ForeignKey(
+        "companies.Company",
+        on_delete=models.CASCADE,
+        related_name="applications",
+        verbose_name="Companie",
+    )
     seeker = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -27,16 +38,30 @@ class Application(models.Model):
     cv = models.FileField(upload_to="cvs/%Y/%m/", blank=True, null=True, verbose_name="CV")
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="submitted", verbose_name="Stare")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Creat la")
+    # Set once the employer digest covering this application went out
+    notified_at = models.DateTimeField(null=True, blank=True, verbose_name="Angajator notificat la")
 
     class Meta:
         unique_together = (("job", "seeker"),)
         ordering = ["-created_at"]
+        indexes = [
+            # Applications awaiting the employer digest: per company, and by age for the sweep
+            models.Index(fields=["company", "created_at"], condition=models.Q(notified_at__isnull=True), name="application_notify_idx"),
+            # Employer inbox: newest first, filtered by status or job
+            models.Index(fields=["company", "status", "-id"], name="application_inbox_status_idx"),
+            models.Index(fields=["company", "job", "-id"], name="application_inbox_job_idx"),
+        ]
         verbose_name = "Aplicație"
         verbose_name_plural = "Aplicații"
 
     def __str__(self):
         return f"{self.seeker} → {self.job}"
 
+    def save(self, *args, **kwargs):
+        if self.job_id and not self.company_id:
+            self.company_id = self.job.company_id
+        super().save(*args, **kwargs)
+
     # Legacy aliases for templates (do not use in ORM filters)
     @property
     def user(self):
@@ -58,4 +83,86 @@ class ApplicationAnswer(models.Model):
         ordering = ["id"]
 
     def __str__(self):
-        return f"A{self.application_id}:Q{self.question_id}"
\ No newline at end of file
+        return f"A{self.application_id}:Q{self.question_id}"
+
+class ApplicationStatusCounter(models.Model):
+    """
+    Number of applications per (company, job, status) for the inbox tabs;
+    rows with job=None hold the company-wide totals. Maintained by
+    apps.applications.signals, see apps.applications.counters.
+    """
+    company = models.ForeignKey("companies.Company", on_delete=models.CASCADE, related_name="+")
+    job = models.ForeignKey("jobs.Job", on_delete=models.CASCADE, null=True, blank=True, related_name="+")
+    status = models.CharField(max_length=20)
+    # Signed on purpose: a drifted row must not make a decrement fail the save
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["company", "job", "status"], condition=models.Q(job__isnull=False),
+                name="application_counter_job_uniq",
+            ),
+            models.UniqueConstraint(
+                fields=["company", "status"], condition=models.Q(job__isnull=True),
+                name="application_counter_company_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.company_id}/{self.job_id or '*'}/{self.status}={self.count}"
+
+
+class PrivateExportStorage(FileSystemStorage):
+    """
+    Files under settings.APPLICATION_EXPORT_ROOT, outside MEDIA_ROOT: exports
+    hold applicant names and emails, so they have no public URL and are only
+    served by the export_download view after its ownership check.
+    """
+
+    @property
+    def base_location(self):
+        return settings.APPLICATION_EXPORT_ROOT
+
+    @property
+    def location(self):
+        return os.path.abspath(self.base_location)
+
+    @property
+    def base_url(self):
+        return None
+
+
+def export_upload_to(instance, filename):
+    # Unguessable: the name never reveals the company or a sequential id
+    return f"applications/{uuid.uuid4().hex}.csv.gz"
+
+
+class ApplicationExport(models.Model):
+    """A background CSV export of a company's applications (see apps.applications.exports)."""
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "În așteptare"),
+        (STATUS_RUNNING, "În lucru"),
+        (STATUS_DONE, "Gata"),
+        (STATUS_FAILED, "Eșuat"),
+    ]
+
+    company = models.ForeignKey("companies.Company", on_delete=models.CASCADE, related_name="+")
+    requested_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+")
+    # Same filters as the inbox: {"status": ..., "job": ...}
+    filters = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    file = models.FileField(upload_to=export_upload_to, storage=PrivateExportStorage(), blank=True)
+    row_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Export {self.pk} ({self.company_id}, {self.status})"
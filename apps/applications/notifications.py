@@ -0,0 +1,112 @@
+"""
+Employer notifications for new applications.
+
+Applications are not mailed one by one. The first application for a company
+takes a per-company lock in the cache (`cache.add`, so only one caller wins)
+and schedules a digest APPLICATION_NOTIFY_WINDOW seconds later; applications
+arriving meanwhile just wait with notified_at unset. The digest releases the
+lock first, claims every pending application of the company and sends the
+owner a single email, so a busy job produces one email per window instead of
+one per application.
+"""
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.template.loader import get_template
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.companies.models import Company
+from .models import Application
+
+NOTIFY_WINDOW = getattr(settings, "APPLICATION_NOTIFY_WINDOW", 10 * 60)
+MAX_PER_JOB = 20
+TEMPLATE_NAME = "emails/applications_digest.txt"
+
+
+@lru_cache(maxsize=1)
+def _template():
+    return get_template(TEMPLATE_NAME)
+
+
+def lock_key(company_id: int) -> str:
+    return f"applications:notify:{company_id}"
+
+
+def claim_window(company_id: int, window: Optional[int] = None) -> bool:
+    """True if the caller should schedule the company's next digest."""
+    window = window or NOTIFY_WINDOW
+    # Outlives the countdown so a busy worker does not lead to a second digest
+    return cache.add(lock_key(company_id), 1, window * 2)
+
+
+def release_window(company_id: int) -> None:
+    cache.delete(lock_key(company_id))
+
+
+def pending(company_id: int):
+    return Application.objects.filter(company_id=company_id, notified_at__isnull=True)
+
+
+def _claim_pending(company_id: int):
+    with transaction.atomic():
+        apps = list(
+            pending(company_id).select_for_update()
+            .select_related("job", "seeker")
+            .order_by("job_id", "created_at")
+        )
+        Application.objects.filter(id__in=[a.id for a in apps]).update(notified_at=timezone.now())
+    return apps
+
+
+def send_company_digest(company_id: int, connection=None) -> int:
+    """
+    Mail the company owner every application not yet notified, grouped by
+    job. Returns the number of applications covered.
+    """
+    # Released before reading: anything committed from now on schedules the next digest
+    release_window(company_id)
+    company = Company.objects.select_related("owner").filter(id=company_id).first()
+    if company is None:
+        return 0
+    apps = _claim_pending(company_id)
+    owner = company.owner
+    if not apps or not (owner.is_active and owner.email):
+        return len(apps)
+
+    by_job = OrderedDict()
+    for app in apps:
+        by_job.setdefault(app.job, []).append(app)
+    items = [(job, job_apps[:MAX_PER_JOB], len(job_apps) - MAX_PER_JOB) for job, job_apps in by_job.items()]
+    message = EmailMessage(
+        subject=f"[Aplicații noi] {len(apps)} aplicație(i) pentru {company.name}",
+        body=_template().render({
+            "user": owner,
+            "company": company,
+            "items": items,
+            "total": len(apps),
+            "inbox_url": settings.SITE_URL.rstrip("/") + reverse("applications:inbox"),
+        }),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[owner.email],
+    )
+    if connection is not None:
+        connection.send_messages([message])
+    else:
+        with get_connection(fail_silently=True) as connection:
+            connection.send_messages([message])
+    return len(apps)
+
+
+def send_due_digests(company_ids) -> int:
+    """Send several companies' digests over one reused mail connection."""
+    covered = 0
+    with get_connection(fail_silently=True) as connection:
+        for company_id in company_ids:
+            covered += send_company_digest(company_id, connection=connection)
+    return covered
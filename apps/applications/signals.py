@@ -0,0 +1,38 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import counters
+from .models import Application
+
+
+def _key(company_id, job_id, status):
+    return (company_id, job_id, status)
+
+
+@receiver(pre_save, sender=Application)
+def remember_counted_status(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    old = None
+    if instance.pk:
+        old = Application.objects.filter(pk=instance.pk).values_list("company_id", "job_id", "status").first()
+    instance._counted_as = _key(*old) if old else None
+
+
+@receiver(post_save, sender=Application)
+def count_application_status(sender, instance, raw=False, created=False, **kwargs):
+    if raw:
+        return
+    new = _key(instance.company_id, instance.job_id, instance.status)
+    old = None if created else getattr(instance, "_counted_as", None)
+    if old == new:
+        return
+    deltas = {new: 1}
+    if old:
+        deltas[old] = -1
+    counters.apply_deltas(deltas)
+
+
+@receiver(post_delete, sender=Application)
+def count_application_deleted(sender, instance, **kwargs):
+    counters.apply_deltas({_key(instance.company_id, instance.job_id, instance.status): -1})
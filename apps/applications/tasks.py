@@ -1,29 +1,64 @@
+import logging
+from datetime import timedelta
+
 from celery import shared_task
-from django.conf import settings
-from django.core.mail import send_mail
-from django.urls import reverse
+from django.db import transaction
+from django.utils import timezone
+
+from apps.applications import exports, notifications
 from apps.applications.models import Application
 
-@shared_task
-def send_application_notification(app_id: int):
-    app = Application.objects.select_related("job", "job__company", "seeker").filter(id=app_id).first()
-    if not app:
-        return
-    job = app.job
-    job_url = f"{settings.SITE_URL.rstrip('/')}{reverse('jobs:detail', kwargs={'slug': job.slug})}" if getattr(settings, "SITE_URL", "") else reverse("jobs:detail", kwargs={"slug": job.slug})
-    subject = f"[Aplicație nouă] {job.title}"
-    seeker_name = app.seeker.get_full_name() or app.seeker.username
-    seeker_email = getattr(app.seeker, "email", "")
-    message_lines = [
-        f"A fost trimisă o aplicație nouă pentru jobul: {job.title}",
-        f"Companie: {getattr(job.company, 'name', '')}",
-        f"Candidat: {seeker_name} ({seeker_email})",
-        f"Vezi jobul: {job_url}",
-    ]
-    recipients = [email for _, email in getattr(settings, "ADMINS", [])]
-    if not recipients:
-        recipients = [getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@localhost")]
+logger = logging.getLogger(__name__)
+
+
+def schedule_employer_digest(company_id: int) -> bool:
+    """Schedule the company's digest unless one is already pending."""
+    if not notifications.claim_window(company_id):
+        return False
     try:
-        send_mail(subject, "\n".join(message_lines), settings.DEFAULT_FROM_EMAIL, recipients, fail_silently=True)
+        send_application_digest.apply_async(args=[company_id], countdown=notifications.NOTIFY_WINDOW)
     except Exception:
-        pass
+        # Let the next application (or the sweep) retry
+        notifications.release_window(company_id)
+        logger.exception("Could not schedule application digest for company %s", company_id)
+        return False
+    return True
+
+
+def notify_employer_on_commit(company_id: int) -> None:
+    transaction.on_commit(lambda: schedule_employer_digest(company_id))
+
+
+@shared_task
+def send_application_notification(app_id: int):
+    # Kept for messages already queued: coalesced into the company digest
+    company_id = Application.objects.filter(id=app_id).values_list("company_id", flat=True).first()
+    if company_id:
+        schedule_employer_digest(company_id)
+
+
+@shared_task
+def send_application_digest(company_id: int):
+    return notifications.send_company_digest(company_id)
+
+
+@shared_task
+def send_pending_application_digests():
+    """Sweep for digests whose scheduled task was lost (broker restart, worker crash)."""
+    cutoff = timezone.now() - timedelta(seconds=2 * notifications.NOTIFY_WINDOW)
+    company_ids = (
+        Application.objects.filter(notified_at__isnull=True, created_at__lt=cutoff)
+        .order_by().values_list("company_id", flat=True).distinct()
+    )
+    return notifications.send_due_digests(list(company_ids))
+
+
+@shared_task
+def export_applications(export_id: int):
+    export = exports.run_export(export_id)
+    return export.row_count if export else 0
+
+
+@shared_task
+def purge_application_exports():
+    return exports.purge_expired()
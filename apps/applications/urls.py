@@ -11,8 +11,10 @@ urlpatterns = [
     # Employer-facing inbox
     path("employer/inbox/", views.inbox, name="inbox"),
     path("employer/inbox/export.csv", views.export_csv, name="export_csv"),
+    path("employer/inbox/exports/<int:pk>/", views.export_download, name="export_download"),
 
     # Status updates
     path("status/", views.update_status, name="status_update_base"),           # JSON body {id,status}
+    path("status/bulk/", views.bulk_update_status, name="status_bulk"),        # JSON body {items} or {filter, status}
     path("status/<int:pk>/", views.update_status, name="status_update"),      # Preferred
 ]
\ No newline at end of file
@@ -1,25 +1,29 @@
 from __future__ import annotations
 
-import csv
 import json
+from collections import Counter
 from typing import Dict, List, Tuple
 
 from django import forms
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Paginator
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.db.models import QuerySet
-from django.http import Http404, HttpResponse, JsonResponse
+from django.http import FileResponse, Http404, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.utils import timezone
 from django.views.decorators.http import require_GET, require_POST
 
-from apps.accounts.decorators import employer_required
+from apps.accounts.decorators import employer_required, rate_limit
+from apps.analytics.utils import log_event
 from apps.applications.forms import ApplicationForm
-from .models import Application
+from apps.applications.tasks import export_applications, notify_employer_on_commit
+from apps.jobs.tasks import enqueue_on_commit
+from . import bulk, counters, exports
+from .models import Application, ApplicationExport
 from apps.jobs.models import Job
+from apps.jobs.pagination import KeysetPaginator, SortKey
 
 
 def _get_status_choices() -> Tuple[List[Tuple[str, str]], Dict[str, str]]:
@@ -56,40 +60,57 @@ def _employer_company_or_redirect(request):
     return company
 
 
+INBOX_KEYS = [SortKey("id")]
+INBOX_PAGE_SIZE = 25
+
+
+def _int_or_none(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _filtered_applications(request, company, label_map: Dict[str, str]) -> QuerySet[Application]:
+    """The company's applications narrowed by ?status= and ?job= (inbox and CSV export)."""
+    qs = Application.objects.filter(company=company).select_related("job", "seeker")
+    status = request.GET.get("status") or ""
+    if status and status in label_map:
+        qs = qs.filter(status=status)
+    job_id = _int_or_none(request.GET.get("job"))
+    if job_id:
+        qs = qs.filter(job_id=job_id)
+    return qs
+
+
 @login_required
 @employer_required
 @require_GET
 def inbox(request):
     """
-    Employer-facing inbox with status/job filters and pagination.
+    Employer-facing inbox with status/job filters and keyset pagination (?after=).
     """
     company = _employer_company_or_redirect(request)
     if not hasattr(company, "id"):  # redirected
         return company
 
     choices, label_map = _get_status_choices()
-    allowed_status = set(k for k, _ in choices)
-
-    qs: QuerySet[Application] = (
-        Application.objects.filter(job__company=company)
-        .select_related("job", "job__company", "seeker")  # was "user"
-        .order_by("-id")
-    )
-
-    status = request.GET.get("status") or ""
-    if status and status in allowed_status:
-        qs = qs.filter(status=status)
-
-    job_id = request.GET.get("job") or ""
-    if job_id:
-        try:
-            qs = qs.filter(job_id=int(job_id))
-        except ValueError:
-            pass
-
-    paginator = Paginator(qs, 25)
-    page_number = request.GET.get("page") or 1
-    page_obj = paginator.get_page(page_number)
+    qs = _filtered_applications(request, company, label_map).defer("cover_letter")
+
+    # Keyset on id: every page is one range scan of the (company, status|job, id) indexes
+    paginator = KeysetPaginator(qs, INBOX_PAGE_SIZE, INBOX_KEYS, with_total=True)
+    page_obj = paginator.get_page(request.GET.get("after"))
+    next_url = first_url = None
+    params = request.GET.copy()
+    if page_obj.next_cursor:
+        params["after"] = page_obj.next_cursor
+        next_url = f"?{params.urlencode()}"
+    if page_obj.cursor:
+        params.pop("after", None)
+        first_url = f"?{params.urlencode()}"
+
+    # Tab badges: the company's counter rows, or the selected job's
+    status_counts = counters.status_counts(company.id, _int_or_none(request.GET.get("job")))
 
     # Jobs list for filter
     jobs_qs = Job.objects.filter(company=company).only("id", "title").order_by("title")
@@ -98,9 +119,13 @@ def inbox(request):
         "applications": page_obj.object_list,
         "page_obj": page_obj,
         "paginator": paginator,
+        "next_url": next_url,
+        "first_url": first_url,
         "jobs": jobs_qs,
         "status_choices": choices,
         "status_label_map": label_map,
+        "status_tabs": [(code, label, status_counts.get(code, 0)) for code, label in choices],
+        "status_total": sum(status_counts.values()),
         # Used by JS fallback; row carries its own data-url
         "status_update_url": reverse("applications:status_update_base"),
     }
@@ -129,14 +154,14 @@ def update_status(request, pk: int | str = None):
     if not pk:
         return JsonResponse({"ok": False, "error": "missing_id"}, status=400)
 
-    app = get_object_or_404(Application.objects.select_related("job", "job__company"), pk=pk)
+    app = get_object_or_404(Application, pk=pk)
 
     # Ownership check: must belong to current employer's company
     company = _employer_company_or_redirect(request)
     if not hasattr(company, "id"):  # redirected, but for JSON respond 403
         return JsonResponse({"ok": False, "error": "no_company"}, status=403)
 
-    if app.job.company_id != company.id:
+    if app.company_id != company.id:
         return JsonResponse({"ok": False, "error": "forbidden"}, status=403)
 
     new_status = payload.get("status") or request.POST.get("status")
@@ -149,17 +174,102 @@ def update_status(request, pk: int | str = None):
             app.status_changed_at = timezone.now()
         except Exception:
             pass
-    app.save(update_fields=["status"] + (["status_changed_at"] if hasattr(app, "status_changed_at") else []))
+    with transaction.atomic():
+        app.save(update_fields=["status"] + (["status_changed_at"] if hasattr(app, "status_changed_at") else []))
 
     return JsonResponse({"ok": True, "status": new_status, "status_label": label_map.get(new_status, new_status)})
 
 
+@login_required
+@employer_required
+@require_POST
+def bulk_update_status(request):
+    """
+    Change many statuses in one request. JSON body, either
+    {"items": [{"id": 1, "status": "viewed"}, ...]} or
+    {"filter": {"status": "submitted", "job": 3}, "status": "rejected"}.
+    Returns one result per item: updated, unchanged, not_found, invalid_status or
+    invalid_id; an id repeated in "items", an unknown filter status or a job of
+    another company rejects the whole request.
+    """
+    _, label_map = _get_status_choices()
+
+    try:
+        payload = json.loads(request.body or "{}")
+    except Exception:
+        payload = {}
+    if not isinstance(payload, dict):
+        payload = {}
+
+    company = _employer_company_or_redirect(request)
+    if not hasattr(company, "id"):
+        return JsonResponse({"ok": False, "error": "no_company"}, status=403)
+
+    results = []
+    changes: Dict[int, str] = {}
+    if isinstance(payload.get("filter"), dict):
+        target = payload.get("status")
+        if target not in label_map:
+            return JsonResponse({"ok": False, "error": "invalid_status"}, status=400)
+        flt = payload["filter"]
+        # A filter that doesn't apply must not widen to every application of the company
+        status = flt.get("status") or ""
+        if status and status not in label_map:
+            return JsonResponse({"ok": False, "error": "invalid_filter_status"}, status=400)
+        job_id = None
+        if flt.get("job") not in (None, ""):
+            job_id = _int_or_none(flt.get("job"))
+            if job_id is None or not Job.objects.filter(id=job_id, company=company).exists():
+                return JsonResponse({"ok": False, "error": "invalid_filter_job"}, status=400)
+        changes = bulk.matching(company.id, target, status, job_id)
+        if changes is None:
+            return JsonResponse({"ok": False, "error": "too_many", "max": bulk.MAX_ITEMS}, status=400)
+    elif isinstance(payload.get("items"), list):
+        items = payload["items"]
+        if len(items) > bulk.MAX_ITEMS:
+            return JsonResponse({"ok": False, "error": "too_many", "max": bulk.MAX_ITEMS}, status=400)
+        seen = set()
+        for item in items:
+            raw_id = item.get("id") if isinstance(item, dict) else None
+            app_id = _int_or_none(raw_id)
+            if app_id is None:
+                results.append({"id": raw_id, "result": "invalid_id"})
+                continue
+            # One result per application: a repeated id would get conflicting ones
+            if app_id in seen:
+                return JsonResponse({"ok": False, "error": "duplicate_id", "id": app_id}, status=400)
+            seen.add(app_id)
+            if item.get("status") not in label_map:
+                results.append({"id": app_id, "result": "invalid_status"})
+                continue
+            changes[app_id] = item["status"]
+    else:
+        return JsonResponse({"ok": False, "error": "missing_items"}, status=400)
+
+    outcome = bulk.change_statuses(company.id, changes) if changes else {}
+    results.extend(
+        {"id": app_id, "result": result, "status": changes[app_id], "status_label": label_map[changes[app_id]]}
+        if result != bulk.NOT_FOUND else {"id": app_id, "result": result}
+        for app_id, result in outcome.items()
+    )
+    updated = Counter(changes[app_id] for app_id, result in outcome.items() if result == bulk.UPDATED)
+    if updated:
+        # One event for the whole batch, not one per application
+        try:
+            log_event(request, "application_status_bulk", {"company_id": company.id, "statuses": dict(updated)})
+        except Exception:
+            pass
+    return JsonResponse({"ok": True, "updated": sum(updated.values()), "results": results})
+
+
 @login_required
 @employer_required
 @require_GET
 def export_csv(request):
     """
-    CSV export of filtered applications. Uses the same filters as the inbox.
+    CSV export of filtered applications (same filters as the inbox). Streamed
+    in chunks up to EXPORT_SYNC_LIMIT rows; larger exports (or ?async=1) are
+    built by a worker and the requester gets an email with the download link.
     """
     company = _employer_company_or_redirect(request)
     if not hasattr(company, "id"):
@@ -167,51 +277,66 @@ def export_csv(request):
         return company
 
     choices, label_map = _get_status_choices()
-
-    qs: QuerySet[Application] = (
-        Application.objects.filter(job__company=company)
-        .select_related("job", "job__company", "seeker")  # was "user"
-        .order_by("-id")
-    )
-
     status = request.GET.get("status") or ""
-    if status and status in label_map:
-        qs = qs.filter(status=status)
-
-    job_id = request.GET.get("job") or ""
-    if job_id:
-        try:
-            qs = qs.filter(job_id=int(job_id))
-        except ValueError:
-            pass
-
-    resp = HttpResponse(content_type="text/csv; charset=utf-8")
+    status = status if status in label_map else ""
+    job_id = _int_or_none(request.GET.get("job"))
+
+    if request.GET.get("async") or exports.estimated_rows(company.id, status, job_id) > exports.EXPORT_SYNC_LIMIT:
+        export = ApplicationExport.objects.create(
+            company=company, requested_by=request.user, filters={"status": status, "job": job_id}
+        )
+        enqueue_on_commit(export_applications, export.id)
+        messages.info(request, "Exportul se pregătește. Vei primi un email cu linkul de descărcare.")
+        return redirect("applications:inbox")
+
+    qs = exports.filter_applications(company.id, status, job_id)
+    resp = StreamingHttpResponse(exports.csv_chunks(qs, label_map), content_type="text/csv; charset=utf-8")
     resp["Content-Disposition"] = 'attachment; filename="applications.csv"'
-    writer = csv.writer(resp)
-    writer.writerow(["Job", "Candidat", "Email", "Trimis", "Status"])
-    for a in qs.iterator():
-        user = getattr(a, "user", None)
-        username = getattr(user, "username", "") if user else ""
-        email = getattr(user, "email", "") if user else ""
-        job_title = a.job.title if getattr(a, "job", None) else ""
-        created = getattr(a, "created_at", None)
-        created_s = timezone.localtime(created).strftime("%Y-%m-%d %H:%M") if created else ""
-        status_label = label_map.get(getattr(a, "status", ""), getattr(a, "status", ""))
-        writer.writerow([job_title, username, email, created_s, status_label])
     return resp
 
 
 @login_required
+@employer_required
+@require_GET
+def export_download(request, pk: int):
+    """A finished background export, for whoever asked for it or the company owner."""
+    export = get_object_or_404(ApplicationExport.objects.select_related("company"), pk=pk)
+    if request.user.id not in (export.requested_by_id, export.company.owner_id):
+        raise Http404
+    if export.status != ApplicationExport.STATUS_DONE or not export.file:
+        raise Http404
+    return FileResponse(export.file.open("rb"), as_attachment=True, filename=exports.download_name(export))
+
+
+@login_required
+@rate_limit(key="apply", rate=20, period=60 * 60, methods=("POST",))
 def apply(request, slug):
     # Require authenticated user; optionally restrict to seekers if your User model has a role flag.
     job = get_object_or_404(Job, slug=slug)
     if request.method == "POST":
         form = ApplicationForm(request.POST, request.FILES)
         if form.is_valid():
-            app = form.save(commit=False)
-            app.seeker = request.user          # was: app.user = request.user
-            app.job = job
-            app.save()
+            if Application.objects.filter(job=job, seeker=request.user).exists():
+                messages.info(request, "Ai aplicat deja la acest job.")
+                return redirect("jobs:detail", slug=job.slug)
+            try:
+                with transaction.atomic():  # application and its status counters together
+                    Application.objects.create(
+                        job=job,
+                        seeker=request.user,
+                        cover_letter=form.cleaned_data.get("cover_letter") or "",
+                        cv=form.cleaned_data.get("cv"),
+                    )
+            except IntegrityError:
+                # A concurrent submit won the unique (job, seeker) race
+                messages.info(request, "Ai aplicat deja la acest job.")
+                return redirect("jobs:detail", slug=job.slug)
+            # Coalesced into one email per company and window
+            notify_employer_on_commit(job.company_id)
+            try:
+                log_event(request, "job_apply", {"job_id": job.id, "slug": job.slug})
+            except Exception:
+                pass
             messages.success(request, "Aplicarea a fost trimisă.")
             return redirect("jobs:detail", slug=job.slug)
     else:
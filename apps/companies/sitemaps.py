@@ -1,17 +1,31 @@
 from django.contrib.sitemaps import Sitemap
+from django.db.models import Max
+from django.urls import reverse
 from .models import Company
 
 class CompanySitemap(Sitemap):
+    """(slug, created_at) projections; see apps.jobs.sitemaps.JobSitemap."""
     changefreq = "weekly"
     priority = 0.5
+    section = "companies"
+
+    def companies(self):
+        return Company.objects.exclude(slug="")
 
     def items(self):
-        return Company.objects.all()
+        return self.companies().order_by("id").values("slug", "created_at")
+
+    def shard_rows(self, first_id: int, last_id: int):
+        return (
+            self.companies().filter(id__gte=first_id, id__lt=last_id)
+            .order_by("id").values_list("slug", "created_at")
+        )
+
+    def max_id(self) -> int:
+        return self.companies().aggregate(m=Max("id"))["m"] or 0
 
     def lastmod(self, obj):
-        return getattr(obj, "updated_at", getattr(obj, "created_at", None))
+        return obj["created_at"]
 
     def location(self, obj):
-        if hasattr(obj, "get_absolute_url"):
-            return obj.get_absolute_url()
-        return f"/companies/{obj.slug}/"
+        return reverse("companies:detail", kwargs={"slug": obj["slug"]})
@@ -1,5 +1,6 @@
+from django.db import transaction
 from django.db.models import Prefetch
-from django.shortcuts import render, get_object_or_404
+from django.shortcuts import get_object_or_404, redirect, render
 from django.views.generic import TemplateView
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
@@ -7,21 +8,30 @@ from apps.accounts.decorators import EmployerRequiredMixin, role_required
 from apps.jobs.models import Job
 from apps.applications.models import Application
 from apps.applications.models import ApplicationAnswer
+from apps.applications.counters import job_status_counts
 from .models import Company
 from apps.analytics.utils import log_event
 
 
 class EmployerDashboardView(EmployerRequiredMixin, TemplateView):
     template_name = "companies/dashboard.html"
+    # Applicants listed per job; the full list lives in the inbox
+    latest_applications = 5
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
-        jobs = (
+        # A sliced prefetch is limited per job (window function), so the page
+        # cost no longer grows with the number of applications
+        latest = Application.objects.select_related("seeker").order_by("-id")[:self.latest_applications]
+        jobs = list(
             Job.objects.filter(company__owner=self.request.user)
-            .prefetch_related(
-                Prefetch("applications", queryset=Application.objects.select_related("applicant", "job"))
-            )
+            .prefetch_related(Prefetch("applications", queryset=latest, to_attr="latest_applications"))
         )
+        # Badge counts from the counter rows instead of counting each job's applications
+        status_counts = job_status_counts(job.id for job in jobs)
+        for job in jobs:
+            job.status_counts = status_counts[job.id]
+            job.application_total = sum(status_counts[job.id].values())
         ctx["jobs"] = jobs
         return ctx
 
@@ -52,9 +62,8 @@ def need_company(request):
 def employer_applicants(request):
     # Employer must own at least one company
     companies = Company.objects.filter(owner=request.user)
-    jobs = Job.objects.filter(company__in=companies)
     apps_qs = (
-        Application.objects.filter(job__in=jobs)
+        Application.objects.filter(company__in=companies)
         .select_related("job", "job__company", "seeker")
         .prefetch_related(Prefetch("answers", queryset=ApplicationAnswer.objects.select_related("question")))
         .order_by("-id")
@@ -67,7 +76,8 @@ def employer_applicants(request):
         app = apps_qs.filter(id=app_id).first()
         if app and hasattr(app, "status") and new_status:
             app.status = new_status
-            app.save(update_fields=["status"])
+            with transaction.atomic():
+                app.save(update_fields=["status"])
             try:
                 log_event(request, "status_changed", {"application_id": app.id, "status": new_status})
             except Exception:
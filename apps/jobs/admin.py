@@ -1,26 +1,58 @@
+import uuid
+
 from django.contrib import admin
+from django.http import JsonResponse
+from django.urls import path, reverse
+from django.utils.html import format_html
+
+from . import moderation
 from .models import Job, JobReport
+from .tasks import bulk_moderate_jobs, enqueue_on_commit
 
 
 @admin.register(Job)
 class JobAdmin(admin.ModelAdmin):
-    list_display = ("title", "company", "moderation_status", "flagged_reason", "created_by", "created_at")
-    list_filter = ("moderation_status", "flagged_reason", "company")
+    list_display = ("title", "company", "moderation_status", "flagged_reason", "risk_score", "created_by", "created_at")
+    list_filter = ("moderation_status", "needs_review", "flagged_reason", "company")
     search_fields = ("title", "company__name", "description", "slug")
     actions = ["approve_jobs", "reject_jobs"]
 
+    def get_urls(self):
+        urls = [
+            path(
+                "moderation-progress/<str:token>/",
+                self.admin_site.admin_view(self.moderation_progress),
+                name="jobs_job_moderation_progress",
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def moderation_progress(self, request, token):
+        return JsonResponse(moderation.get_progress(token) or {"state": "unknown"})
+
+    def _bulk_moderate(self, request, queryset, action, reason=""):
+        ids = list(queryset.order_by("id").values_list("id", flat=True))
+        if len(ids) > moderation.BULK_SYNC_LIMIT:
+            token = uuid.uuid4().hex
+            moderation.set_progress(token, "queued", {"action": action, "total": len(ids), "done": 0, "changed": 0})
+            enqueue_on_commit(bulk_moderate_jobs, token, ids, action, reason)
+            url = reverse("admin:jobs_job_moderation_progress", args=[token])
+            self.message_user(request, format_html(
+                "{} job(uri) se procesează în fundal. <a href=\"{}\">Vezi progresul</a>", len(ids), url
+            ))
+            return None
+        return moderation.bulk_moderate(ids, action, reason=reason)
+
     def approve_jobs(self, request, queryset):
-        updated = 0
-        for job in queryset:
-            job.approve()
-            updated += 1
-        self.message_user(request, f"{updated} job(uri) aprobate.")
+        stats = self._bulk_moderate(request, queryset, "approve")
+        if stats:
+            self.message_user(request, f"{stats['changed']} job(uri) aprobate.")
     approve_jobs.short_description = "Aprobă joburile selectate"
 
     def reject_jobs(self, request, queryset):
-        for job in queryset:
-            job.reject(reason="admin")
-        self.message_user(request, "Joburile selectate au fost respinse.")
+        stats = self._bulk_moderate(request, queryset, "reject", reason="admin")
+        if stats:
+            self.message_user(request, "Joburile selectate au fost respinse.")
     reject_jobs.short_description = "Respinge joburile selectate"
 
 
@@ -0,0 +1,213 @@
+"""
+Saved-search alerts.
+
+Matching works like a percolator: instead of running every saved search
+against the jobs table, each new public job is matched against the searches.
+
+- Every SavedSearch is indexed under a few anchor keys (SavedSearchTerm):
+  a prefix of its longest query term ("t:sofe"), else one compound key of
+  all its structured filters ("city:cluj|cat:it|salary"; one per city its
+  `loc` text can match), or "*" when it has no criteria at all. A search is
+  only a candidate for jobs having one of them, so a search filtering on
+  city and category is never loaded for every job of that city.
+- A job emits the keys it can satisfy (prefixes of its document tokens and
+  every combination of its city/category/salary), so one indexed
+  `key IN (...)` lookup finds the candidates, which are then verified in
+  Python with the same semantics as JobListView (prefix terms, loc
+  substring, salary range).
+
+Matches are stored in SavedSearchMatch and emailed in batches: instant
+searches every few minutes, daily ones once a day, one email per user.
+"""
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.template.loader import get_template
+from django.utils import timezone
+
+from .digest import subscribed
+from .models import CITIES, PUBLIC_JOB_CONDITION, Job, SavedSearch, SavedSearchMatch, SavedSearchTerm
+from .salary import salary_in_range
+from .search import MAX_QUERY_TERMS, build_document, tokenize
+
+PREFIX_LEN = 4
+MIN_ANCHOR_LEN = 3
+MATCH_ALL = "*"
+SALARY_KEY = "salary"
+ALERT_CHUNK_SIZE = 500
+MAX_JOBS_PER_SEARCH = 10
+TEMPLATE_NAME = "emails/saved_search_alert.txt"
+
+SEARCH_FIELDS = ("id", "q", "loc", "category", "city", "has_salary", "salary_min", "salary_max")
+
+
+def _query_terms(q: str) -> List[str]:
+    return tokenize(q)[:MAX_QUERY_TERMS]
+
+
+def _loc_cities(loc: str) -> List[str]:
+    # JobListView filters city__icontains=loc
+    loc = loc.strip().lower()
+    return [code for code, _ in CITIES if loc in code]
+
+
+def _compound(city: str = "", category: str = "", salary: bool = False) -> str:
+    # Fixed part order, so a search and a job build the same string
+    parts = [f"city:{city}" if city else "", f"cat:{category}" if category else "", SALARY_KEY if salary else ""]
+    return "|".join(p for p in parts if p) or MATCH_ALL
+
+
+def anchor_keys(search: SavedSearch) -> List[str]:
+    """Keys a job must share with `search` to be a candidate (any of them)."""
+    terms = [t for t in _query_terms(search.q) if len(t) >= MIN_ANCHOR_LEN]
+    if terms:
+        return ["t:" + max(terms, key=len)[:PREFIX_LEN]]
+    salary = bool(search.has_salary or search.salary_min is not None or search.salary_max is not None)
+    if search.city:
+        cities = [search.city]
+    elif search.loc:
+        # No matching city: the search can never match and stays unindexed
+        cities = _loc_cities(search.loc)
+        if not cities:
+            return []
+    else:
+        cities = [""]
+    return [_compound(city, search.category, salary) for city in cities]
+
+
+def index_search(search: SavedSearch) -> None:
+    with transaction.atomic():
+        SavedSearchTerm.objects.filter(saved_search=search).delete()
+        if search.is_active:
+            SavedSearchTerm.objects.bulk_create(
+                [SavedSearchTerm(saved_search=search, key=key) for key in anchor_keys(search)]
+            )
+
+
+def _job_tokens(job: Job) -> set:
+    document = build_document(job)
+    return set(tokenize(f"{document['title']} {document['body']}"))
+
+
+def job_keys(job: Job, tokens: Iterable[str]) -> List[str]:
+    has_salary = job.salary_min is not None or job.salary_max is not None
+    keys = {
+        _compound(city, category, salary)
+        for city in ("", job.city)
+        for category in ("", job.category)
+        for salary in ((False, True) if has_salary else (False,))
+    }
+    for token in tokens:
+        for length in range(MIN_ANCHOR_LEN, min(len(token), PREFIX_LEN) + 1):
+            keys.add("t:" + token[:length])
+    return sorted(keys)
+
+
+def _prefixes(tokens: Iterable[str]) -> set:
+    return {token[:i] for token in tokens for i in range(1, len(token) + 1)}
+
+
+def search_matches(search: dict, job: Job, prefixes: set) -> bool:
+    if search["category"] and search["category"] != job.category:
+        return False
+    if search["city"] and search["city"] != job.city:
+        return False
+    if search["loc"] and search["loc"].strip().lower() not in (job.city or "").lower():
+        return False
+    if search["has_salary"] and job.salary_max is None:
+        return False
+    if not salary_in_range(job.salary_min, job.salary_max, search["salary_min"], search["salary_max"]):
+        return False
+    return all(term in prefixes for term in _query_terms(search["q"]))
+
+
+def percolate(job: Job) -> int:
+    """Record the saved searches `job` matches (idempotent); returns how many matched."""
+    tokens = _job_tokens(job)
+    prefixes = _prefixes(tokens)
+    candidates = SavedSearchTerm.objects.filter(key__in=job_keys(job, tokens)).values("saved_search_id")
+    searches = (
+        SavedSearch.objects.filter(id__in=candidates, is_active=True)
+        .values(*SEARCH_FIELDS)
+        .iterator(chunk_size=5000)
+    )
+    matched = [SavedSearchMatch(saved_search_id=s["id"], job_id=job.id) for s in searches if search_matches(s, job, prefixes)]
+    SavedSearchMatch.objects.bulk_create(matched, ignore_conflicts=True, batch_size=1000)
+    return len(matched)
+
+
+def percolate_jobs(job_ids: Iterable[int]) -> int:
+    jobs = Job.objects.filter(PUBLIC_JOB_CONDITION, id__in=list(job_ids)).select_related("company")
+    return sum(percolate(job) for job in jobs)
+
+
+# Delivery
+
+def _pending(frequency: str):
+    return SavedSearchMatch.objects.filter(
+        notified_at__isnull=True, saved_search__frequency=frequency, saved_search__is_active=True
+    )
+
+
+def recipient_chunks(frequency: str, chunk_size: Optional[int] = None) -> Iterator[List[int]]:
+    """Ids of users with pending matches for `frequency`, in chunks (keyset on user id)."""
+    chunk_size = chunk_size or ALERT_CHUNK_SIZE
+    base = _pending(frequency).order_by("saved_search__user_id").values_list("saved_search__user_id", flat=True).distinct()
+    last_id = 0
+    while True:
+        ids = list(base.filter(saved_search__user_id__gt=last_id)[:chunk_size])
+        if not ids:
+            return
+        yield ids
+        last_id = ids[-1]
+
+
+@lru_cache(maxsize=1)
+def _template():
+    return get_template(TEMPLATE_NAME)
+
+
+def send_alert_chunk(user_ids: List[int], frequency: str) -> int:
+    """
+    One email per user listing new jobs per saved search. Every pending match
+    of these users is marked notified (including skipped ones: opted-out
+    users, jobs no longer public), so nothing piles up.
+    """
+    pending = list(
+        _pending(frequency).filter(saved_search__user_id__in=user_ids)
+        .select_related("saved_search", "job", "job__company")
+        .order_by("saved_search__user_id", "saved_search_id", "-job__created_at")
+    )
+    grouped: Dict[int, Dict[int, list]] = {}
+    searches = {}
+    for match in pending:
+        job = match.job
+        if not (job.is_active and job.moderation_status == Job.MOD_APPROVED):
+            continue
+        per_search = grouped.setdefault(match.saved_search.user_id, {}).setdefault(match.saved_search_id, [])
+        searches[match.saved_search_id] = match.saved_search
+        if len(per_search) < MAX_JOBS_PER_SEARCH:
+            per_search.append(job)
+
+    users = subscribed(get_user_model().objects.filter(id__in=list(grouped))).only("id", "username", "email")
+    template = _template()
+    messages = []
+    for user in users:
+        items = [(searches[search_id], jobs) for search_id, jobs in grouped[user.id].items()]
+        messages.append(EmailMessage(
+            subject=f"[Alerte joburi] {sum(len(jobs) for _, jobs in items)} joburi noi",
+            body=template.render({"user": user, "items": items, "frequency": frequency, "site_url": settings.SITE_URL}),
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[user.email],
+        ))
+
+    sent = 0
+    if messages:
+        with get_connection(fail_silently=True) as connection:
+            sent = connection.send_messages(messages) or 0
+    SavedSearchMatch.objects.filter(id__in=[m.id for m in pending]).update(notified_at=timezone.now())
+    return sent
@@ -4,4 +4,7 @@ from django.apps import AppConfig
 class JobsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.jobs"
-    label = "jobs"
\ No newline at end of file
+    label = "jobs"
+
+    def ready(self):
+        from . import signals  # noqa: F401
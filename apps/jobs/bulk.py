@@ -0,0 +1,20 @@
+"""
+Hook for set-based job changes.
+
+QuerySet.update() bypasses post_save, so code that changes many jobs at once
+(expiry sweeps, bulk moderation) sends `jobs_bulk_changed` instead. Cache,
+index and counter maintenance subscribes to it in apps/jobs/signals.py.
+"""
+from typing import Iterable, Optional
+
+from django.dispatch import Signal
+
+# kwargs: job_ids (list[int]), reason (str: "expired", "approved", "rejected", ...),
+# public_delta (int | None: change in the number of public jobs, None if unknown)
+jobs_bulk_changed = Signal()
+
+
+def notify_jobs_changed(job_ids: Iterable[int], reason: str, public_delta: Optional[int] = None) -> None:
+    job_ids = list(job_ids)
+    if job_ids:
+        jobs_bulk_changed.send(sender=None, job_ids=job_ids, reason=reason, public_delta=public_delta)
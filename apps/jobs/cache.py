@@ -0,0 +1,76 @@
+"""
+Cache helpers for job listings.
+
+Listing caches (facets, result pages) embed a generation number in their keys.
+Any change to public jobs bumps the generation, which orphans every old entry
+at once instead of having to find and delete them.
+"""
+import hashlib
+import time
+from typing import Iterable, Tuple
+
+from django.core.cache import cache
+
+TRUTHY = ("1", "true", "on", "yes")
+# Params the list view matches case-insensitively (full-text search,
+# icontains location); everything else is an exact match or an opaque
+# cursor and keeps its case in the key
+CASE_INSENSITIVE_PARAMS = ("q", "loc", "location")
+
+
+def generation(name: str) -> int:
+    key = f"jobs:gen:{name}"
+    gen = cache.get(key)
+    if gen is None:
+        _seed_generation(key)
+        gen = cache.get(key, 0)
+    return gen
+
+
+def bump_generation(name: str) -> None:
+    key = f"jobs:gen:{name}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        _seed_generation(key)
+        cache.incr(key)
+
+
+def _seed_generation(key: str) -> None:
+    # Seed from the clock so a counter lost to eviction never reuses an old
+    # generation whose entries may still be cached.
+    cache.add(key, int(time.time()), timeout=None)
+
+
+def listing_generation() -> int:
+    return generation("listing")
+
+
+def bump_listing_generation() -> None:
+    bump_generation("listing")
+
+
+def canonical_params(params, keys: Iterable[str]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Normalize a QueryDict for use in cache keys: only `keys`, blanks dropped,
+    values stripped (and lowercased for CASE_INSENSITIVE_PARAMS), boolean
+    flags collapsed to "1", sorted.
+    """
+    items = []
+    for key in keys:
+        value = (params.get(key) or "").strip()
+        if key in CASE_INSENSITIVE_PARAMS:
+            value = value.lower()
+        if not value:
+            continue
+        if key == "has_salary":
+            if value.lower() not in TRUTHY:
+                continue
+            value = "1"
+        items.append((key, value))
+    return tuple(sorted(items))
+
+
+def listing_cache_key(prefix: str, canonical: Tuple[Tuple[str, str], ...]) -> str:
+    digest = hashlib.md5(repr(canonical).encode()).hexdigest()
+    return f"jobs:{prefix}:{listing_generation()}:{digest}"
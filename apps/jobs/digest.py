@@ -0,0 +1,90 @@
+"""
+Saved-jobs email digest.
+
+The nightly task walks the users with saved jobs in id order and hands each
+chunk of ids to a subtask, so chunks are rendered and sent in parallel by
+the workers. A chunk costs two queries (recipients, their latest saved
+jobs via a window function) and one SMTP connection for all its messages.
+Users with UserProfile.receive_alerts off are skipped.
+"""
+from functools import lru_cache
+from typing import Iterator, List, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from django.template.loader import get_template
+
+from .models import SavedJob
+
+DIGEST_CHUNK_SIZE = getattr(settings, "SAVED_JOBS_DIGEST_CHUNK_SIZE", 500)
+MAX_JOBS_PER_DIGEST = 20
+TEMPLATE_NAME = "emails/saved_jobs_digest.txt"
+
+
+@lru_cache(maxsize=1)
+def _template():
+    # Compiled once per worker process
+    return get_template(TEMPLATE_NAME)
+
+
+def subscribed(queryset, prefix: str = ""):
+    return queryset.filter(**{f"{prefix}is_active": True}).exclude(**{f"{prefix}email": ""}).exclude(
+        **{f"{prefix}profile__receive_alerts": False}
+    )
+
+
+def recipient_chunks(chunk_size: Optional[int] = None) -> Iterator[List[int]]:
+    """Ids of subscribed users with saved jobs, `chunk_size` at a time (keyset on user id)."""
+    chunk_size = chunk_size or DIGEST_CHUNK_SIZE
+    base = (
+        subscribed(SavedJob.objects.all(), prefix="user__")
+        .order_by("user_id")
+        .values_list("user_id", flat=True)
+        .distinct()
+    )
+    last_id = 0
+    while True:
+        ids = list(base.filter(user_id__gt=last_id)[:chunk_size])
+        if not ids:
+            return
+        yield ids
+        last_id = ids[-1]
+
+
+def latest_saved(user_ids: List[int], limit: Optional[int] = None):
+    """{user_id: [SavedJob, ...]} with at most `limit` newest entries per user, in one query."""
+    limit = limit or MAX_JOBS_PER_DIGEST
+    rows = (
+        SavedJob.objects.filter(user_id__in=user_ids)
+        .select_related("job", "job__company")
+        .annotate(rank=Window(RowNumber(), partition_by=[F("user_id")], order_by=F("created_at").desc()))
+        .filter(rank__lte=limit)
+        .order_by("user_id", "rank")
+    )
+    grouped = {}
+    for saved in rows:
+        grouped.setdefault(saved.user_id, []).append(saved)
+    return grouped
+
+
+def send_digest_chunk(user_ids: List[int], frequency: str = "daily") -> int:
+    users = subscribed(get_user_model().objects.filter(id__in=user_ids)).only("id", "username", "email")
+    saved_by_user = latest_saved(user_ids)
+    template = _template()
+    messages = [
+        EmailMessage(
+            subject=f"[Rezumat joburi salvate] {frequency}",
+            body=template.render({"user": user, "saved": saved_by_user[user.id], "frequency": frequency}),
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[user.email],
+        )
+        for user in users
+        if saved_by_user.get(user.id)
+    ]
+    if not messages:
+        return 0
+    with get_connection(fail_silently=True) as connection:
+        return connection.send_messages(messages) or 0
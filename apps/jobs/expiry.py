@@ -0,0 +1,73 @@
+"""
+Deactivate jobs whose `expires_at` has passed.
+
+Work happens in bounded batches, each its own short transaction driven by the
+partial index on active jobs' expires_at, so a backlog of hundreds of
+thousands of expirations never holds long table locks.
+"""
+import logging
+import time
+from typing import Callable, Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from .bulk import notify_jobs_changed
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def expired_jobs(now=None):
+    now = now or timezone.now()
+    return Job.objects.filter(is_active=True, expires_at__lte=now)
+
+
+def expire_jobs(
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+    max_batches: Optional[int] = None,
+    pause: float = 0.0,
+    progress: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """
+    Returns stats: {"expired", "batches", "remaining", "seconds", "dry_run"}.
+    `progress` is called with the running stats after every batch.
+    """
+    now = timezone.now()
+    started = time.monotonic()
+    stats = {"expired": 0, "batches": 0, "remaining": 0, "seconds": 0.0, "dry_run": dry_run}
+
+    if dry_run:
+        stats["remaining"] = expired_jobs(now).count()
+        stats["seconds"] = round(time.monotonic() - started, 3)
+        return stats
+
+    while max_batches is None or stats["batches"] < max_batches:
+        with transaction.atomic():
+            rows = list(
+                expired_jobs(now).select_for_update().order_by("expires_at", "id")
+                .values_list("id", "moderation_status")[:batch_size]
+            )
+            if not rows:
+                break
+            ids = [pk for pk, _ in rows]
+            updated = Job.objects.filter(id__in=ids, is_active=True).update(is_active=False, updated_at=now)
+        # After commit, so invalidated caches cannot be refilled with old rows
+        was_public = sum(status == Job.MOD_APPROVED for _, status in rows)
+        notify_jobs_changed(ids, reason="expired", public_delta=-was_public)
+        stats["expired"] += updated
+        stats["batches"] += 1
+        stats["seconds"] = round(time.monotonic() - started, 3)
+        if progress:
+            progress(dict(stats))
+        if pause:
+            time.sleep(pause)
+
+    if max_batches is not None:
+        stats["remaining"] = expired_jobs(now).count()
+    stats["seconds"] = round(time.monotonic() - started, 3)
+    logger.info("expire_jobs expired=%s batches=%s seconds=%s", stats["expired"], stats["batches"], stats["seconds"])
+    return stats
@@ -0,0 +1,103 @@
+"""
+Facet counts (category, city, has_salary) for the job list sidebar.
+
+All three facets come from a single GROUP BY over (category, city, has_salary),
+reduced in Python. Facets are disjunctive: a facet whose own param is set is
+counted without that param (one more GROUP BY each), so picking a category
+still shows how many jobs the other categories have. Results are cached per filter combination as long as no
+free-text filter is involved; the cache is invalidated via the listing
+generation (see apps/jobs/cache.py).
+"""
+from django.core.cache import cache
+from django.db.models import BooleanField, Count, ExpressionWrapper, Q
+
+from .cache import TRUTHY, canonical_params, listing_cache_key
+from .models import CATEGORIES, CITIES
+
+FACET_PARAMS = (
+    "q", "loc", "location", "category", "city", "has_salary", "salary_min", "salary_max", "employment_type", "work_type",
+)
+# Free-text params have unbounded combinations; don't fill the cache with them
+UNCACHED_PARAMS = ("q", "loc", "location")
+FACET_TIMEOUT = 10 * 60
+# Facets counted without their own filter
+DISJUNCTIVE_PARAMS = ("category", "city", "has_salary")
+
+
+def _group_counts(queryset):
+    rows = (
+        queryset.order_by()
+        .annotate(salary_set=ExpressionWrapper(Q(salary_max__isnull=False), output_field=BooleanField()))
+        .values("category", "city", "salary_set")
+        .annotate(n=Count("id"))
+    )
+    categories, cities, with_salary = {}, {}, 0
+    for row in rows:
+        categories[row["category"]] = categories.get(row["category"], 0) + row["n"]
+        cities[row["city"]] = cities.get(row["city"], 0) + row["n"]
+        if row["salary_set"]:
+            with_salary += row["n"]
+    return {"category": categories, "city": cities, "has_salary": with_salary}
+
+
+def get_facet_counts(queryset, params) -> dict:
+    """
+    Raw counts for `queryset` (already filtered by `params`):
+    {"category": {value: n}, "city": {value: n}, "has_salary": n}
+    """
+    canonical = canonical_params(params, FACET_PARAMS)
+    if any(key in UNCACHED_PARAMS for key, _ in canonical):
+        return _group_counts(queryset)
+    key = listing_cache_key("facets", canonical)
+    counts = cache.get(key)
+    if counts is None:
+        counts = _group_counts(queryset)
+        cache.set(key, counts, FACET_TIMEOUT)
+    return counts
+
+
+def _link(params, key, value):
+    p = params.copy()
+    p.pop("page", None)
+    p.pop("after", None)
+    if value is None:
+        p.pop(key, None)
+    else:
+        p[key] = value
+    return f"?{p.urlencode()}" if p else "?"
+
+
+def build_facets(queryset, params, queryset_for=None) -> dict:
+    """
+    Template-ready facets: choice lists with counts, selection state and
+    toggle links that keep the other filters. `queryset_for(params)` builds
+    the filtered jobs for other params; without it every facet is counted
+    on `queryset`.
+    """
+    counts = dict(get_facet_counts(queryset, params))
+    if queryset_for is not None:
+        selected = {key for key, _ in canonical_params(params, DISJUNCTIVE_PARAMS)}
+        for name in selected:
+            relaxed = params.copy()
+            relaxed.pop(name, None)
+            counts[name] = get_facet_counts(queryset_for(relaxed), relaxed)[name]
+    facets = {}
+    for name, choices in (("category", CATEGORIES), ("city", CITIES)):
+        selected = params.get(name) or ""
+        facets[name] = [
+            {
+                "value": value,
+                "label": label,
+                "count": counts[name].get(value, 0),
+                "selected": value == selected,
+                "url": _link(params, name, None if value == selected else value),
+            }
+            for value, label in choices
+        ]
+    salary_selected = (params.get("has_salary") or "").lower() in TRUTHY
+    facets["has_salary"] = {
+        "count": counts["has_salary"],
+        "selected": salary_selected,
+        "url": _link(params, "has_salary", None if salary_selected else "1"),
+    }
+    return facets
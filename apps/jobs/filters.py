@@ -1,6 +1,8 @@
 import django_filters
 from django.db.models import Q
 from .models import Job
+from .salary import salary_range_q
+from .search import search_jobs
 
 
 def _field_choices(model, field_name, fallback):
@@ -41,19 +43,18 @@ class JobFilter(django_filters.FilterSet):
     employment_type = django_filters.ChoiceFilter(method="filter_employment_type", choices=EMPLOYMENT_CHOICES, label="Tip angajare")
     work_type = django_filters.ChoiceFilter(method="filter_work_type", choices=WORK_TYPE_CHOICES, label="Mod lucru")
     has_salary = django_filters.BooleanFilter(method="filter_has_salary", label="Are salariu")
+    salary_min = django_filters.NumberFilter(method="filter_salary_min", label="Salariu minim")
+    salary_max = django_filters.NumberFilter(method="filter_salary_max", label="Salariu maxim")
 
     class Meta:
         model = Job
         fields = ["location"]
 
     def filter_q(self, queryset, name, value):
-        if not value:
+        if not value or "search_rank" in queryset.query.annotations:
+            # JobListView.get_queryset already applied the search
             return queryset
-        return queryset.filter(
-            Q(title__icontains=value)
-            | Q(description__icontains=value)
-            | Q(company__name__icontains=value)
-        )
+        return search_jobs(queryset, value, order=False)
 
     def filter_employment_type(self, queryset, name, value):
         if not value:
@@ -85,4 +86,14 @@ class JobFilter(django_filters.FilterSet):
             q |= Q(salary_min__isnull=False)
         if has_max:
             q |= Q(salary_max__isnull=False)
-        return queryset.filter(q)
\ No newline at end of file
+        return queryset.filter(q)
+
+    def filter_salary_min(self, queryset, name, value):
+        if value is None:
+            return queryset
+        return queryset.filter(salary_range_q(minimum=int(value)))
+
+    def filter_salary_max(self, queryset, name, value):
+        if value is None:
+            return queryset
+        return queryset.filter(salary_range_q(maximum=int(value)))
@@ -0,0 +1,218 @@
+"""
+Near-duplicate detection for job postings.
+
+Every Job has a JobFingerprint:
+- title_key: the title without diacritics, punctuation or word order
+  ("Șofer C+E" and "Sofer CE" both become "ce sofer")
+- simhash: 64-bit SimHash of the description over word shingles; reposts
+  with small edits land within a few bits of each other
+
+The SimHash is split into four 16-bit bands. Two hashes at most MAX_DISTANCE
+(< 4) bits apart share at least one band exactly, so candidates come from
+indexed equality lookups on (company, title_key) / (company, band_i) and are
+verified in Python. A posting is a duplicate of an earlier job of the same
+company in the same city with the same title key or a near-identical description.
+"""
+import hashlib
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .bulk import notify_jobs_changed
+from .models import Job, JobFingerprint
+from .search import tokenize
+
+MAX_DISTANCE = 3
+BANDS = 4
+BAND_BITS = 16
+SHINGLE_SIZE = 3
+WINDOW_DAYS = getattr(settings, "JOB_DUPLICATE_WINDOW_DAYS", 7)
+DUPLICATE_REASON = "duplicate"
+
+_MASK = (1 << 64) - 1
+
+
+def title_key(title: str) -> str:
+    tokens = []
+    for token in tokenize(title):
+        # Glue runs of single characters back together: "c+e" -> "ce"
+        if len(token) == 1 and tokens and tokens[-1][1]:
+            tokens[-1] = (tokens[-1][0] + token, True)
+        else:
+            tokens.append((token, len(token) == 1))
+    return " ".join(sorted({token for token, _ in tokens}))[:255]
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+def simhash(text: str) -> int:
+    """Unsigned 64-bit SimHash of `text`; 0 when there is nothing to hash."""
+    tokens = tokenize(text)
+    if len(tokens) >= SHINGLE_SIZE:
+        shingles = [" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)]
+    else:
+        shingles = tokens
+    if not shingles:
+        return 0
+    weights = [0] * 64
+    for shingle in shingles:
+        h = _hash64(shingle)
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def to_signed(value: int) -> int:
+    # Stored in a signed BIGINT column
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def distance(a: int, b: int) -> int:
+    return bin((a ^ b) & _MASK).count("1")
+
+
+def bands(value: int) -> List[int]:
+    value &= _MASK
+    return [(value >> (BAND_BITS * i)) & 0xFFFF for i in range(BANDS)]
+
+
+def compute(title: str, description: str) -> dict:
+    h = simhash(description)
+    fields = {"title_key": title_key(title), "simhash": to_signed(h)}
+    fields.update({f"band{i}": band for i, band in enumerate(bands(h))})
+    return fields
+
+
+def index_jobs(jobs: Iterable[Job]) -> int:
+    """Upsert fingerprints for the given jobs (duplicate_of is left alone)."""
+    objs = [
+        JobFingerprint(
+            job_id=job.id, company_id=job.company_id, city=job.city or "", created_at=job.created_at,
+            **compute(job.title, job.description),
+        )
+        for job in jobs
+    ]
+    if not objs:
+        return 0
+    JobFingerprint.objects.bulk_create(
+        objs,
+        update_conflicts=True,
+        unique_fields=["job"],
+        update_fields=["company", "city", "created_at", "title_key", "simhash", "band0", "band1", "band2", "band3"],
+    )
+    return len(objs)
+
+
+def _is_duplicate(fp: dict, other: dict) -> bool:
+    if fp["city"] and other["city"] and fp["city"] != other["city"]:
+        return False
+    if fp["title_key"] and fp["title_key"] == other["title_key"]:
+        return True
+    return bool(fp["simhash"] and other["simhash"]) and distance(fp["simhash"], other["simhash"]) <= MAX_DISTANCE
+
+
+def find_duplicates(company_id: int, title: str, description: str, city: str = "",
+                    since=None, exclude_id: Optional[int] = None) -> List[int]:
+    """
+    Ids of earlier jobs of `company_id` that the posting duplicates, oldest
+    first. Only jobs created after `since` (default: WINDOW_DAYS ago) count.
+    """
+    fp = compute(title, description)
+    fp["city"] = city or ""
+    match = Q(title_key=fp["title_key"])
+    if fp["simhash"]:
+        for i in range(BANDS):
+            match |= Q(**{f"band{i}": fp[f"band{i}"]})
+    since = since or timezone.now() - timedelta(days=WINDOW_DAYS)
+    candidates = (
+        JobFingerprint.objects.filter(match, company_id=company_id, created_at__gte=since)
+        .exclude(job_id=exclude_id)
+        .order_by("created_at", "job_id")
+        .values("job_id", "city", "title_key", "simhash")
+    )
+    return [c["job_id"] for c in candidates if _is_duplicate(fp, c)]
+
+
+def _scan_company(rows: List[dict]) -> Dict[int, int]:
+    """{duplicate job id: original job id} within one company's fingerprints (oldest first)."""
+    by_title = {}
+    by_band = defaultdict(list)
+    found = {}
+    for row in rows:
+        original = by_title.get((row["city"], row["title_key"])) if row["title_key"] else None
+        if original is None and row["simhash"]:
+            for i in range(BANDS):
+                for other in by_band[(i, row[f"band{i}"])]:
+                    if _is_duplicate(row, other):
+                        original = other["job_id"]
+                        break
+                if original is not None:
+                    break
+        if original is not None:
+            found[row["job_id"]] = original
+            continue
+        # Only originals are indexed, so chains point at the first posting
+        if row["title_key"]:
+            by_title.setdefault((row["city"], row["title_key"]), row["job_id"])
+        if row["simhash"]:
+            for i in range(BANDS):
+                by_band[(i, row[f"band{i}"])].append(row)
+    return found
+
+
+def scan_duplicates(since=None, hold: bool = False, progress=None) -> dict:
+    """
+    Flag near-duplicates across the catalogue, company by company. Duplicates
+    get flagged_reason="duplicate" and their fingerprint points at the
+    original; with `hold=True` public duplicates also go back to moderation.
+    """
+    stats = {"companies": 0, "duplicates": 0, "held": 0}
+    base = JobFingerprint.objects.all()
+    if since is not None:
+        base = base.filter(created_at__gte=since)
+    company_ids = base.order_by().values_list("company_id", flat=True).distinct()
+    for company_id in company_ids.iterator():
+        rows = list(
+            base.filter(company_id=company_id)
+            .order_by("created_at", "job_id")
+            .values("job_id", "city", "title_key", "simhash", "band0", "band1", "band2", "band3")
+        )
+        found = _scan_company(rows)
+        stats["companies"] += 1
+        if not found:
+            continue
+        held = _flag(found, hold)
+        stats["duplicates"] += len(found)
+        stats["held"] += len(held)
+        if progress:
+            progress(stats)
+    return stats
+
+
+def _flag(found: Dict[int, int], hold: bool) -> List[int]:
+    now = timezone.now()
+    held = []
+    with transaction.atomic():
+        JobFingerprint.objects.bulk_update(
+            [JobFingerprint(job_id=dup, duplicate_of_id=orig) for dup, orig in found.items()],
+            ["duplicate_of"],
+            batch_size=500,
+        )
+        Job.objects.filter(id__in=found, flagged_reason="").update(
+            flagged_reason=DUPLICATE_REASON, flagged_at=now
+        )
+        if hold:
+            public = Job.objects.filter(id__in=found, is_active=True, moderation_status=Job.MOD_APPROVED)
+            held = list(public.values_list("id", flat=True))
+            Job.objects.filter(id__in=held).update(
+                moderation_status=Job.MOD_PENDING, is_active=False, updated_at=now
+            )
+    notify_jobs_changed(held, DUPLICATE_REASON, public_delta=-len(held))
+    return held
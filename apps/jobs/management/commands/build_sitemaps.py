@@ -0,0 +1,20 @@
+from django.core.management import BaseCommand
+
+from apps.jobs.sitemap_files import build
+
+
+class Command(BaseCommand):
+    help = "Write the sharded, gzipped sitemaps and their index (dirty shards only unless --full)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--full", action="store_true", help="Rebuild every shard.")
+        parser.add_argument("--section", action="append", choices=["jobs", "companies"])
+
+    def handle(self, *args, **options):
+        def progress(section, number, stats):
+            self.stdout.write(f"{section}-{number}: {stats['urls']} URLs written so far")
+
+        stats = build(full=options["full"], sections=options["section"], progress=progress)
+        self.stdout.write(self.style.SUCCESS(
+            f"Done: {stats['shards']} shards rebuilt, {stats['index_entries']} in the index."
+        ))
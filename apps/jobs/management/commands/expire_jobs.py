@@ -0,0 +1,31 @@
+from django.core.management import BaseCommand
+
+from apps.jobs.expiry import DEFAULT_BATCH_SIZE, expire_jobs
+
+
+class Command(BaseCommand):
+    help = "Deactivate jobs past their expires_at, in small batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument("--max-batches", type=int, default=None)
+        parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches.")
+        parser.add_argument("--dry-run", action="store_true", help="Only count the jobs that would expire.")
+
+    def handle(self, *args, **options):
+        def progress(stats):
+            self.stdout.write(f"batch {stats['batches']}: {stats['expired']} expired ({stats['seconds']}s)")
+
+        stats = expire_jobs(
+            batch_size=options["batch_size"],
+            dry_run=options["dry_run"],
+            max_batches=options["max_batches"],
+            pause=options["pause"],
+            progress=progress,
+        )
+        if stats["dry_run"]:
+            self.stdout.write(f"Dry run: {stats['remaining']} jobs would expire.")
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f"Done: {stats['expired']} jobs expired in {stats['batches']} batches ({stats['seconds']}s)."
+            ))
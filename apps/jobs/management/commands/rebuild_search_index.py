@@ -0,0 +1,25 @@
+from django.core.management import BaseCommand
+
+from apps.jobs.models import Job
+from apps.jobs.search import index_jobs
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search documents for all jobs (in id-ordered batches)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        qs = Job.objects.select_related("company").order_by("id")
+        last_id = 0
+        total = 0
+        while True:
+            batch = list(qs.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            total += index_jobs(batch)
+            last_id = batch[-1].id
+            self.stdout.write(f"Indexed {total} jobs (last id {last_id})")
+        self.stdout.write(self.style.SUCCESS(f"Done: {total} jobs indexed."))
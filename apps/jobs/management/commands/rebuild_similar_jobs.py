@@ -0,0 +1,14 @@
+from django.core.management import BaseCommand
+
+from apps.jobs import similarity
+
+
+class Command(BaseCommand):
+    help = "Recompute the similar-jobs index for the most recent public jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=similarity.CORPUS_LIMIT)
+
+    def handle(self, *args, **options):
+        total = similarity.rebuild_index(limit=options["limit"])
+        self.stdout.write(self.style.SUCCESS(f"Similar jobs computed for {total} jobs."))
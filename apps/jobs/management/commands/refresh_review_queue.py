@@ -0,0 +1,33 @@
+from django.core.management import BaseCommand
+from django.db.models import Q
+
+from apps.jobs.models import Job
+from apps.jobs.moderation import REFRESH_CHUNK_SIZE, refresh_risk_scores
+
+
+class Command(BaseCommand):
+    help = "Recompute risk scores of pending, reported and queued jobs (review queue)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=REFRESH_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        qs = (
+            Job.objects.filter(
+                Q(moderation_status=Job.MOD_PENDING) | Q(needs_review=True) | Q(reports__handled=False)
+            )
+            .order_by("id")
+            .values_list("id", flat=True)
+            .distinct()
+        )
+        last_id = 0
+        total = 0
+        while True:
+            ids = list(qs.filter(id__gt=last_id)[:batch_size])
+            if not ids:
+                break
+            total += refresh_risk_scores(ids)
+            last_id = ids[-1]
+            self.stdout.write(f"Scored {total} jobs (last id {last_id})")
+        self.stdout.write(self.style.SUCCESS(f"Done: {total} jobs scored."))
@@ -0,0 +1,11 @@
+from django.core.management import BaseCommand
+
+from apps.jobs.salary import rebuild_histograms
+
+
+class Command(BaseCommand):
+    help = "Recompute the salary histograms shown on the job list page."
+
+    def handle(self, *args, **options):
+        count = rebuild_histograms()
+        self.stdout.write(self.style.SUCCESS(f"{count} histograms computed."))
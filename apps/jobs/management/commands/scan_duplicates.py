@@ -0,0 +1,40 @@
+from datetime import timedelta
+
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from apps.jobs.fingerprint import index_jobs, scan_duplicates
+from apps.jobs.models import Job
+
+
+class Command(BaseCommand):
+    help = "Fingerprint jobs that have none yet, then flag near-duplicate postings per company."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--days", type=int, default=None, help="Only scan jobs created in the last N days.")
+        parser.add_argument("--hold", action="store_true", help="Send public duplicates back to moderation.")
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        qs = Job.objects.filter(fingerprint__isnull=True).order_by("id")
+        last_id = 0
+        indexed = 0
+        while True:
+            batch = list(qs.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            indexed += index_jobs(batch)
+            last_id = batch[-1].id
+        if indexed:
+            self.stdout.write(f"Fingerprinted {indexed} jobs.")
+
+        since = timezone.now() - timedelta(days=options["days"]) if options["days"] else None
+
+        def progress(stats):
+            self.stdout.write(f"{stats['companies']} companies scanned, {stats['duplicates']} duplicates")
+
+        stats = scan_duplicates(since=since, hold=options["hold"], progress=progress)
+        self.stdout.write(self.style.SUCCESS(
+            f"Done: {stats['duplicates']} duplicates in {stats['companies']} companies ({stats['held']} held)."
+        ))
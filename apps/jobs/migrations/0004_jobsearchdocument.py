@@ -0,0 +1,74 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+DOC_TABLE = "jobs_jobsearchdocument"
+FTS_TABLE = "jobs_jobsearchdocument_fts"
+
+POSTGRES_FORWARD = [
+    f"""ALTER TABLE {DOC_TABLE} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(body, '')), 'B')
+    ) STORED""",
+    f"CREATE INDEX {DOC_TABLE}_vector_gin ON {DOC_TABLE} USING GIN (search_vector)",
+]
+POSTGRES_REVERSE = [
+    f"DROP INDEX IF EXISTS {DOC_TABLE}_vector_gin",
+    f"ALTER TABLE {DOC_TABLE} DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_FORWARD = [
+    f"""CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        title, body, content='{DOC_TABLE}', content_rowid='job_id',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON {DOC_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.job_id, new.title, new.body);
+    END""",
+    f"""CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON {DOC_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) VALUES ('delete', old.job_id, old.title, old.body);
+    END""",
+    f"""CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE ON {DOC_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) VALUES ('delete', old.job_id, old.title, old.body);
+        INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (new.job_id, new.title, new.body);
+    END""",
+]
+SQLITE_REVERSE = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        for sql in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sql)
+    return run
+
+
+create_search_index = _run({"postgresql": POSTGRES_FORWARD, "sqlite": SQLITE_FORWARD})
+drop_search_index = _run({"postgresql": POSTGRES_REVERSE, "sqlite": SQLITE_REVERSE})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_job_approved_at_job_flagged_at_job_flagged_reason_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobSearchDocument',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='jobs.job')),
+                ('title', models.TextField(blank=True)),
+                ('body', models.TextField(blank=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        # Existing jobs are indexed with `manage.py rebuild_search_index`
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0001_initial'),
+        ('jobs', '0004_jobsearchdocument'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('is_active', True), ('moderation_status', 'approved')), fields=['-created_at', '-id'], name='job_public_recent_idx'),
+        ),
+    ]
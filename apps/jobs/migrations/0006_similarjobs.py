@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_job_public_recent_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SimilarJobs',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='similar_index', serialize=False, to='jobs.job')),
+                ('neighbors', models.JSONField(blank=True, default=list)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
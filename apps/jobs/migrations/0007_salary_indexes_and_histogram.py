@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0001_initial'),
+        ('jobs', '0006_similarjobs'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SalaryHistogram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.CharField(blank=True, max_length=32)),
+                ('city', models.CharField(blank=True, max_length=64)),
+                ('buckets', models.JSONField(blank=True, default=list)),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('is_active', True), ('moderation_status', 'approved')), fields=['-salary_max', '-id'], name='job_public_salary_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('is_active', True), ('moderation_status', 'approved')), fields=['category', 'city', '-salary_max', '-id'], name='job_public_cat_city_salary_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('is_active', True), ('moderation_status', 'approved'), ('salary_min__isnull', False)), fields=['salary_min'], name='job_public_salary_min_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='salaryhistogram',
+            unique_together={('category', 'city')},
+        ),
+    ]
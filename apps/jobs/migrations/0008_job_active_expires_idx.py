@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0001_initial'),
+        ('jobs', '0007_salary_indexes_and_histogram'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('expires_at__isnull', False), ('is_active', True)), fields=['expires_at', 'id'], name='job_active_expires_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0001_initial'),
+        ('jobs', '0008_job_active_expires_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobFingerprint',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='fingerprint', serialize=False, to='jobs.job')),
+                ('city', models.CharField(blank=True, max_length=64)),
+                ('title_key', models.CharField(max_length=255)),
+                ('simhash', models.BigIntegerField(default=0)),
+                ('band0', models.PositiveIntegerField(default=0)),
+                ('band1', models.PositiveIntegerField(default=0)),
+                ('band2', models.PositiveIntegerField(default=0)),
+                ('band3', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField()),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='companies.company')),
+                ('duplicate_of', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='jobs.job')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['company', 'title_key'], name='jobfp_company_title_idx'), models.Index(fields=['company', 'band0'], name='jobfp_company_band0_idx'), models.Index(fields=['company', 'band1'], name='jobfp_company_band1_idx'), models.Index(fields=['company', 'band2'], name='jobfp_company_band2_idx'), models.Index(fields=['company', 'band3'], name='jobfp_company_band3_idx')],
+            },
+        ),
+    ]
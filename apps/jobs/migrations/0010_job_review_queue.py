@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def mark_review_queue(apps, schema_editor):
+    # Scores are filled in by `manage.py refresh_review_queue`
+    Job = apps.get_model("jobs", "Job")
+    Job.objects.filter(
+        models.Q(moderation_status="pending") | models.Q(reports__handled=False)
+    ).update(needs_review=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0001_initial'),
+        ('jobs', '0009_jobfingerprint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='needs_review',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='risk_score',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('needs_review', True)), fields=['-risk_score', '-id'], name='job_review_queue_idx'),
+        ),
+        migrations.RunPython(mark_review_queue, migrations.RunPython.noop),
+    ]
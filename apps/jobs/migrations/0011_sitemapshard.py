@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0010_job_review_queue'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SitemapShard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('section', models.CharField(max_length=32)),
+                ('number', models.PositiveIntegerField()),
+                ('url_count', models.PositiveIntegerField(default=0)),
+                ('dirty', models.BooleanField(default=True)),
+                ('built_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'unique_together': {('section', 'number')},
+            },
+        ),
+    ]
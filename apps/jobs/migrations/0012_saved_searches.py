@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:29
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0011_sitemapshard'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavedSearch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(blank=True, max_length=120)),
+                ('q', models.CharField(blank=True, max_length=255)),
+                ('loc', models.CharField(blank=True, max_length=120)),
+                ('category', models.CharField(blank=True, choices=[('logistics', 'Logistics/Drivers'), ('retail', 'Retail/HORECA'), ('cs_bpo', 'Customer Support/BPO'), ('trades', 'Blue-collar Trades'), ('it', 'IT/Tech')], max_length=32)),
+                ('city', models.CharField(blank=True, choices=[('bucharest', 'București'), ('cluj', 'Cluj-Napoca'), ('iasi', 'Iași'), ('timisoara', 'Timișoara'), ('brasov', 'Brașov')], max_length=64)),
+                ('has_salary', models.BooleanField(default=False)),
+                ('salary_min', models.PositiveIntegerField(blank=True, null=True)),
+                ('salary_max', models.PositiveIntegerField(blank=True, null=True)),
+                ('frequency', models.CharField(choices=[('instant', 'Imediat'), ('daily', 'Zilnic')], default='daily', max_length=16)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saved_searches', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SavedSearchMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('notified_at', models.DateTimeField(blank=True, null=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='jobs.job')),
+                ('saved_search', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='matches', to='jobs.savedsearch')),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('notified_at__isnull', True)), fields=['saved_search'], name='savedsearch_match_pending_idx')],
+                'unique_together': {('saved_search', 'job')},
+            },
+        ),
+        migrations.CreateModel(
+            name='SavedSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=80)),
+                ('saved_search', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='terms', to='jobs.savedsearch')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['key', 'saved_search'], name='savedsearch_term_key_idx')],
+            },
+        ),
+    ]
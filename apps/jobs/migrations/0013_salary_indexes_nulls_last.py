@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:00
+
+from django.db import migrations, models
+
+PUBLIC = models.Q(('is_active', True), ('moderation_status', 'approved'))
+
+OLD_INDEXES = [
+    models.Index(fields=['-salary_max', '-id'], condition=PUBLIC, name='job_public_salary_idx'),
+    models.Index(fields=['category', 'city', '-salary_max', '-id'], condition=PUBLIC, name='job_public_cat_city_salary_idx'),
+]
+NEW_INDEXES = [
+    models.Index(models.OrderBy(models.F('salary_max'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), condition=PUBLIC, name='job_public_salary_idx'),
+    models.Index(models.F('category'), models.F('city'), models.OrderBy(models.F('salary_max'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), condition=PUBLIC, name='job_public_cat_city_salary_idx'),
+]
+
+
+def _swap(remove, add):
+    def run(apps, schema_editor):
+        # SQLite rejects NULLS LAST in an index, and its plain DESC index
+        # already sorts NULLs last (NULL is the smallest value there)
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        Job = apps.get_model('jobs', 'Job')
+        for index in remove:
+            schema_editor.remove_index(Job, index)
+        for index in add:
+            schema_editor.add_index(Job, index)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0012_saved_searches'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveIndex(model_name='job', name='job_public_salary_idx'),
+                migrations.RemoveIndex(model_name='job', name='job_public_cat_city_salary_idx'),
+                migrations.AddIndex(model_name='job', index=NEW_INDEXES[0]),
+                migrations.AddIndex(model_name='job', index=NEW_INDEXES[1]),
+            ],
+            database_operations=[
+                migrations.RunPython(_swap(OLD_INDEXES, NEW_INDEXES), _swap(NEW_INDEXES, OLD_INDEXES)),
+            ],
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.db import migrations
+
+BATCH_SIZE = 2000
+
+
+def reindex(apps, schema_editor):
+    # anchor_keys only reads the search's filter fields, so historical rows work
+    from apps.jobs.alerts import anchor_keys
+
+    SavedSearch = apps.get_model("jobs", "SavedSearch")
+    SavedSearchTerm = apps.get_model("jobs", "SavedSearchTerm")
+    SavedSearchTerm.objects.all().delete()
+    last_id = 0
+    while True:
+        searches = list(SavedSearch.objects.filter(is_active=True, id__gt=last_id).order_by("id")[:BATCH_SIZE])
+        if not searches:
+            break
+        SavedSearchTerm.objects.bulk_create(
+            [SavedSearchTerm(saved_search=search, key=key) for search in searches for key in anchor_keys(search)]
+        )
+        last_id = searches[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0013_salary_indexes_nulls_last"),
+    ]
+
+    operations = [
+        migrations.RunPython(reindex, migrations.RunPython.noop),
+    ]
@@ -23,6 +23,10 @@ CITIES = [
 ]
 
 
+# Predicate of every public listing; partial indexes below are built on it
+PUBLIC_JOB_CONDITION = models.Q(is_active=True, moderation_status="approved")
+
+
 class Job(models.Model):
     company = models.ForeignKey(Company, related_name="jobs", on_delete=models.CASCADE)
     title = models.CharField(max_length=255)
@@ -52,10 +56,51 @@ class Job(models.Model):
     flagged_reason = models.CharField(max_length=120, blank=True)
     flagged_at = models.DateTimeField(null=True, blank=True)
     approved_at = models.DateTimeField(null=True, blank=True)
+    # Staff review queue, maintained by apps.jobs.moderation.refresh_risk_scores
+    risk_score = models.PositiveIntegerField(default=0)
+    needs_review = models.BooleanField(default=False)
 
     class Meta:
         indexes = [
             models.Index(fields=["category", "city", "is_active"]),
+            # Keyset pagination for the public "new" listing: (created_at, id) DESC
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="job_public_recent_idx",
+                condition=PUBLIC_JOB_CONDITION,
+            ),
+            # Salary sort / "at least X" range filter, globally and per category+city.
+            # NULLS LAST to match the listing's ORDER BY (a plain DESC index is
+            # NULLS FIRST on Postgres and can't serve it). Built on Postgres only,
+            # see migration 0013: SQLite keeps the equivalent plain DESC index
+            models.Index(
+                models.F("salary_max").desc(nulls_last=True), models.F("id").desc(),
+                name="job_public_salary_idx",
+                condition=PUBLIC_JOB_CONDITION,
+            ),
+            models.Index(
+                "category", "city", models.F("salary_max").desc(nulls_last=True), models.F("id").desc(),
+                name="job_public_cat_city_salary_idx",
+                condition=PUBLIC_JOB_CONDITION,
+            ),
+            # Expiry sweeper: active jobs ordered by expiry date
+            models.Index(
+                fields=["expires_at", "id"],
+                name="job_active_expires_idx",
+                condition=models.Q(is_active=True, expires_at__isnull=False),
+            ),
+            # "at most Y" range filter
+            models.Index(
+                fields=["salary_min"],
+                name="job_public_salary_min_idx",
+                condition=PUBLIC_JOB_CONDITION & models.Q(salary_min__isnull=False),
+            ),
+            # Moderation queue: riskiest first, keyset on (risk_score, id)
+            models.Index(
+                fields=["-risk_score", "-id"],
+                name="job_review_queue_idx",
+                condition=models.Q(needs_review=True),
+            ),
         ]
         ordering = ["-created_at"]
 
@@ -68,19 +113,16 @@ class Job(models.Model):
     def approve(self):
         self.moderation_status = self.MOD_APPROVED
         self.approved_at = timezone.now()
-        # Activate if model has is_active
-        if "is_active" in {f.name for f in self._meta.get_fields()}:
-            self.is_active = True
-        self.save(update_fields=["moderation_status", "approved_at"] + (["is_active"] if hasattr(self, "is_active") else []))
+        self.is_active = True
+        self.save(update_fields=["moderation_status", "approved_at", "is_active", "updated_at"])
 
     def reject(self, reason: str = ""):
         self.moderation_status = self.MOD_REJECTED
         if reason and not self.flagged_reason:
             self.flagged_reason = reason[:120]
             self.flagged_at = timezone.now()
-        if "is_active" in {f.name for f in self._meta.get_fields()}:
-            self.is_active = False
-        self.save(update_fields=["moderation_status", "flagged_reason", "flagged_at"] + (["is_active"] if hasattr(self, "is_active") else []))
+        self.is_active = False
+        self.save(update_fields=["moderation_status", "flagged_reason", "flagged_at", "is_active", "updated_at"])
 
 
 class Application(models.Model):
@@ -157,3 +199,180 @@ class JobReport(models.Model):
     def __str__(self):
         return f"Report {self.id} on {self.job_id}"
 
+
+
+class JobSearchDocument(models.Model):
+    """
+    Denormalized search text for a Job, maintained by apps.jobs.signals.
+    The database-specific index (tsvector/GIN or FTS5) is created in migrations.
+    """
+    job = models.OneToOneField(Job, primary_key=True, related_name="search_document", on_delete=models.CASCADE)
+    title = models.TextField(blank=True)
+    body = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"SearchDocument({self.job_id})"
+
+
+class SimilarJobs(models.Model):
+    """
+    Precomputed nearest neighbours of a Job, best first, as [[job_id, score], ...].
+    Maintained in the background by apps.jobs.similarity.
+    """
+    job = models.OneToOneField(Job, primary_key=True, related_name="similar_index", on_delete=models.CASCADE)
+    neighbors = models.JSONField(default=list, blank=True)
+    computed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"SimilarJobs({self.job_id})"
+
+
+class SalaryHistogram(models.Model):
+    """
+    Precomputed salary distribution of public jobs for the list page slider.
+    Blank category/city means "all"; see apps.jobs.salary.
+    """
+    category = models.CharField(max_length=32, blank=True)
+    city = models.CharField(max_length=64, blank=True)
+    buckets = models.JSONField(default=list, blank=True)  # [[lower, upper, count], ...]
+    total = models.PositiveIntegerField(default=0)
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ("category", "city")
+
+    def __str__(self):
+        return f"SalaryHistogram({self.category or '*'}, {self.city or '*'})"
+
+
+class JobFingerprint(models.Model):
+    """
+    Near-duplicate fingerprint of a Job: normalized title key plus a 64-bit
+    SimHash of the description, split into four 16-bit bands. Company, city
+    and created_at are copied from the job so lookups stay on these indexes.
+    Maintained by apps.jobs.signals; see apps.jobs.fingerprint.
+    """
+    job = models.OneToOneField(Job, primary_key=True, related_name="fingerprint", on_delete=models.CASCADE)
+    company = models.ForeignKey(Company, related_name="+", on_delete=models.CASCADE)
+    city = models.CharField(max_length=64, blank=True)
+    title_key = models.CharField(max_length=255)
+    simhash = models.BigIntegerField(default=0)
+    band0 = models.PositiveIntegerField(default=0)
+    band1 = models.PositiveIntegerField(default=0)
+    band2 = models.PositiveIntegerField(default=0)
+    band3 = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField()
+    duplicate_of = models.ForeignKey(Job, null=True, blank=True, related_name="+", on_delete=models.SET_NULL)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["company", "title_key"], name="jobfp_company_title_idx"),
+            models.Index(fields=["company", "band0"], name="jobfp_company_band0_idx"),
+            models.Index(fields=["company", "band1"], name="jobfp_company_band1_idx"),
+            models.Index(fields=["company", "band2"], name="jobfp_company_band2_idx"),
+            models.Index(fields=["company", "band3"], name="jobfp_company_band3_idx"),
+        ]
+
+    def __str__(self):
+        return f"JobFingerprint({self.job_id})"
+
+
+class SitemapShard(models.Model):
+    """
+    One precompressed sitemap file (section "jobs" or "companies", shard
+    `number` covering a fixed id range). `dirty` shards are rebuilt by the
+    next incremental run; see apps.jobs.sitemap_files.
+    """
+    section = models.CharField(max_length=32)
+    number = models.PositiveIntegerField()
+    url_count = models.PositiveIntegerField(default=0)
+    dirty = models.BooleanField(default=True)
+    built_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ("section", "number")
+
+    def __str__(self):
+        return f"SitemapShard({self.section}-{self.number})"
+
+
+class SavedSearch(models.Model):
+    """
+    A seeker's subscription to a JobListView search. New public jobs are
+    matched against it by apps.jobs.alerts through SavedSearchTerm.
+    """
+    FREQ_INSTANT = "instant"
+    FREQ_DAILY = "daily"
+    FREQUENCY_CHOICES = [
+        (FREQ_INSTANT, "Imediat"),
+        (FREQ_DAILY, "Zilnic"),
+    ]
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, related_name="saved_searches", on_delete=models.CASCADE)
+    name = models.CharField(max_length=120, blank=True)
+    q = models.CharField(max_length=255, blank=True)
+    loc = models.CharField(max_length=120, blank=True)
+    category = models.CharField(max_length=32, choices=CATEGORIES, blank=True)
+    city = models.CharField(max_length=64, choices=CITIES, blank=True)
+    has_salary = models.BooleanField(default=False)
+    salary_min = models.PositiveIntegerField(null=True, blank=True)
+    salary_max = models.PositiveIntegerField(null=True, blank=True)
+    frequency = models.CharField(max_length=16, choices=FREQUENCY_CHOICES, default=FREQ_DAILY)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return self.name or ", ".join(str(v) for v in self.params().values()) or "Toate joburile"
+
+    def params(self) -> dict:
+        """The JobListView query parameters of this search (blank ones dropped)."""
+        params = {
+            "q": self.q, "loc": self.loc, "category": self.category, "city": self.city,
+            "has_salary": "1" if self.has_salary else "",
+            "salary_min": self.salary_min, "salary_max": self.salary_max,
+        }
+        return {k: v for k, v in params.items() if v not in ("", None)}
+
+    def get_absolute_url(self):
+        from urllib.parse import urlencode
+        return f"{reverse('jobs:list')}?{urlencode(self.params())}"
+
+
+class SavedSearchTerm(models.Model):
+    """
+    Inverted index of saved searches: the anchor keys of a search (a query
+    term prefix, a city, a category, ...). A new job is a candidate for every
+    search that has at least one of its keys.
+    """
+    saved_search = models.ForeignKey(SavedSearch, related_name="terms", on_delete=models.CASCADE)
+    key = models.CharField(max_length=80)
+
+    class Meta:
+        indexes = [models.Index(fields=["key", "saved_search"], name="savedsearch_term_key_idx")]
+
+    def __str__(self):
+        return f"{self.key} -> {self.saved_search_id}"
+
+
+class SavedSearchMatch(models.Model):
+    """A job that matched a saved search; notified_at is set once it was emailed."""
+    saved_search = models.ForeignKey(SavedSearch, related_name="matches", on_delete=models.CASCADE)
+    job = models.ForeignKey(Job, related_name="+", on_delete=models.CASCADE)
+    created_at = models.DateTimeField(auto_now_add=True)
+    notified_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ("saved_search", "job")
+        indexes = [
+            models.Index(
+                fields=["saved_search"],
+                name="savedsearch_match_pending_idx",
+                condition=models.Q(notified_at__isnull=True),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.saved_search_id} ~ {self.job_id}"
@@ -0,0 +1,333 @@
+"""
+Moderation pipeline for new postings.
+
+JobCreateView saves every new job as pending and queues `moderate_job`,
+which runs the configured rules in the background and either approves the
+job or keeps it pending with a flagged_reason for a human moderator.
+
+Rules are classes with a `reason` and a `check(job)` method, listed by dotted
+path in settings.JOB_MODERATION_RULES (first matching rule wins). They are
+instantiated once per process, so term lists are compiled a single time: all
+blocked terms / scam phrases become one trie-shaped regex, which scans a
+posting in one pass no matter how many terms there are.
+
+`bulk_moderate` is the set-based path for admin actions on many jobs.
+Jobs that need a human (pending or with open reports) carry a precomputed
+risk_score that orders the staff review queue.
+"""
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .bulk import notify_jobs_changed
+from .fingerprint import find_duplicates
+from .forms import EMAIL_RE, PHONE_RE
+from .models import Job, JobFingerprint, JobReport
+from .search import tokenize
+
+BLOCKED_TERMS = getattr(settings, "JOB_BLOCKED_TERMS", ["fuck", "shit", "spam", "escroc", "teapa"])
+SCAM_PHRASES = getattr(settings, "JOB_SCAM_PHRASES", [
+    "taxa de inscriere", "taxa de procesare", "plata in avans", "castig garantat",
+    "bani rapid", "western union", "moneygram", "investitie initiala", "fara experienta castigi",
+])
+SCAM_SALARY_LIMIT = getattr(settings, "JOB_SCAM_SALARY_LIMIT", 50000)
+# Employers need this many approved jobs before their postings skip review
+TRUSTED_AFTER = getattr(settings, "JOB_TRUSTED_AFTER_APPROVED", 5)
+
+DEFAULT_RULES = [
+    "apps.jobs.moderation.DuplicateRule",
+    "apps.jobs.moderation.BlockedTermsRule",
+    "apps.jobs.moderation.ContactInfoRule",
+    "apps.jobs.moderation.ScamRule",
+    "apps.jobs.moderation.NewEmployerRule",
+]
+
+
+def _normalize(text: str) -> str:
+    # Diacritics and punctuation dropped, single spaces: "Plată în avans!" -> "plata in avans"
+    return " ".join(tokenize(text))
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    trie = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def walk(node) -> str:
+        branches = [re.escape(ch) + walk(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{pattern})?" if "" in node else pattern
+
+    return walk(trie)
+
+
+class TermMatcher:
+    """Whole-word matcher for a list of terms/phrases, compiled into one regex."""
+
+    def __init__(self, terms: Iterable[str]):
+        normalized = {_normalize(t) for t in terms} - {""}
+        self.regex = re.compile(r"\b(?:%s)\b" % _trie_pattern(normalized)) if normalized else None
+
+    def search(self, text: str) -> Optional[str]:
+        if self.regex is None:
+            return None
+        match = self.regex.search(_normalize(text))
+        return match.group(0) if match else None
+
+
+class Rule(ABC):
+    reason = ""
+
+    @abstractmethod
+    def check(self, job: Job) -> bool:
+        """True when `job` must be held for review."""
+
+
+class DuplicateRule(Rule):
+    reason = "duplicate"
+
+    def check(self, job):
+        ids = find_duplicates(job.company_id, job.title, job.description, city=job.city, exclude_id=job.id)
+        if ids:
+            JobFingerprint.objects.filter(job=job).update(duplicate_of_id=ids[0])
+        return bool(ids)
+
+
+class BlockedTermsRule(Rule):
+    reason = "abuse"
+
+    def __init__(self):
+        self.matcher = TermMatcher(BLOCKED_TERMS)
+
+    def check(self, job):
+        return bool(self.matcher.search(f"{job.title}\n{job.description}"))
+
+
+class ContactInfoRule(Rule):
+    reason = "contact_info"
+
+    def check(self, job):
+        text = f"{job.title}\n{job.description}"
+        return bool(EMAIL_RE.search(text) or PHONE_RE.search(text))
+
+
+class ScamRule(Rule):
+    reason = "scam"
+
+    def __init__(self):
+        self.matcher = TermMatcher(SCAM_PHRASES)
+
+    def check(self, job):
+        if max(job.salary_min or 0, job.salary_max or 0) > SCAM_SALARY_LIMIT:
+            return True
+        return bool(self.matcher.search(f"{job.title}\n{job.description}"))
+
+
+class NewEmployerRule(Rule):
+    # Held for review without a flag
+    reason = ""
+
+    def check(self, job):
+        approved = (
+            Job.objects.filter(created_by_id=job.created_by_id, moderation_status=Job.MOD_APPROVED)
+            .exclude(id=job.id)
+            .values("id")[:TRUSTED_AFTER]
+        )
+        return len(approved) < TRUSTED_AFTER
+
+
+@lru_cache(maxsize=1)
+def get_rules() -> List[Rule]:
+    return [import_string(path)() for path in getattr(settings, "JOB_MODERATION_RULES", DEFAULT_RULES)]
+
+
+def evaluate(job: Job):
+    """(hold, reason) for `job`: the first rule that fires decides."""
+    for rule in get_rules():
+        if rule.check(job):
+            return True, rule.reason
+    return False, ""
+
+
+def moderate_job(job_id: int) -> str:
+    """
+    Run the pipeline on a pending job. Returns "approved", "held", or
+    "skipped" when the job is gone or a moderator already decided.
+    """
+    with transaction.atomic():
+        job = (
+            Job.objects.select_for_update()
+            .filter(id=job_id, moderation_status=Job.MOD_PENDING)
+            .first()
+        )
+        if job is None:
+            return "skipped"
+        hold, reason = evaluate(job)
+        if not hold:
+            job.approve()
+        elif reason and job.flagged_reason != reason:
+            job.flagged_reason = reason
+            job.flagged_at = timezone.now()
+            job.save(update_fields=["flagged_reason", "flagged_at", "updated_at"])
+        refresh_risk_scores([job.id])
+        return "held" if hold else "approved"
+
+
+# Review queue
+
+FLAG_WEIGHTS = {"scam": 60, "abuse": 50, "duplicate": 30, "contact_info": 25}
+OTHER_FLAG_WEIGHT = 10
+REPORT_WEIGHT = 15
+MAX_REPORTS = 5
+REJECTED_JOB_WEIGHT = 10
+MAX_REJECTED = 5
+NEW_EMPLOYER_WEIGHT = 10
+REFRESH_CHUNK_SIZE = 1000
+
+
+def risk_score(flagged_reason: str, open_reports: int, employer_rejected: int, employer_approved: int) -> int:
+    score = FLAG_WEIGHTS.get(flagged_reason, OTHER_FLAG_WEIGHT if flagged_reason else 0)
+    score += REPORT_WEIGHT * min(open_reports, MAX_REPORTS)
+    score += REJECTED_JOB_WEIGHT * min(employer_rejected, MAX_REJECTED)
+    if not employer_approved:
+        score += NEW_EMPLOYER_WEIGHT
+    return score
+
+
+def open_reports_subquery():
+    return Coalesce(
+        Subquery(
+            JobReport.objects.filter(job=OuterRef("pk"), handled=False)
+            .order_by().values("job").annotate(n=Count("id")).values("n")
+        ),
+        Value(0),
+    )
+
+
+def refresh_risk_scores(job_ids: Iterable[int]) -> int:
+    """
+    Recompute risk_score / needs_review for the given jobs: one query for the
+    jobs with their open report counts, one grouped query for their employers'
+    history, one bulk UPDATE.
+    """
+    job_ids = list(job_ids)
+    updated = 0
+    for start in range(0, len(job_ids), REFRESH_CHUNK_SIZE):
+        jobs = list(
+            Job.objects.filter(id__in=job_ids[start:start + REFRESH_CHUNK_SIZE])
+            .annotate(open_reports=open_reports_subquery())
+            .only("id", "moderation_status", "flagged_reason", "created_by_id", "risk_score", "needs_review")
+        )
+        history = {
+            row["created_by_id"]: row
+            for row in Job.objects.filter(created_by_id__in={job.created_by_id for job in jobs})
+            .order_by().values("created_by_id")
+            .annotate(
+                rejected=Count("id", filter=Q(moderation_status=Job.MOD_REJECTED)),
+                approved=Count("id", filter=Q(moderation_status=Job.MOD_APPROVED)),
+            )
+        }
+        for job in jobs:
+            employer = history.get(job.created_by_id, {})
+            job.risk_score = risk_score(
+                job.flagged_reason, job.open_reports, employer.get("rejected", 0), employer.get("approved", 0)
+            )
+            job.needs_review = job.moderation_status == Job.MOD_PENDING or job.open_reports > 0
+        Job.objects.bulk_update(jobs, ["risk_score", "needs_review"], batch_size=500)
+        updated += len(jobs)
+    return updated
+
+
+def review_queue():
+    """Jobs awaiting a human, with their open report count; order with the queue keys."""
+    return (
+        Job.objects.filter(needs_review=True)
+        .select_related("company", "created_by")
+        .annotate(open_reports=open_reports_subquery())
+        .defer("description")
+    )
+
+
+# Bulk moderation (admin actions, spam waves)
+
+BULK_CHUNK_SIZE = 1000
+# Larger admin selections run in the background
+BULK_SYNC_LIMIT = getattr(settings, "JOB_BULK_MODERATION_SYNC_LIMIT", 500)
+BULK_ACTIONS = {"approve": "approved", "reject": "rejected"}
+PROGRESS_TIMEOUT = 60 * 60
+
+
+def _moderate_chunk(ids: List[int], action: str, reason: str) -> Tuple[List[int], int]:
+    """Returns (changed ids, change in the number of public jobs)."""
+    now = timezone.now()
+    with transaction.atomic():
+        jobs = Job.objects.select_for_update().filter(id__in=ids)
+        if action == "approve":
+            jobs = jobs.exclude(moderation_status=Job.MOD_APPROVED, is_active=True)
+            changed = list(jobs.values_list("id", flat=True))
+            public_delta = len(changed)  # none of them was public
+            Job.objects.filter(id__in=changed).update(
+                moderation_status=Job.MOD_APPROVED, is_active=True, approved_at=now, updated_at=now
+            )
+        else:
+            rows = list(jobs.exclude(moderation_status=Job.MOD_REJECTED).values_list("id", "is_active", "moderation_status"))
+            changed = [pk for pk, _, _ in rows]
+            public_delta = -sum(active and status == Job.MOD_APPROVED for _, active, status in rows)
+            if reason:
+                Job.objects.filter(id__in=changed, flagged_reason="").update(flagged_reason=reason[:120], flagged_at=now)
+            Job.objects.filter(id__in=changed).update(
+                moderation_status=Job.MOD_REJECTED, is_active=False, updated_at=now
+            )
+        # A decision on a job settles its open reports
+        JobReport.objects.filter(job_id__in=ids, handled=False).update(handled=True)
+        refresh_risk_scores(ids)
+    return changed, public_delta
+
+
+def bulk_moderate(job_ids: Iterable[int], action: str, reason: str = "",
+                  chunk_size: int = BULK_CHUNK_SIZE, progress=None) -> dict:
+    """
+    Approve or reject many jobs with one UPDATE per chunk (each chunk its own
+    transaction). `jobs_bulk_changed` is sent per chunk after commit, which
+    drives cache invalidation, counters and employer notifications.
+    Returns {"action", "total", "done", "changed"}.
+    """
+    if action not in BULK_ACTIONS:
+        raise ValueError(f"Unknown moderation action: {action}")
+    job_ids = list(job_ids)
+    stats = {"action": action, "total": len(job_ids), "done": 0, "changed": 0}
+    for start in range(0, len(job_ids), chunk_size):
+        chunk = job_ids[start:start + chunk_size]
+        changed, public_delta = _moderate_chunk(chunk, action, reason)
+        notify_jobs_changed(changed, BULK_ACTIONS[action], public_delta=public_delta)
+        stats["done"] += len(chunk)
+        stats["changed"] += len(changed)
+        if progress:
+            progress(dict(stats))
+    return stats
+
+
+def progress_key(token: str) -> str:
+    return f"jobs:bulk-moderation:{token}"
+
+
+def set_progress(token: str, state: str, stats: Optional[dict] = None) -> None:
+    cache.set(progress_key(token), {"state": state, **(stats or {})}, PROGRESS_TIMEOUT)
+
+
+def get_progress(token: str) -> Optional[dict]:
+    return cache.get(progress_key(token))
@@ -0,0 +1,81 @@
+"""
+Page cache for job detail pages.
+
+One user-neutral rendering ("shell") of `jobs:detail` is cached as HTML,
+keyed by slug, the job's updated_at and a per-company generation (bumped on
+company renames), and served to anonymous and logged-in users alike. Editing
+or moderating a job changes updated_at, so stale pages are simply never
+looked up again.
+
+The holes in the shell are filled per request: the navbar is rendered into
+NAVBAR_HOLE server-side, and the per-user bits (applied / saved / quick-apply
+readiness) are fetched by the page from `jobs:user_state`, a small per-user
+state dict cached separately.
+"""
+from django.contrib import messages
+from django.core.cache import cache
+from django.template.loader import render_to_string
+
+from apps.applications.models import Application
+from .cache import bump_generation, generation
+from .models import SavedJob
+
+DETAIL_PAGE_TIMEOUT = 15 * 60
+USER_STATE_TIMEOUT = 10 * 60
+
+# Left in the shell by the navbar block of jobs/job_detail.html
+NAVBAR_HOLE = b"<!--jobs:navbar-->"
+
+
+def detail_page_key(meta: dict) -> str:
+    """`meta` holds slug, updated_at and company_id of the job."""
+    stamp = int(meta["updated_at"].timestamp() * 1_000_000)
+    company_gen = generation(f"company:{meta['company_id']}")
+    return f"jobs:detail:{meta['slug']}:{stamp}:{company_gen}"
+
+
+def can_serve_cached(request) -> bool:
+    # Pending flash messages are rendered into the page and are per user
+    if request.method != "GET":
+        return False
+    return not len(messages.get_messages(request))
+
+
+def fill_shell(content: bytes, request) -> bytes:
+    """The cached shell with the requesting user's navbar punched in."""
+    if NAVBAR_HOLE not in content:
+        return content
+    navbar = render_to_string("includes/navbar.html", request=request)
+    return content.replace(NAVBAR_HOLE, navbar.encode("utf-8"), 1)
+
+
+def bump_company_pages(company_id: int) -> None:
+    bump_generation(f"company:{company_id}")
+
+
+def _user_state_key(user_id: int, job_id: int) -> str:
+    return f"jobs:user-state:{user_id}:{generation(f'user:{user_id}')}:{job_id}"
+
+
+def invalidate_user_state(user_id: int) -> None:
+    bump_generation(f"user:{user_id}")
+
+
+def get_user_job_state(user, job_id: int) -> dict:
+    state = {"authenticated": False, "is_seeker": False, "has_applied": False, "is_saved": False, "quick_apply_ready": False}
+    if not getattr(user, "is_authenticated", False):
+        return state
+    key = _user_state_key(user.id, job_id)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    profile = getattr(user, "seekerprofile", None)
+    state.update({
+        "authenticated": True,
+        "is_seeker": user.role == "seeker",
+        "has_applied": Application.objects.filter(job_id=job_id, seeker=user).exists(),
+        "is_saved": SavedJob.objects.filter(job_id=job_id, user=user).exists(),
+        "quick_apply_ready": bool(profile and profile.quick_apply_ready),
+    })
+    cache.set(key, state, USER_STATE_TIMEOUT)
+    return state
@@ -0,0 +1,172 @@
+"""
+Keyset (cursor) pagination.
+
+Instead of OFFSET/COUNT, each page continues after the sort key of the last
+row of the previous page, so page 400 costs the same index range scan as
+page 1. Cursors are opaque URL-safe tokens passed as `?after=...`.
+"""
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import F, Q
+
+
+@dataclass(frozen=True)
+class SortKey:
+    field: str
+    descending: bool = True
+    nullable: bool = False
+
+    def order_expression(self):
+        expr = F(self.field)
+        if self.nullable:
+            return expr.desc(nulls_last=True) if self.descending else expr.asc(nulls_last=True)
+        return expr.desc() if self.descending else expr.asc()
+
+
+def _json_default(value):
+    # Full-precision isoformat: DjangoJSONEncoder truncates microseconds,
+    # which would make the equality half of the keyset predicate miss rows.
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(values: Sequence) -> str:
+    raw = json.dumps(list(values), default=_json_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, model, keys: Sequence[SortKey]) -> Optional[list]:
+    """Returns the decoded key values, or None for a missing/invalid token."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(keys):
+            return None
+        return [
+            None if v is None else model._meta.get_field(k.field).to_python(v)
+            for k, v in zip(keys, values)
+        ]
+    except Exception:
+        return None
+
+
+def _beyond(key: SortKey, value) -> Q:
+    """Rows strictly after `value` for a single key (NULLs sort last)."""
+    if value is None:
+        return Q(pk__in=[])
+    q = Q(**{f"{key.field}__{'lt' if key.descending else 'gt'}": value})
+    if key.nullable:
+        q |= Q(**{f"{key.field}__isnull": True})
+    return q
+
+
+def _equal(key: SortKey, value) -> Q:
+    if value is None:
+        return Q(**{f"{key.field}__isnull": True})
+    return Q(**{key.field: value})
+
+
+def keyset_filter(keys: Sequence[SortKey], values: Sequence) -> Q:
+    """
+    (k1, k2, ...) > (v1, v2, ...) in sort order, expanded so the leading key
+    can use an index: k1 > v1 OR (k1 = v1 AND k2 > v2) OR ...
+    """
+    result = Q(pk__in=[])
+    prefix = Q()
+    for key, value in zip(keys, values):
+        result |= prefix & _beyond(key, value)
+        prefix &= _equal(key, value)
+    return result
+
+
+def approximate_count(queryset, timeout: int = 300) -> Optional[int]:
+    """
+    Cheap total for "~N joburi" labels. Uses the planner estimate on Postgres
+    and a cached exact COUNT elsewhere.
+    """
+    db = queryset.db
+    connection = connections[db]
+    try:
+        sql, params = queryset.order_by().values("pk").query.sql_with_params()
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                return int(plan[0]["Plan"]["Plan Rows"])
+        key = "approx-count:" + hashlib.md5(f"{db}:{sql}:{params!r}".encode()).hexdigest()
+        total = cache.get(key)
+        if total is None:
+            total = queryset.order_by().count()
+            cache.set(key, total, timeout)
+        return total
+    except Exception:
+        return None
+
+
+class KeysetPage:
+    """Minimal stand-in for django.core.paginator.Page used by list templates."""
+
+    def __init__(self, object_list: List, paginator: "KeysetPaginator", cursor: Optional[str], next_cursor: Optional[str]):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.cursor = cursor
+        self.next_cursor = next_cursor
+        self.number = None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    def __init__(self, queryset, per_page: int, keys: Sequence[SortKey], with_total: bool = False):
+        self.keys = list(keys)
+        self.queryset = queryset.order_by(*[k.order_expression() for k in self.keys])
+        self.per_page = int(per_page)
+        self.with_total = with_total
+
+    @property
+    def approximate_count(self) -> Optional[int]:
+        if not self.with_total:
+            return None
+        if not hasattr(self, "_approximate_count"):
+            self._approximate_count = approximate_count(self.queryset)
+        return self._approximate_count
+
+    def get_page(self, cursor: Optional[str]) -> KeysetPage:
+        qs = self.queryset
+        values = decode_cursor(cursor, qs.model, self.keys)
+        if values is None:
+            cursor = None
+        else:
+            qs = qs.filter(keyset_filter(self.keys, values))
+
+        rows = list(qs[: self.per_page + 1])
+        next_cursor = None
+        if len(rows) > self.per_page:
+            rows = rows[: self.per_page]
+            last = rows[-1]
+            next_cursor = encode_cursor([getattr(last, k.field) for k in self.keys])
+        return KeysetPage(rows, self, cursor, next_cursor)
@@ -0,0 +1,104 @@
+"""
+Salary range filtering and the precomputed salary histogram.
+
+A job's salary is the range [salary_min, salary_max]; either end may be
+missing. A "min" filter keeps jobs that can pay at least that much, a "max"
+filter keeps jobs whose offer starts within the budget.
+
+Histogram reads are cached under the listing generation plus a histogram
+generation bumped by every rebuild, so a cached list page costs no query.
+"""
+from collections import defaultdict
+from typing import Optional
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Q, Value
+from django.db.models.functions import Coalesce, Least
+
+from .cache import bump_generation, generation, listing_cache_key
+from .models import Job, SalaryHistogram
+
+BUCKET_WIDTH = 500
+# Everything above the cap lands in the last, open-ended bucket
+BUCKET_CAP = 20000
+HISTOGRAM_TIMEOUT = 15 * 60
+
+
+def parse_salary(value) -> Optional[int]:
+    try:
+        amount = int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+    return amount if amount >= 0 else None
+
+
+def salary_range_q(minimum: Optional[int] = None, maximum: Optional[int] = None) -> Q:
+    q = Q()
+    if minimum is not None:
+        q &= Q(salary_max__gte=minimum) | Q(salary_max__isnull=True, salary_min__gte=minimum)
+    if maximum is not None:
+        q &= Q(salary_min__lte=maximum) | Q(salary_min__isnull=True, salary_max__lte=maximum)
+    return q
+
+
+def salary_in_range(job_min: Optional[int], job_max: Optional[int],
+                    minimum: Optional[int] = None, maximum: Optional[int] = None) -> bool:
+    """Python twin of salary_range_q for a single job (used by saved-search alerts)."""
+    if minimum is not None:
+        if not (job_max is not None and job_max >= minimum or job_max is None and job_min is not None and job_min >= minimum):
+            return False
+    if maximum is not None:
+        if not (job_min is not None and job_min <= maximum or job_min is None and job_max is not None and job_max <= maximum):
+            return False
+    return True
+
+
+def _bucket_bounds(index: int):
+    lower = index * BUCKET_WIDTH
+    upper = None if lower >= BUCKET_CAP else lower + BUCKET_WIDTH
+    return lower, upper
+
+
+def rebuild_histograms() -> int:
+    """
+    Recompute every histogram (per category/city, per category, per city and
+    overall) from one grouped query over public jobs with a salary.
+    """
+    rows = (
+        Job.objects.filter(is_active=True, moderation_status=Job.MOD_APPROVED)
+        .annotate(amount=Coalesce("salary_max", "salary_min"))
+        .filter(amount__isnull=False)
+        # Integer division: bucketing happens in the database
+        .annotate(bucket=Least(F("amount"), Value(BUCKET_CAP)) / Value(BUCKET_WIDTH))
+        .values("category", "city", "bucket")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    histograms = defaultdict(lambda: defaultdict(int))
+    for row in rows:
+        index = row["bucket"]
+        for key in ((row["category"], row["city"]), (row["category"], ""), ("", row["city"]), ("", "")):
+            histograms[key][index] += row["n"]
+
+    objs = []
+    for (category, city), counts in histograms.items():
+        buckets = [[*_bucket_bounds(i), counts[i]] for i in sorted(counts)]
+        objs.append(SalaryHistogram(category=category, city=city, buckets=buckets, total=sum(counts.values())))
+
+    with transaction.atomic():
+        SalaryHistogram.objects.all().delete()
+        SalaryHistogram.objects.bulk_create(objs)
+    bump_generation("salary-histogram")
+    return len(objs)
+
+
+def get_histogram(category: str = "", city: str = "") -> dict:
+    category, city = category or "", city or ""
+    key = listing_cache_key(f"salary-histogram:{generation('salary-histogram')}", (("category", category), ("city", city)))
+    histogram = cache.get(key)
+    if histogram is None:
+        row = SalaryHistogram.objects.filter(category=category, city=city).first()
+        histogram = {"buckets": row.buckets, "total": row.total} if row else {"buckets": [], "total": 0}
+        cache.set(key, histogram, HISTOGRAM_TIMEOUT)
+    return histogram
@@ -0,0 +1,154 @@
+"""
+Full-text search for jobs.
+
+Every Job has a JobSearchDocument row with normalized text (title, company name,
+category/city labels, description). Matching happens in the database:
+- PostgreSQL: generated tsvector column with a GIN index
+- SQLite: FTS5 external-content table kept in sync by triggers
+- anything else: icontains fallback on the document table
+
+Results are ranked by text relevance blended with recency.
+"""
+import re
+import unicodedata
+from typing import Iterable, List
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import F, Q
+from django.db.models.expressions import RawSQL
+
+from .models import Job, JobSearchDocument
+
+DOC_TABLE = JobSearchDocument._meta.db_table
+FTS_TABLE = f"{DOC_TABLE}_fts"
+JOB_TABLE = Job._meta.db_table
+
+# Relevance halves after this many days (recency blend)
+RECENCY_HALF_LIFE_DAYS = getattr(settings, "JOB_SEARCH_RECENCY_DAYS", 30)
+MAX_QUERY_TERMS = 8
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize_text(value: str) -> str:
+    """
+    Lowercase and strip diacritics ("Șofer" -> "sofer") so queries typed
+    without Romanian characters still match.
+    """
+    value = unicodedata.normalize("NFKD", value or "")
+    value = "".join(ch for ch in value if not unicodedata.combining(ch))
+    return value.lower()
+
+
+def tokenize(value: str) -> List[str]:
+    return _TOKEN_RE.findall(normalize_text(value))
+
+
+def build_document(job) -> dict:
+    company = getattr(job, "company", None)
+    body = [
+        getattr(company, "name", "") or "",
+        job.get_category_display() if job.category else "",
+        job.get_city_display() if job.city else "",
+        job.description or "",
+    ]
+    return {
+        "title": normalize_text(job.title),
+        "body": normalize_text("\n".join(p for p in body if p)),
+    }
+
+
+def index_jobs(jobs: Iterable[Job]) -> int:
+    """
+    Upsert search documents for the given jobs. Callers should pass jobs with
+    `company` already loaded (select_related) when indexing in bulk.
+    """
+    docs = [JobSearchDocument(job_id=job.id, **build_document(job)) for job in jobs]
+    if not docs:
+        return 0
+    JobSearchDocument.objects.bulk_create(
+        docs,
+        update_conflicts=True,
+        unique_fields=["job"],
+        update_fields=["title", "body", "updated_at"],
+    )
+    return len(docs)
+
+
+class SearchBackend:
+    """
+    icontains fallback; also the interface the DB-specific backends implement.
+    """
+    vendor = None
+
+    def filter(self, queryset, terms: List[str]):
+        for term in terms:
+            queryset = queryset.filter(
+                Q(search_document__title__contains=term) | Q(search_document__body__contains=term)
+            )
+        return queryset.annotate(search_rank=F("created_at"))
+
+    def order_by_rank(self, queryset):
+        return queryset.order_by("-search_rank", "-id")
+
+
+class PostgresSearchBackend(SearchBackend):
+    vendor = "postgresql"
+
+    def filter(self, queryset, terms):
+        tsquery = " & ".join(f"{t}:*" for t in terms)
+        queryset = queryset.filter(
+            id__in=RawSQL(
+                f"SELECT job_id FROM {DOC_TABLE} WHERE search_vector @@ to_tsquery('simple', %s)",
+                [tsquery],
+            )
+        )
+        return queryset.annotate(
+            search_rank=RawSQL(
+                f"(SELECT ts_rank_cd(d.search_vector, to_tsquery('simple', %s)) FROM {DOC_TABLE} d "
+                f"WHERE d.job_id = {JOB_TABLE}.id) "
+                f"/ (1 + EXTRACT(EPOCH FROM (NOW() - {JOB_TABLE}.created_at)) / 86400.0 / %s)",
+                [tsquery, RECENCY_HALF_LIFE_DAYS],
+            )
+        )
+
+
+class SQLiteSearchBackend(SearchBackend):
+    vendor = "sqlite"
+
+    def filter(self, queryset, terms):
+        match = " ".join(f'"{t}"*' for t in terms)
+        queryset = queryset.filter(
+            id__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match])
+        )
+        # bm25() is lower-is-better; title column weighted 4x the body
+        return queryset.annotate(
+            search_rank=RawSQL(
+                f"(SELECT -bm25({FTS_TABLE}, 4.0, 1.0) FROM {FTS_TABLE} "
+                f"WHERE {FTS_TABLE} MATCH %s AND rowid = {JOB_TABLE}.id) "
+                f"/ (1 + (julianday('now') - julianday({JOB_TABLE}.created_at)) / %s)",
+                [match, RECENCY_HALF_LIFE_DAYS],
+            )
+        )
+
+
+BACKENDS = {b.vendor: b for b in (PostgresSearchBackend, SQLiteSearchBackend)}
+
+
+def get_backend() -> SearchBackend:
+    vendor = getattr(settings, "JOB_SEARCH_BACKEND", None) or connection.vendor
+    return BACKENDS.get(vendor, SearchBackend)()
+
+
+def search_jobs(queryset, query: str, order: bool = True):
+    """
+    Restrict `queryset` to jobs matching `query` and annotate `search_rank`.
+    With order=True results are sorted by rank (best first).
+    """
+    terms = tokenize(query)[:MAX_QUERY_TERMS]
+    if not terms:
+        return queryset
+    backend = get_backend()
+    queryset = backend.filter(queryset, terms)
+    return backend.order_by_rank(queryset) if order else queryset
@@ -0,0 +1,213 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.accounts.models import SeekerProfile
+from apps.applications import counters as application_counters
+from apps.applications.models import Application
+from apps.companies.models import Company
+from . import alerts, fingerprint, search, similarity, sitemap_files
+from .bulk import jobs_bulk_changed
+from .cache import bump_listing_generation
+from .models import Job, JobReport, SavedSearch
+from .moderation import refresh_risk_scores
+from .page_cache import bump_company_pages, invalidate_user_state
+from .tasks import (
+    enqueue_on_commit, percolate_jobs, refresh_similar_jobs, refresh_similar_jobs_batch, send_moderation_notifications,
+)
+
+
+@receiver(post_save, sender=Job)
+def index_job_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    search.index_jobs([instance])
+
+
+@receiver(post_save, sender=Job)
+def fingerprint_job_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    fingerprint.index_jobs([instance])
+
+
+def _similarity_state(job):
+    return tuple(getattr(job, f) for f in similarity.INDEXED_FIELDS)
+
+
+@receiver(pre_save, sender=Job)
+def remember_similarity_state(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or not instance.pk:
+        instance._similarity_state = None
+    elif update_fields is not None and not set(update_fields) & set(similarity.INDEXED_FIELDS):
+        instance._similarity_state = _similarity_state(instance)
+    else:
+        instance._similarity_state = Job.objects.filter(pk=instance.pk).values_list(*similarity.INDEXED_FIELDS).first()
+
+
+@receiver(post_save, sender=Job)
+def refresh_similar_index(sender, instance, raw=False, created=False, **kwargs):
+    # Public jobs get (re)computed neighbours; jobs leaving the public set
+    # are dropped from their neighbours' lists by the same task. Saves that
+    # touch none of the indexed fields (counters, risk score...) skip it.
+    if raw:
+        return
+    if not created and getattr(instance, "_similarity_state", None) == _similarity_state(instance):
+        return
+    enqueue_on_commit(refresh_similar_jobs, instance.id)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+def invalidate_listing_caches(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    bump_listing_generation()
+
+
+@receiver(post_save, sender=Company)
+def reindex_company_jobs(sender, instance, raw=False, created=False, **kwargs):
+    # Company name is part of every job's search document
+    if raw or created:
+        return
+    search.index_jobs(Job.objects.filter(company=instance).select_related("company"))
+
+
+@receiver(post_save, sender=Company)
+def invalidate_company_job_pages(sender, instance, raw=False, created=False, **kwargs):
+    # Cached job detail pages embed the company name
+    if raw or created:
+        return
+    bump_company_pages(instance.id)
+
+
+@receiver(post_save, sender=Job)
+def sync_application_company(sender, instance, raw=False, created=False, **kwargs):
+    # Application.company mirrors job.company; usually matches no rows
+    if raw or created:
+        return
+    moved = Application.objects.filter(job=instance).exclude(company_id=instance.company_id)
+    old_companies = set(moved.values_list("company_id", flat=True).distinct())
+    if not old_companies:
+        return
+    moved.update(company_id=instance.company_id)
+    application_counters.reconcile(old_companies | {instance.company_id})
+
+
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def invalidate_seeker_job_state(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    invalidate_user_state(instance.seeker_id)
+
+
+@receiver(post_save, sender=SeekerProfile)
+def invalidate_seeker_quick_apply_state(sender, instance, raw=False, **kwargs):
+    # quick_apply_ready is part of the cached per-user job state
+    if raw:
+        return
+    invalidate_user_state(instance.user_id)
+
+
+@receiver(jobs_bulk_changed)
+def invalidate_listing_caches_bulk(sender, job_ids, reason, **kwargs):
+    bump_listing_generation()
+
+
+@receiver(jobs_bulk_changed)
+def refresh_similar_index_bulk(sender, job_ids, reason, **kwargs):
+    enqueue_on_commit(refresh_similar_jobs_batch, job_ids)
+
+
+@receiver(jobs_bulk_changed)
+def notify_employers_bulk(sender, job_ids, reason, **kwargs):
+    if reason in ("approved", "rejected"):
+        enqueue_on_commit(send_moderation_notifications, job_ids, reason)
+
+
+@receiver(post_save, sender=JobReport)
+@receiver(post_delete, sender=JobReport)
+def refresh_job_risk(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    refresh_risk_scores([instance.job_id])
+
+
+@receiver(post_save, sender=Job)
+def refresh_job_risk_on_save(sender, instance, raw=False, created=False, update_fields=None, **kwargs):
+    # New pending jobs enter the review queue right away and single
+    # approve()/reject() calls leave it; other partial saves can't change the score
+    if raw:
+        return
+    if not created and update_fields is not None and not {"moderation_status", "flagged_reason"} & set(update_fields):
+        return
+    refresh_risk_scores([instance.id])
+
+
+@receiver(jobs_bulk_changed)
+def refresh_risk_bulk(sender, job_ids, reason, **kwargs):
+    # Moderation decisions refresh their own rows; duplicates held by the scan need it here
+    if reason == "duplicate":
+        refresh_risk_scores(job_ids)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def mark_job_sitemap_dirty(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    sitemap_files.mark_dirty("jobs", [instance.id])
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+def mark_company_sitemap_dirty(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    sitemap_files.mark_dirty("companies", [instance.id])
+
+
+@receiver(jobs_bulk_changed)
+def mark_job_sitemap_dirty_bulk(sender, job_ids, reason, **kwargs):
+    sitemap_files.mark_dirty("jobs", job_ids)
+
+
+def _is_public(is_active, moderation_status) -> bool:
+    return bool(is_active) and moderation_status == Job.MOD_APPROVED
+
+
+@receiver(pre_save, sender=Job)
+def remember_public_state(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or not instance.pk:
+        instance._was_listed = False
+    elif update_fields is not None and not {"is_active", "moderation_status"} & set(update_fields):
+        instance._was_listed = _is_public(instance.is_active, instance.moderation_status)
+    else:
+        old = Job.objects.filter(pk=instance.pk).values_list("is_active", "moderation_status").first()
+        instance._was_listed = _is_public(*old) if old else False
+
+
+@receiver(post_save, sender=Job)
+def percolate_public_job(sender, instance, raw=False, **kwargs):
+    # Only a job that just became public is new to saved searches; edits of a
+    # live listing must not alert searches created after it went up
+    if raw or getattr(instance, "_was_listed", False):
+        return
+    if not _is_public(instance.is_active, instance.moderation_status):
+        return
+    enqueue_on_commit(percolate_jobs, [instance.id])
+
+
+@receiver(jobs_bulk_changed)
+def percolate_approved_jobs(sender, job_ids, reason, **kwargs):
+    if reason == "approved":
+        enqueue_on_commit(percolate_jobs, job_ids)
+
+
+@receiver(post_save, sender=SavedSearch)
+def index_saved_search(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    alerts.index_search(instance)
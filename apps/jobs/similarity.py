@@ -0,0 +1,228 @@
+"""
+Similar-jobs index.
+
+Jobs are embedded as hashed TF-IDF vectors over title + description (title
+terms weighted higher), compared by cosine similarity with small boosts for
+a shared category/city. The top neighbours of each job are stored in
+SimilarJobs so JobDetailView only reads a precomputed list.
+
+- rebuild_index(): full rebuild over the recent public corpus, block by block
+- refresh_job(job_id) / refresh_public_jobs(job_ids): incremental update
+  when jobs are created/approved, also merging them into their neighbours'
+  lists; one candidate corpus per block of jobs
+- refresh_neighbors_of(job_ids): strip jobs which left the public set
+  (expired, rejected) from the stored lists, without recomputing them; the
+  periodic rebuild_index() refills the shortened lists
+- refresh_jobs(job_ids): either of the above, for bulk changes
+"""
+import zlib
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+
+from .models import Job, SimilarJobs
+from .search import tokenize
+
+DIMENSIONS = getattr(settings, "SIMILAR_JOBS_DIMENSIONS", 1024)
+CORPUS_LIMIT = getattr(settings, "SIMILAR_JOBS_CORPUS_LIMIT", 10000)
+CANDIDATE_LIMIT = getattr(settings, "SIMILAR_JOBS_CANDIDATE_LIMIT", 2000)
+TOP_N = 8
+BLOCK_SIZE = 256
+TITLE_WEIGHT = 3.0
+CATEGORY_BOOST = 0.15
+CITY_BOOST = 0.10
+# Neighbour lists updated when a new job is merged in incrementally
+REVERSE_UPDATE_LIMIT = 50
+# A Job save only touches the index when one of these changed
+INDEXED_FIELDS = ("title", "description", "category", "city", "is_active", "moderation_status")
+
+STOPWORDS = {
+    "si", "sau", "de", "la", "in", "cu", "pe", "din", "pentru", "un", "o", "al", "ale",
+    "the", "and", "for", "with", "job", "post", "angajam",
+}
+
+
+def public_jobs():
+    return Job.objects.filter(is_active=True, moderation_status=Job.MOD_APPROVED)
+
+
+def _terms(text: str) -> List[str]:
+    return [t for t in tokenize(text) if len(t) > 2 and t not in STOPWORDS and not t.isdigit()]
+
+
+def _bucket(term: str) -> int:
+    # crc32 is stable across processes (unlike hash())
+    return zlib.crc32(term.encode()) % DIMENSIONS
+
+
+def _term_frequencies(rows: Sequence[dict]) -> np.ndarray:
+    tf = np.zeros((len(rows), DIMENSIONS), dtype=np.float32)
+    for i, row in enumerate(rows):
+        for term in _terms(row["title"]):
+            tf[i, _bucket(term)] += TITLE_WEIGHT
+        for term in _terms(row["description"]):
+            tf[i, _bucket(term)] += 1.0
+    return np.log1p(tf, out=tf)
+
+
+class Corpus:
+    """Vectorized job set: L2-normalized TF-IDF rows plus category/city codes."""
+
+    def __init__(self, rows: Sequence[dict]):
+        self.ids = np.array([r["id"] for r in rows], dtype=np.int64)
+        self.index = {int(pk): i for i, pk in enumerate(self.ids)}
+        tf = _term_frequencies(rows)
+        df = np.count_nonzero(tf, axis=0)
+        self.idf = (np.log((1 + len(rows)) / (1 + df)) + 1).astype(np.float32)
+        self.matrix = self.normalize(tf * self.idf)
+        self.categories = np.array([r["category"] for r in rows], dtype=object)
+        self.cities = np.array([r["city"] for r in rows], dtype=object)
+
+    @staticmethod
+    def normalize(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def __len__(self):
+        return len(self.ids)
+
+    def scores(self, rows: slice) -> np.ndarray:
+        """Similarity of corpus rows `rows` against the whole corpus, self excluded."""
+        sim = self.matrix[rows] @ self.matrix.T
+        sim += CATEGORY_BOOST * (self.categories[rows][:, None] == self.categories[None, :])
+        sim += CITY_BOOST * (self.cities[rows][:, None] == self.cities[None, :])
+        positions = np.arange(len(self))[rows]
+        sim[np.arange(len(positions)), positions] = -np.inf
+        return sim
+
+    def top(self, sim_row: np.ndarray, n: int = TOP_N) -> List[List]:
+        n = min(n, len(sim_row) - 1)
+        if n <= 0:
+            return []
+        best = np.argpartition(-sim_row, n - 1)[:n]
+        best = best[np.argsort(-sim_row[best])]
+        return [[int(self.ids[i]), round(float(sim_row[i]), 4)] for i in best if np.isfinite(sim_row[i]) and sim_row[i] > 0]
+
+
+def _load_rows(queryset, limit: int) -> List[dict]:
+    return list(
+        queryset.order_by("-created_at", "-id").values("id", "title", "description", "category", "city")[:limit]
+    )
+
+
+def _save(neighbors: Dict[int, List[List]]) -> None:
+    SimilarJobs.objects.bulk_create(
+        [SimilarJobs(job_id=pk, neighbors=items) for pk, items in neighbors.items()],
+        update_conflicts=True,
+        unique_fields=["job"],
+        update_fields=["neighbors", "computed_at"],
+    )
+
+
+def rebuild_index(limit: int = CORPUS_LIMIT) -> int:
+    """Recompute neighbour lists for the `limit` most recent public jobs."""
+    corpus = Corpus(_load_rows(public_jobs(), limit))
+    for start in range(0, len(corpus), BLOCK_SIZE):
+        block = slice(start, min(start + BLOCK_SIZE, len(corpus)))
+        sim = corpus.scores(block)
+        _save({int(corpus.ids[start + i]): corpus.top(row) for i, row in enumerate(sim)})
+    return len(corpus)
+
+
+def _candidate_corpus(jobs: List[dict]) -> Corpus:
+    # Bounded pool around the jobs: same category or city, most recent first;
+    # the jobs themselves go last so they form one contiguous block
+    ids = [r["id"] for r in jobs]
+    pool = (
+        public_jobs().filter(category__in={r["category"] for r in jobs})
+        | public_jobs().filter(city__in={r["city"] for r in jobs})
+    )
+    return Corpus(_load_rows(pool.exclude(id__in=ids), CANDIDATE_LIMIT) + list(jobs))
+
+
+def _merge_into_neighbors(additions: Dict[int, List[List]], updates: Dict[int, List[List]]) -> None:
+    """Add {neighbour_id: [[job_id, score], ...]} to the stored lists, keeping the best TOP_N."""
+    existing = SimilarJobs.objects.select_for_update().in_bulk(list(additions))
+    for pk, items in additions.items():
+        added = {job_id for job_id, _ in items}
+        row = existing.get(pk)
+        current = [item for item in (updates.get(pk) or (row.neighbors if row else [])) if item[0] not in added]
+        merged = sorted(current + items, key=lambda item: -item[1])[:TOP_N]
+        if row is None or merged != row.neighbors:
+            updates[pk] = merged
+
+
+def refresh_public_jobs(job_ids: Iterable[int]) -> None:
+    """
+    Compute the neighbours of public jobs and merge them into the lists of
+    their closest neighbours, one candidate corpus per BLOCK_SIZE jobs.
+    """
+    job_ids = list(job_ids)
+    rows = _load_rows(public_jobs().filter(id__in=job_ids), len(job_ids))
+    for start in range(0, len(rows), BLOCK_SIZE):
+        block = rows[start:start + BLOCK_SIZE]
+        ids = {r["id"] for r in block}
+        corpus = _candidate_corpus(block)
+        offset = len(corpus) - len(block)
+        sim = corpus.scores(slice(offset, len(corpus)))
+        updates: Dict[int, List[List]] = {}
+        reverse: Dict[int, List[List]] = defaultdict(list)
+        for i, row in enumerate(sim):
+            pk = int(corpus.ids[offset + i])
+            updates[pk] = corpus.top(row)
+            for other, score in corpus.top(row, REVERSE_UPDATE_LIMIT):
+                if other not in ids:
+                    reverse[other].append([pk, score])
+        with transaction.atomic():
+            _merge_into_neighbors(reverse, updates)
+            _save(updates)
+
+
+def refresh_job(job_id: int) -> None:
+    """One job: recomputed if public, dropped from the index otherwise."""
+    refresh_jobs([job_id])
+
+
+def refresh_neighbors_of(job_ids: Iterable[int]) -> None:
+    """
+    Jobs in `job_ids` left the public set: drop their entries and remove them
+    from the lists of their neighbours (similarity is symmetric, so those are
+    the lists that contain them). Lists pointing at them from elsewhere are
+    filtered on read and cleaned up by the next rebuild_index().
+    """
+    removed = set(job_ids)
+    if not removed:
+        return
+    with transaction.atomic():
+        affected = set()
+        for neighbors in SimilarJobs.objects.filter(job_id__in=removed).values_list("neighbors", flat=True):
+            affected.update(pk for pk, _ in neighbors)
+        SimilarJobs.objects.filter(job_id__in=removed).delete()
+        updates = {}
+        for entry in SimilarJobs.objects.select_for_update().filter(job_id__in=affected - removed):
+            kept = [item for item in entry.neighbors if item[0] not in removed]
+            if kept != entry.neighbors:
+                updates[entry.job_id] = kept
+        _save(updates)
+
+
+def refresh_jobs(job_ids: Iterable[int]) -> None:
+    """Batch entry point for bulk changes (expiry, bulk moderation)."""
+    job_ids = set(job_ids)
+    public = set(public_jobs().filter(id__in=job_ids).values_list("id", flat=True))
+    refresh_neighbors_of(job_ids - public)
+    refresh_public_jobs(public)
+
+
+def get_similar_jobs(job: Job, limit: int = 4) -> List[Job]:
+    """Read path for JobDetailView: stored list, hydrated, non-public jobs skipped."""
+    entry = SimilarJobs.objects.filter(job_id=job.id).values_list("neighbors", flat=True).first()
+    if not entry:
+        return []
+    ids = [pk for pk, _ in entry]
+    by_id = public_jobs().select_related("company").in_bulk(ids)
+    return [by_id[pk] for pk in ids if pk in by_id][:limit]
@@ -0,0 +1,146 @@
+"""
+Static, sharded sitemaps.
+
+Each section (jobs, companies) is split into shards by fixed id ranges of
+SHARD_SIZE ids, so a shard never holds more than 50k URLs and a changed row
+always maps to the same shard. Shards are streamed from a (slug, lastmod)
+projection into gzip files under SITEMAP_ROOT, next to a sitemap.xml index;
+requests only ever read those files.
+
+Row changes mark their shard dirty (apps/jobs/signals.py); `build()` rebuilds
+the dirty shards (or all of them with full=True) and rewrites the index.
+"""
+import gzip
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.companies.sitemaps import CompanySitemap
+from .models import SitemapShard
+from .sitemaps import JobSitemap
+
+SHARD_SIZE = 50000
+SITEMAP_ROOT = Path(getattr(settings, "SITEMAP_ROOT", settings.BASE_DIR / "sitemaps"))
+SITE_URL = getattr(settings, "SITE_URL", "http://localhost:8000").rstrip("/")
+INDEX_NAME = "sitemap.xml"
+SHARD_URL_PREFIX = "/sitemaps/"
+SHARD_NAME_RE = re.compile(r"[a-z]+-\d+\.xml\.gz")
+
+_XMLNS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+_SLUG_PLACEHOLDER = "sitemap-slug-placeholder"
+
+
+def get_sections() -> Dict[str, object]:
+    return {sitemap.section: sitemap for sitemap in (JobSitemap(), CompanySitemap())}
+
+
+def shard_filename(section: str, number: int) -> str:
+    return f"{section}-{number}.xml.gz"
+
+
+def mark_dirty(section: str, ids: Iterable[int]) -> None:
+    numbers = {pk // SHARD_SIZE for pk in ids if pk}
+    if not numbers:
+        return
+    SitemapShard.objects.bulk_create(
+        [SitemapShard(section=section, number=n, dirty=True) for n in numbers],
+        update_conflicts=True,
+        unique_fields=["section", "number"],
+        update_fields=["dirty"],
+    )
+
+
+def _write_atomic(path: Path, write) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def build_shard(sitemap, number: int) -> int:
+    """Stream one shard to disk; returns its URL count (empty shards are removed)."""
+    SITEMAP_ROOT.mkdir(parents=True, exist_ok=True)
+    path = SITEMAP_ROOT / shard_filename(sitemap.section, number)
+    # Resolve the URL pattern once instead of reverse() per row
+    template = SITE_URL + sitemap.location({"slug": _SLUG_PLACEHOLDER})
+    tail = f"<changefreq>{sitemap.changefreq}</changefreq><priority>{sitemap.priority}</priority></url>\n"
+    rows = sitemap.shard_rows(number * SHARD_SIZE, (number + 1) * SHARD_SIZE)
+    count = 0
+
+    def write(tmp):
+        nonlocal count
+        with gzip.open(tmp, "wt", encoding="utf-8") as out:
+            out.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{_XMLNS}">\n')
+            for slug, lastmod in rows.iterator(chunk_size=2000):
+                loc = escape(template.replace(_SLUG_PLACEHOLDER, slug))
+                out.write(f"<url><loc>{loc}</loc><lastmod>{lastmod:%Y-%m-%d}</lastmod>{tail}")
+                count += 1
+            out.write("</urlset>\n")
+
+    _write_atomic(path, write)
+    if not count:
+        path.unlink()
+    SitemapShard.objects.update_or_create(
+        section=sitemap.section, number=number,
+        defaults={"url_count": count, "built_at": timezone.now()},
+    )
+    return count
+
+
+def _claim_dirty(section: str):
+    # Clear the flag before building: rows changing mid-build mark it again
+    with transaction.atomic():
+        numbers = list(
+            SitemapShard.objects.select_for_update()
+            .filter(section=section, dirty=True).values_list("number", flat=True)
+        )
+        SitemapShard.objects.filter(section=section, number__in=numbers).update(dirty=False)
+    return numbers
+
+
+def write_index() -> int:
+    shards = list(SitemapShard.objects.filter(url_count__gt=0).order_by("section", "number"))
+    SITEMAP_ROOT.mkdir(parents=True, exist_ok=True)
+
+    def write(tmp):
+        with open(tmp, "w", encoding="utf-8") as out:
+            out.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="{_XMLNS}">\n')
+            for shard in shards:
+                loc = escape(f"{SITE_URL}{SHARD_URL_PREFIX}{shard_filename(shard.section, shard.number)}")
+                out.write(f"<sitemap><loc>{loc}</loc><lastmod>{shard.built_at:%Y-%m-%d}</lastmod></sitemap>\n")
+            out.write("</sitemapindex>\n")
+
+    _write_atomic(SITEMAP_ROOT / INDEX_NAME, write)
+    return len(shards)
+
+
+def build(full: bool = False, sections: Optional[Iterable[str]] = None, progress=None) -> dict:
+    """
+    Rebuild dirty shards (all shards with `full`) and the index.
+    Returns {"shards": n, "urls": n, "index_entries": n}.
+    """
+    stats = {"shards": 0, "urls": 0, "index_entries": 0}
+    available = get_sections()
+    for name in sections or available:
+        sitemap = available[name]
+        if full:
+            last = sitemap.max_id() // SHARD_SIZE
+            numbers = list(range(last + 1))
+            for stale in SitemapShard.objects.filter(section=name, number__gt=last):
+                (SITEMAP_ROOT / shard_filename(name, stale.number)).unlink(missing_ok=True)
+                stale.delete()
+            SitemapShard.objects.filter(section=name).update(dirty=False)
+        else:
+            numbers = _claim_dirty(name)
+        for number in numbers:
+            stats["urls"] += build_shard(sitemap, number)
+            stats["shards"] += 1
+            if progress:
+                progress(name, number, stats)
+    stats["index_entries"] = write_index()
+    return stats
@@ -1,23 +1,36 @@
 from django.contrib.sitemaps import Sitemap
+from django.db.models import Max
 from django.urls import reverse
-from .models import Job
+from .models import Job, PUBLIC_JOB_CONDITION
 
 
 class JobSitemap(Sitemap):
+    """
+    Public jobs only, as (slug, updated_at) projections. Served from the
+    static shards written by apps.jobs.sitemap_files; `section`/`shard_rows`
+    are the hooks used there.
+    """
     changefreq = "daily"
     priority = 0.7
+    section = "jobs"
+
+    def public_jobs(self):
+        return Job.objects.filter(PUBLIC_JOB_CONDITION)
 
     def items(self):
-        qs = Job.objects.select_related("company")
-        if "is_active" in {f.name for f in Job._meta.get_fields()}:
-            qs = qs.filter(is_active=True)
-        return qs
+        return self.public_jobs().order_by("id").values("slug", "updated_at")
+
+    def shard_rows(self, first_id: int, last_id: int):
+        return (
+            self.public_jobs().filter(id__gte=first_id, id__lt=last_id)
+            .order_by("id").values_list("slug", "updated_at")
+        )
+
+    def max_id(self) -> int:
+        return self.public_jobs().aggregate(m=Max("id"))["m"] or 0
 
     def lastmod(self, obj):
-        return getattr(obj, "updated_at", getattr(obj, "created_at", None))
+        return obj["updated_at"]
 
     def location(self, obj):
-        try:
-            return obj.get_absolute_url()
-        except Exception:
-            return reverse("jobs:detail", kwargs={"slug": obj.slug})
\ No newline at end of file
+        return reverse("jobs:detail", kwargs={"slug": obj["slug"]})
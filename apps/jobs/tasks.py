@@ -1,36 +1,134 @@
+import logging
+from collections import defaultdict
+
 from celery import shared_task
 from django.conf import settings
-from django.core.mail import send_mail
+from django.db import transaction
+from django.core.mail import EmailMessage, get_connection
 from django.template.loader import render_to_string
-from django.contrib.auth import get_user_model
-from apps.jobs.models import SavedJob
+from apps.jobs import alerts, digest, expiry, moderation, salary, similarity, sitemap_files
+from apps.jobs.models import Job
 
-User = get_user_model()
+logger = logging.getLogger(__name__)
 
-@shared_task
-def send_saved_jobs_digest(frequency="daily"):
-    # Very basic digest: all users who have saved jobs get a summary
-    users = (
-        User.objects.filter(saved_jobs__isnull=False)
-        .distinct()
-        .prefetch_related("saved_jobs__job", "saved_jobs__job__company")
-    )
-    for user in users:
-        saved = list(SavedJob.objects.filter(user=user).select_related("job", "job__company")[:20])
-        if not saved:
-            continue
-        ctx = {"user": user, "saved": saved, "frequency": frequency}
-        body = render_to_string("emails/saved_jobs_digest.txt", ctx)
+
+def enqueue_on_commit(task, *args):
+    """
+    Queue `task` once the current transaction commits. Broker outages are
+    logged instead of failing the request that triggered the work.
+    """
+    def _send():
         try:
-            send_mail(
-                subject=f"[Rezumat joburi salvate] {frequency}",
-                message=body,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[user.email] if user.email else [],
-                fail_silently=True,
-            )
+            task.delay(*args)
         except Exception:
-            pass
+            logger.exception("Could not enqueue %s%r", task.name, args)
+    transaction.on_commit(_send)
+
+@shared_task
+def send_saved_jobs_digest(frequency="daily"):
+    """Fan out the digest: one send_saved_jobs_digest_chunk subtask per chunk of recipients."""
+    chunks = 0
+    for user_ids in digest.recipient_chunks():
+        send_saved_jobs_digest_chunk.delay(user_ids, frequency)
+        chunks += 1
+    logger.info("saved jobs digest frequency=%s chunks=%s", frequency, chunks)
+    return chunks
+
+
+@shared_task
+def send_saved_jobs_digest_chunk(user_ids, frequency="daily"):
+    return digest.send_digest_chunk(user_ids, frequency)
+
+@shared_task
+def notify_saved_jobs(frequency="instant"):
+    """Saved-search alerts: one send_saved_search_alerts_chunk subtask per chunk of users."""
+    chunks = 0
+    for user_ids in alerts.recipient_chunks(frequency):
+        send_saved_search_alerts_chunk.delay(user_ids, frequency)
+        chunks += 1
+    return chunks
+
+
+@shared_task
+def send_saved_search_alerts_chunk(user_ids, frequency="instant"):
+    return alerts.send_alert_chunk(user_ids, frequency)
+
+
+@shared_task
+def percolate_jobs(job_ids):
+    return alerts.percolate_jobs(job_ids)
+
+
+@shared_task
+def refresh_similar_jobs(job_id: int):
+    similarity.refresh_job(job_id)
+
 
-def notify_saved_jobs():
-    qs = User.objects.filter(saved_jobs__isnull=False).distinct()
+@shared_task
+def refresh_similar_jobs_batch(job_ids):
+    similarity.refresh_jobs(job_ids)
+
+
+@shared_task
+def rebuild_similar_jobs_index():
+    return similarity.rebuild_index()
+
+
+@shared_task
+def refresh_salary_histograms():
+    return salary.rebuild_histograms()
+
+
+@shared_task
+def expire_jobs_task(batch_size: int = expiry.DEFAULT_BATCH_SIZE):
+    return expiry.expire_jobs(batch_size=batch_size)
+
+
+@shared_task
+def moderate_job(job_id: int):
+    return moderation.moderate_job(job_id)
+
+
+@shared_task
+def bulk_moderate_jobs(token: str, job_ids, action: str, reason: str = ""):
+    """Background path for large admin selections; progress is readable via moderation.get_progress(token)."""
+    moderation.set_progress(token, "running", {"action": action, "total": len(job_ids), "done": 0, "changed": 0})
+    try:
+        stats = moderation.bulk_moderate(
+            job_ids, action, reason=reason,
+            progress=lambda stats: moderation.set_progress(token, "running", stats),
+        )
+    except Exception:
+        moderation.set_progress(token, "failed")
+        raise
+    moderation.set_progress(token, "done", stats)
+    return stats
+
+
+@shared_task
+def send_moderation_notifications(job_ids, outcome: str):
+    """One email per employer listing their jobs that were approved/rejected in bulk."""
+    jobs = Job.objects.filter(id__in=job_ids).select_related("created_by").order_by("created_by_id", "id")
+    by_user = defaultdict(list)
+    for job in jobs:
+        if job.created_by.email:
+            by_user[job.created_by].append(job)
+    messages = [
+        EmailMessage(
+            subject=f"[Moderare] {len(user_jobs)} anunț(uri) {'aprobate' if outcome == 'approved' else 'respinse'}",
+            body=render_to_string("emails/jobs_moderated.txt", {"user": user, "jobs": user_jobs, "outcome": outcome}),
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[user.email],
+        )
+        for user, user_jobs in by_user.items()
+    ]
+    if messages:
+        # One SMTP connection for the whole batch
+        with get_connection(fail_silently=True) as connection:
+            connection.send_messages(messages)
+    return len(messages)
+
+
+@shared_task
+def build_sitemaps(full: bool = False):
+    return sitemap_files.build(full=full)
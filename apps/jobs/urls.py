@@ -1,5 +1,8 @@
 from django.urls import path
-from .views import JobListView, JobDetailView, JobCreateView, job_update, save_job, unsave_job, report_job
+from .views import (
+    JobListView, JobDetailView, JobCreateView, job_update, save_job, unsave_job, report_job, job_user_state,
+    moderation_queue, moderation_queue_action, save_search, saved_searches, delete_saved_search,
+)
 
 
 app_name = "jobs"
@@ -7,9 +10,15 @@ app_name = "jobs"
 urlpatterns = [
     path("", JobListView.as_view(), name="list"),
     path("new/", JobCreateView.as_view(), name="create"),
+    path("searches/", saved_searches, name="saved_searches"),
+    path("searches/save/", save_search, name="save_search"),
+    path("searches/<int:pk>/delete/", delete_saved_search, name="delete_saved_search"),
+    path("moderation/", moderation_queue, name="moderation_queue"),
+    path("moderation/action/", moderation_queue_action, name="moderation_queue_action"),
     path("<slug:slug>/save/", save_job, name="save"),
     path("<slug:slug>/unsave/", unsave_job, name="unsave"),
     path("<slug:slug>/report/", report_job, name="report"),
     path("<slug:slug>/edit/", job_update, name="edit"),
+    path("<slug:slug>/state/", job_user_state, name="user_state"),
     path("<slug:slug>/", JobDetailView.as_view(), name="detail"),
 ]
\ No newline at end of file
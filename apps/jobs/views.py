@@ -1,39 +1,64 @@
 from django.contrib import messages
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Paginator
-from django.http import HttpResponseForbidden
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.paginator import Page, Paginator
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseForbidden, JsonResponse
 from django.shortcuts import render, get_object_or_404, redirect
+from django.views.decorators.http import require_POST
 from django.views.generic import ListView, DetailView, CreateView, UpdateView
 from django_filters.views import FilterView
 from apps.accounts.decorators import employer_required, EmployerRequiredMixin, role_required
 from apps.companies.models import Company
 from .forms import JobForm
-from .models import Job, SavedJob, JobReport
+from .models import CATEGORIES, CITIES, Job, SavedJob, SavedSearch, JobReport
 from .filters import JobFilter
-from django.utils import timezone
-from datetime import timedelta
+from .cache import TRUTHY, canonical_params, listing_cache_key
+from .facets import FACET_PARAMS, build_facets
+from .page_cache import (
+    DETAIL_PAGE_TIMEOUT, can_serve_cached, detail_page_key, fill_shell, get_user_job_state, invalidate_user_state,
+)
+from .pagination import KeysetPage, KeysetPaginator, SortKey
+from .salary import BUCKET_WIDTH, get_histogram, parse_salary, salary_range_q
+from .search import search_jobs
+from .moderation import BULK_ACTIONS, FLAG_WEIGHTS, bulk_moderate, review_queue
+from .tasks import enqueue_on_commit, moderate_job
+from .similarity import get_similar_jobs
+from .sitemap_files import INDEX_NAME, SHARD_NAME_RE, SITEMAP_ROOT
 from django.utils.decorators import method_decorator
 from apps.accounts.decorators import rate_limit
-import re
 from django.core.mail import send_mail
 from django.conf import settings
 from apps.analytics.utils import log_event
-from django.db.models import Q
+from django.db.models import F
 from apps.applications.models import Application
 
-PROFANITY_WORDS = {"fuck", "shit", "spam", "escroc", "teapa", "teapă"}
+KEYSET_SORTS = {
+    "new": [SortKey("created_at"), SortKey("id")],
+    "newest": [SortKey("created_at"), SortKey("id")],
+    "salary": [SortKey("salary_max", nullable=True), SortKey("id")],
+    "salary_desc": [SortKey("salary_max", nullable=True), SortKey("id")],
+}
+
+
+RESULT_CACHE_PARAMS = FACET_PARAMS + ("sort", "page", "after")
+RESULT_CACHE_TIMEOUT = 5 * 60
+
 
 class JobListView(FilterView, ListView):
     model = Job
     paginate_by = 20
+    keyset_with_total = True
     template_name = "jobs/job_list.html"
     context_object_name = "jobs"
     filterset_class = JobFilter
 
     def get_queryset(self):
-        qs = super().get_queryset().select_related("company")
-        params = self.request.GET
+        return self.filter_jobs(super().get_queryset().select_related("company"), self.request.GET)
 
+    def filter_jobs(self, qs, params):
+        """Apply the list filters in `params` to `qs` and set self.sort."""
         # Field presence checks
         fields = {f.name for f in Job._meta.get_fields()}
         has_is_active = "is_active" in fields
@@ -51,13 +76,10 @@ class JobListView(FilterView, ListView):
         if has_moderation:
             qs = qs.filter(moderation_status=getattr(Job, "MOD_APPROVED", "approved"))
 
-        # Search
+        # Search (full-text index, see apps/jobs/search.py)
         q = (params.get("q") or "").strip()
         if q:
-            q_filter = Q(title__icontains=q) | Q(description__icontains=q)
-            if "company" in fields:
-                q_filter = q_filter | Q(company__name__icontains=q)
-            qs = qs.filter(q_filter)
+            qs = search_jobs(qs, q, order=False)
 
         # Location
         loc = (params.get("loc") or "").strip()
@@ -67,6 +89,14 @@ class JobListView(FilterView, ListView):
             elif has_city:
                 qs = qs.filter(city__icontains=loc)
 
+        # Category / city (exact, driven by the facet sidebar)
+        category = (params.get("category") or "").strip()
+        if category:
+            qs = qs.filter(category=category)
+        city = (params.get("city") or "").strip()
+        if city and has_city:
+            qs = qs.filter(city=city)
+
         # Employment type
         emp = (params.get("employment_type") or "").strip()
         if emp and has_employment_type:
@@ -85,20 +115,89 @@ class JobListView(FilterView, ListView):
             elif has_salary_min:
                 qs = qs.filter(salary_min__isnull=False)
 
-        # Sorting
-        sort = (params.get("sort") or "new").strip()
-        if sort == "salary":
+        # Salary range
+        salary_q = salary_range_q(parse_salary(params.get("salary_min")), parse_salary(params.get("salary_max")))
+        if salary_q:
+            qs = qs.filter(salary_q)
+
+        # Sorting: searches default to relevance, browsing to newest
+        sort = (params.get("sort") or ("relevance" if q else "new")).strip()
+        if sort == "relevance" and "search_rank" in qs.query.annotations:
+            qs = qs.order_by("-search_rank", "-id")
+        elif sort == "salary":
+            # NULLS LAST like the keyset path (SortKey nullable) and the salary indexes
             if has_salary_max:
-                qs = qs.order_by("-salary_max", "-id")
+                qs = qs.order_by(F("salary_max").desc(nulls_last=True), "-id")
             elif has_salary_min:
-                qs = qs.order_by("-salary_min", "-id")
+                qs = qs.order_by(F("salary_min").desc(nulls_last=True), "-id")
             else:
                 qs = qs.order_by("-id")
         else:
             qs = qs.order_by("-created_at" if "created_at" in fields else "-id")
+        self.sort = sort
 
         return qs
 
+    def facet_queryset(self, params):
+        """Jobs matching `params` (view and JobFilter filters), for facets that drop their own param."""
+        sort = getattr(self, "sort", None)
+        qs = self.filter_jobs(Job.objects.all(), params)
+        self.sort = sort
+        return self.filterset_class(params, queryset=qs).qs
+
+    def get_keyset_keys(self):
+        """
+        Sort keys for cursor pagination, or None when the current sort needs
+        classic page numbers (relevance ranking, explicit ?page=N links).
+        """
+        if "page" in self.request.GET:
+            return None
+        return KEYSET_SORTS.get(getattr(self, "sort", "new"))
+
+    def paginate_queryset(self, queryset, page_size):
+        """
+        Serve the page from the result cache when possible: the cache holds
+        only the page's job IDs and totals, so a hit is one pk lookup.
+        """
+        canonical = canonical_params(self.request.GET, RESULT_CACHE_PARAMS) + (("per_page", str(page_size)),)
+        key = listing_cache_key("page", canonical)
+        cached = cache.get(key)
+        if cached is not None:
+            return self._paginate_from_cache(queryset, page_size, cached)
+
+        paginator, page, object_list, is_paginated = self._paginate(queryset, page_size)
+        keyset = isinstance(page, KeysetPage)
+        cache.set(key, {
+            "ids": [obj.pk for obj in object_list],
+            "keyset": keyset,
+            "count": paginator.approximate_count if keyset else paginator.count,
+            "number": page.number,
+            "cursor": getattr(page, "cursor", None),
+            "next_cursor": getattr(page, "next_cursor", None),
+        }, RESULT_CACHE_TIMEOUT)
+        return paginator, page, object_list, is_paginated
+
+    def _paginate(self, queryset, page_size):
+        keys = self.get_keyset_keys()
+        if keys is None:
+            return super().paginate_queryset(queryset, page_size)
+        paginator = KeysetPaginator(queryset, page_size, keys, with_total=self.keyset_with_total)
+        page = paginator.get_page(self.request.GET.get("after"))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def _paginate_from_cache(self, queryset, page_size, cached):
+        by_id = Job.objects.select_related("company").in_bulk(cached["ids"])
+        jobs = [by_id[pk] for pk in cached["ids"] if pk in by_id]
+        if cached["keyset"]:
+            paginator = KeysetPaginator(queryset, page_size, self.get_keyset_keys(), with_total=self.keyset_with_total)
+            paginator._approximate_count = cached["count"]
+            page = KeysetPage(jobs, paginator, cached["cursor"], cached["next_cursor"])
+        else:
+            paginator = Paginator(queryset, page_size, allow_empty_first_page=self.get_allow_empty())
+            paginator.__dict__["count"] = cached["count"]  # pre-fill cached_property: no COUNT(*)
+            page = Page(jobs, cached["number"], paginator)
+        return paginator, page, jobs, page.has_other_pages()
+
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
         params = self.request.GET.copy()
@@ -106,15 +205,20 @@ class JobListView(FilterView, ListView):
         # Build querystring without page for pagination persistence
         params_without_page = params.copy()
         params_without_page.pop("page", None)
+        params_without_page.pop("after", None)
         querystring = params_without_page.urlencode()
 
         # Active filters for chips
         active_filters = {}
         if params.get("q"): active_filters["q"] = params.get("q")
         if params.get("loc"): active_filters["loc"] = params.get("loc")
+        if params.get("category"): active_filters["category"] = params.get("category")
+        if params.get("city"): active_filters["city"] = params.get("city")
         if params.get("employment_type"): active_filters["employment_type"] = params.get("employment_type")
         if params.get("work_type"): active_filters["work_type"] = params.get("work_type")
         if params.get("has_salary") in ("1", "true", "on", "yes"): active_filters["has_salary"] = "1"
+        if parse_salary(params.get("salary_min")) is not None: active_filters["salary_min"] = params.get("salary_min")
+        if parse_salary(params.get("salary_max")) is not None: active_filters["salary_max"] = params.get("salary_max")
         if params.get("sort") and params.get("sort") != "new": active_filters["sort"] = params.get("sort")
 
         # Remove-links (URL for current list without that param)
@@ -123,6 +227,7 @@ class JobListView(FilterView, ListView):
             p = params.copy()
             p.pop(key, None)
             p.pop("page", None)
+            p.pop("after", None)
             remove_links[key] = f"?{p.urlencode()}" if p else "?"
 
         # Choices for selects (if fields exist with choices)
@@ -138,10 +243,27 @@ class JobListView(FilterView, ListView):
             "querystring": querystring,
             "active_filters": active_filters,
             "remove_links": remove_links,
+            "filter_chips": [{"value": value, "url": remove_links[key]} for key, value in active_filters.items()],
             "employment_type_choices": field_choices("employment_type"),
             "work_type_choices": field_choices("work_type"),
         })
 
+        # Sidebar facet counts under the current filters (cached, see facets.py)
+        ctx["facets"] = build_facets(self.object_list, params, self.facet_queryset)
+        # Salary sidebar: histogram bars scaled to the fullest bucket, inputs step by bucket
+        histogram = get_histogram(params.get("category", ""), params.get("city", ""))
+        ctx["salary_histogram"] = histogram
+        ctx["salary_peak"] = max((count for _, _, count in histogram["buckets"]), default=0)
+        ctx["salary_step"] = BUCKET_WIDTH
+
+        # Cursor pagination: "next" link keeps current filters
+        page_obj = ctx.get("page_obj")
+        next_cursor = getattr(page_obj, "next_cursor", None)
+        ctx["next_page_url"] = ""
+        if next_cursor:
+            ctx["next_page_url"] = f"?{querystring}&after={next_cursor}" if querystring else f"?after={next_cursor}"
+        ctx["approx_total"] = getattr(ctx.get("paginator"), "approximate_count", None)
+
         profile = None
         quick_apply_ready = False
         if self.request.user.is_authenticated:
@@ -157,11 +279,38 @@ class JobDetailView(DetailView):
     template_name = "jobs/job_detail.html"
     slug_field = "slug"
     slug_url_kwarg = "slug"
+    page_shell = False
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("company")
 
     def get(self, request, *args, **kwargs):
-        response = super().get(request, *args, **kwargs)
+        # Cheap lookup for the cache key; the full object is loaded only on a miss
+        meta = (
+            Job.objects.filter(slug=kwargs.get(self.slug_url_kwarg))
+            .values("id", "slug", "updated_at", "company_id")
+            .first()
+        )
+        if meta is None:
+            raise Http404("Job inexistent.")
+
+        if can_serve_cached(request):
+            key = detail_page_key(meta)
+            content = cache.get(key)
+            if content is None:
+                # Rendered without any per-user bits, so one shell serves everyone
+                self.page_shell = True
+                response = super().get(request, *args, **kwargs)
+                response.render()
+                content = response.content
+                cache.set(key, content, DETAIL_PAGE_TIMEOUT)
+            response = HttpResponse(fill_shell(content, request))
+        else:
+            response = super().get(request, *args, **kwargs)
+
+        # Analytics fire on cache hits too
         try:
-            log_event(request, "job_view", {"job_id": self.object.id, "slug": self.object.slug})
+            log_event(request, "job_view", {"job_id": meta["id"], "slug": meta["slug"]})
         except Exception:
             pass
         return response
@@ -169,38 +318,123 @@ class JobDetailView(DetailView):
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
         job = self.object
-        fields = {f.name for f in Job._meta.get_fields()}
+        # Precomputed in the background, see apps/jobs/similarity.py
+        ctx["similar_jobs"] = get_similar_jobs(job, limit=4)
+
+        # Per-user bits (applied/saved/quick apply) from the cached user state;
+        # the shell gets the anonymous state and the page fetches the real one
+        user = AnonymousUser() if self.page_shell else self.request.user
+        ctx["user_state"] = get_user_job_state(user, job.id)
+        ctx["page_shell"] = self.page_shell
+        return ctx
 
-        qs = Job.objects.exclude(id=job.id).select_related("company")
-        if "is_active" in fields:
-            qs = qs.filter(is_active=True)
-        if "moderation_status" in fields:
-            qs = qs.filter(moderation_status=getattr(Job, "MOD_APPROVED", "approved"))
 
-        filters = Q()
-        # Heuristic matching by category/city/location/work_type
-        if "category" in fields and getattr(job, "category_id", None):
-            filters |= Q(category_id=job.category_id)
-        if "city" in fields and getattr(job, "city", ""):
-            filters |= Q(city__iexact=job.city)
-        elif "location" in fields and getattr(job, "location", ""):
-            filters |= Q(location__iexact=job.location)
-        if "work_type" in fields and getattr(job, "work_type", ""):
-            filters |= Q(work_type=job.work_type)
-
-        if filters:
-            qs = qs.filter(filters)
-
-        order_field = "-created_at" if "created_at" in fields else "-id"
-        similar_jobs = list(qs.order_by(order_field)[:4])
-        ctx["similar_jobs"] = similar_jobs
-
-        # Check if the user has applied to this job
-        ctx["has_applied"] = False
-        if self.request.user.is_authenticated:
-            ctx["has_applied"] = Application.objects.filter(job=job, seeker=self.request.user).exists()
+def job_user_state(request, slug):
+    """
+    JSON with the per-user bits of a job page, fetched by the cached shell
+    (see apps/jobs/page_cache.py).
+    """
+    job_id = Job.objects.filter(slug=slug).values_list("id", flat=True).first()
+    if job_id is None:
+        raise Http404("Job inexistent.")
+    return JsonResponse(get_user_job_state(request.user, job_id))
+
+
+REVIEW_QUEUE_KEYS = [SortKey("risk_score"), SortKey("id")]
+REVIEW_QUEUE_PAGE_SIZE = 50
+
+
+@staff_member_required
+def moderation_queue(request):
+    """Pending and reported jobs, riskiest first (keyset-paginated)."""
+    qs = review_queue()
+    reason = (request.GET.get("reason") or "").strip()
+    if reason:
+        qs = qs.filter(flagged_reason=reason)
+    page = KeysetPaginator(qs, REVIEW_QUEUE_PAGE_SIZE, REVIEW_QUEUE_KEYS).get_page(request.GET.get("after"))
+    next_url = None
+    if page.next_cursor:
+        params = request.GET.copy()
+        params["after"] = page.next_cursor
+        next_url = f"?{params.urlencode()}"
+    return render(request, "jobs/moderation_queue.html", {
+        "page_obj": page,
+        "jobs": page.object_list,
+        "next_url": next_url,
+        "reason": reason,
+        "reasons": sorted(FLAG_WEIGHTS),
+    })
+
+
+@staff_member_required
+@require_POST
+def moderation_queue_action(request):
+    action = request.POST.get("action")
+    ids = [int(pk) for pk in request.POST.getlist("ids") if pk.isdigit()][:REVIEW_QUEUE_PAGE_SIZE * 4]
+    if action not in BULK_ACTIONS or not ids:
+        return JsonResponse({"error": "Acțiune sau selecție invalidă."}, status=400)
+    stats = bulk_moderate(ids, action, reason="moderator" if action == "reject" else "")
+    if request.headers.get("x-requested-with") == "XMLHttpRequest":
+        return JsonResponse({"ids": ids, **stats})
+    messages.success(request, f"{stats['changed']} job(uri) actualizate.")
+    return redirect("jobs:moderation_queue")
+
+MAX_SAVED_SEARCHES = 20
 
-        return ctx
+
+@login_required
+@require_POST
+def save_search(request):
+    """Subscribe to the JobListView search described by the POSTed parameters."""
+    data = request.POST
+    if SavedSearch.objects.filter(user=request.user).count() >= MAX_SAVED_SEARCHES:
+        messages.error(request, f"Poți salva cel mult {MAX_SAVED_SEARCHES} căutări.")
+        return redirect("jobs:saved_searches")
+    category = (data.get("category") or "").strip()
+    city = (data.get("city") or "").strip()
+    frequency = data.get("frequency") or SavedSearch.FREQ_DAILY
+    search = SavedSearch.objects.create(
+        user=request.user,
+        name=(data.get("name") or "").strip()[:120],
+        q=(data.get("q") or "").strip()[:255],
+        loc=(data.get("loc") or "").strip()[:120],
+        category=category if category in dict(CATEGORIES) else "",
+        city=city if city in dict(CITIES) else "",
+        has_salary=(data.get("has_salary") or "").lower() in TRUTHY,
+        salary_min=parse_salary(data.get("salary_min")),
+        salary_max=parse_salary(data.get("salary_max")),
+        frequency=frequency if frequency in dict(SavedSearch.FREQUENCY_CHOICES) else SavedSearch.FREQ_DAILY,
+    )
+    messages.success(request, "Căutarea a fost salvată. Vei primi alerte pentru joburile noi.")
+    return redirect(search.get_absolute_url())
+
+
+@login_required
+def saved_searches(request):
+    searches = SavedSearch.objects.filter(user=request.user)
+    return render(request, "jobs/saved_searches.html", {"searches": searches})
+
+
+@login_required
+@require_POST
+def delete_saved_search(request, pk):
+    search = get_object_or_404(SavedSearch, pk=pk, user=request.user)
+    search.delete()
+    messages.success(request, "Căutarea salvată a fost ștearsă.")
+    return redirect("jobs:saved_searches")
+
+
+def sitemap_file(request, name=INDEX_NAME):
+    """Serve the prebuilt sitemap index / shards; never touches the database."""
+    if name != INDEX_NAME and not SHARD_NAME_RE.fullmatch(name):
+        raise Http404("Sitemap inexistent.")
+    path = SITEMAP_ROOT / name
+    if not path.is_file():
+        raise Http404("Sitemap inexistent.")
+    content_type = "application/xml" if name == INDEX_NAME else "application/gzip"
+    response = FileResponse(open(path, "rb"), content_type=content_type)
+    response["Cache-Control"] = "public, max-age=3600"
+    return response
 
 @method_decorator(rate_limit(key="job-create", rate=5, period=60), name="dispatch")  # 5/min per user/IP
 class JobCreateView(EmployerRequiredMixin, CreateView):
@@ -215,52 +449,11 @@ class JobCreateView(EmployerRequiredMixin, CreateView):
     def form_valid(self, form):
         form.instance.created_by = self.request.user
 
-        # Duplicate detection in last 7 days (same company + title + location/city if present)
-        fields = {f.name for f in Job._meta.get_fields()}
-        company = form.cleaned_data.get("company")
-        title = (form.cleaned_data.get("title") or "").strip()
-        location = (form.cleaned_data.get("location") or "").strip() if "location" in fields else ""
-        city = (form.cleaned_data.get("city") or "").strip() if "city" in fields else ""
-        since = timezone.now() - timedelta(days=7)
-
-        dup_qs = Job.objects.filter(company=company, title__iexact=title, created_at__gte=since)
-        if "location" in fields and location:
-            dup_qs = dup_qs.filter(location__iexact=location)
-        elif "city" in fields and city:
-            dup_qs = dup_qs.filter(city__iexact=city)
-
-        # Abuse detection: simple profanity + contact leakage already redacted in form, still flag if obvious
-        desc = (form.cleaned_data.get("description") or "").lower()
-        has_profanity = any(w in desc for w in PROFANITY_WORDS)
-        has_contact_leak = bool(re.search(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", desc, re.I)) or bool(re.search(r"\+?\d[\d\s().-]{6,}\d", desc))
-
-        # Moderation rule: first 5 approved jobs by this employer require approval
-        approved_count = Job.objects.filter(created_by=self.request.user, moderation_status=Job.MOD_APPROVED).count()
-        requires_review = approved_count < 5
-
-        flagged_reason = ""
-        if dup_qs.exists():
-            requires_review = True
-            flagged_reason = "duplicate"
-        elif has_profanity:
-            requires_review = True
-            flagged_reason = "abuse"
-        elif has_contact_leak:
-            requires_review = True
-            flagged_reason = "contact_info"
-
-        if requires_review:
-            form.instance.moderation_status = Job.MOD_PENDING
-            if "is_active" in fields:
-                form.instance.is_active = False
-            if flagged_reason:
-                form.instance.flagged_reason = flagged_reason
-                form.instance.flagged_at = timezone.now()
-        else:
-            form.instance.moderation_status = Job.MOD_APPROVED
-            form.instance.approved_at = timezone.now()
-            if "is_active" in fields:
-                form.instance.is_active = True
+        # Moderation runs in the background (apps/jobs/moderation.py); until then the job is pending
+        form.instance.moderation_status = Job.MOD_PENDING
+        form.instance.is_active = False
+        form.instance.flagged_reason = ""
+        form.instance.flagged_at = None
 
         # Enforce ownership of company (already done above)
         company = form.cleaned_data.get("company")
@@ -268,6 +461,8 @@ class JobCreateView(EmployerRequiredMixin, CreateView):
             return HttpResponseForbidden("Nu ai permisiunea de a posta pentru această companie.")
 
         response = super().form_valid(form)
+        enqueue_on_commit(moderate_job, self.object.id)
+        messages.info(self.request, "Anunțul a fost trimis și va fi publicat după verificare.")
         try:
             log_event(self.request, "job_posted", {"job_id": self.object.id, "slug": self.object.slug})
         except Exception:
@@ -344,19 +539,22 @@ def job_list(request):
 
     # Sorting
     sort = request.GET.get("sort", "newest")
-    if sort == "salary_desc" and "salary_max" in field_names:
-        qs = qs.order_by("-salary_max", "-created_at") if "created_at" in field_names else qs.order_by("-salary_max")
+    if sort not in KEYSET_SORTS:
+        sort = "newest"
+
+    # Pagination: cursor based unless an explicit ?page=N is requested
+    if "page" in request.GET:
+        qs = qs.order_by(*[k.order_expression() for k in KEYSET_SORTS[sort]])
+        paginator = Paginator(qs, 12)
+        page_obj = paginator.get_page(request.GET.get("page"))
     else:
-        qs = qs.order_by("-created_at") if "created_at" in field_names else qs
-
-    # Pagination
-    paginator = Paginator(qs, 12)
-    page_number = request.GET.get("page")
-    page_obj = paginator.get_page(page_number)
+        paginator = KeysetPaginator(qs, 12, KEYSET_SORTS[sort])
+        page_obj = paginator.get_page(request.GET.get("after"))
 
-    # Preserve query (without page) for pagination links
+    # Preserve query (without page/cursor) for pagination links
     qcopy = request.GET.copy()
     qcopy.pop("page", None)
+    qcopy.pop("after", None)
     preserved_query = qcopy.urlencode()
 
     context = {
@@ -390,6 +588,7 @@ def job_detail(request, slug):
 def save_job(request, slug):
     job = get_object_or_404(Job, slug=slug)
     SavedJob.objects.get_or_create(user=request.user, job=job)
+    invalidate_user_state(request.user.id)
     messages.success(request, "Job salvat.")
     return redirect("jobs:detail", slug=slug)
 
@@ -398,10 +597,12 @@ def save_job(request, slug):
 def unsave_job(request, slug):
     job = get_object_or_404(Job, slug=slug)
     SavedJob.objects.filter(user=request.user, job=job).delete()
+    invalidate_user_state(request.user.id)
     messages.info(request, "Job eliminat din favorite.")
     return redirect("jobs:detail", slug=slug)
 
 @login_required
+@rate_limit(key="report-job", rate=5, period=60 * 60, methods=("POST",))
 def report_job(request, slug):
     job = get_object_or_404(Job, slug=slug)
     if request.method == "POST":
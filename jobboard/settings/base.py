@@ -1,6 +1,8 @@
 from pathlib import Path
 import os
 
+from celery.schedules import crontab
+
 # Repo root: /home/user/Desktop/Programming/Coding/Proj/Jobs Platform/jobboard
 BASE_DIR = Path(__file__).resolve().parent.parent.parent  # repo root
 
@@ -40,7 +42,7 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [
-            BASE_DIR / "templates",  # canonical location
+            BASE_DIR / "jobboard" / "templates",  # canonical location
         ],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -64,4 +66,82 @@ STATICFILES_DIRS = [BASE_DIR / "jobboard" / "static"]
 STATIC_ROOT = BASE_DIR / "static_cdn"
 
 MEDIA_URL = "/media/"
-MEDIA_ROOT = BASE_DIR / "media"
\ No newline at end of file
+MEDIA_ROOT = BASE_DIR / "media"
+
+# Absolute URLs in generated files (sitemaps, emails)
+SITE_URL = os.getenv("SITE_URL", "http://localhost:8000")
+# Precompressed sitemap shards + index, see apps.jobs.sitemap_files
+SITEMAP_ROOT = Path(os.getenv("SITEMAP_ROOT", BASE_DIR / "sitemaps"))
+
+# New applications are mailed to the employer as one digest per company and window (seconds)
+APPLICATION_NOTIFY_WINDOW = int(os.getenv("APPLICATION_NOTIFY_WINDOW", 10 * 60))
+# Inbox CSV exports above this many rows are built in the background and mailed as a link
+APPLICATION_EXPORT_SYNC_LIMIT = int(os.getenv("APPLICATION_EXPORT_SYNC_LIMIT", 50000))
+# Private, not under MEDIA_ROOT: exports are only served through the download view
+APPLICATION_EXPORT_ROOT = Path(os.getenv("APPLICATION_EXPORT_ROOT", BASE_DIR / "var" / "exports"))
+
+# Analytics events are buffered in-process and bulk inserted by a background
+# thread ("sync" writes each event inline), see apps.analytics.buffer
+ANALYTICS_BUFFER_MODE = os.getenv("ANALYTICS_BUFFER_MODE", "buffer")
+ANALYTICS_SPOOL_DIR = Path(os.getenv("ANALYTICS_SPOOL_DIR", BASE_DIR / "var" / "analytics-spool"))
+# Rollups only fold event ids that were already the maximum this long ago, see apps.analytics.rollups
+ANALYTICS_ROLLUP_SETTLE_SECONDS = int(os.getenv("ANALYTICS_ROLLUP_SETTLE_SECONDS", 60))
+# Raw events older than this many whole months are moved to gzip archives, see apps.analytics.archive
+ANALYTICS_EVENT_RETENTION_MONTHS = int(os.getenv("ANALYTICS_EVENT_RETENTION_MONTHS", 3))
+ANALYTICS_ARCHIVE_ROOT = Path(os.getenv("ANALYTICS_ARCHIVE_ROOT", BASE_DIR / "var" / "analytics-archive"))
+
+# Rate limits are shared by all workers through Redis, see apps.accounts.ratelimit
+RATELIMIT_BACKEND = os.getenv("RATELIMIT_BACKEND", "apps.accounts.ratelimit.RedisBackend")
+RATELIMIT_REDIS_URL = os.getenv("RATELIMIT_REDIS_URL", "redis://localhost:6379/1")
+
+# Celery (tasks are queued on transaction commit, see apps.jobs.tasks.enqueue_on_commit)
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
+CELERY_TASK_ALWAYS_EAGER = os.getenv("CELERY_TASK_ALWAYS_EAGER", "0") == "1"
+CELERY_BEAT_SCHEDULE = {
+    "expire-jobs": {
+        "task": "apps.jobs.tasks.expire_jobs_task",
+        "schedule": 10 * 60,
+    },
+    "refresh-salary-histograms": {
+        "task": "apps.jobs.tasks.refresh_salary_histograms",
+        "schedule": 15 * 60,
+    },
+    "build-sitemaps": {
+        "task": "apps.jobs.tasks.build_sitemaps",
+        "schedule": 15 * 60,
+    },
+    "saved-jobs-digest": {
+        "task": "apps.jobs.tasks.send_saved_jobs_digest",
+        "schedule": crontab(hour=6, minute=0),
+    },
+    "saved-search-alerts-instant": {
+        "task": "apps.jobs.tasks.notify_saved_jobs",
+        "schedule": 5 * 60,
+        "kwargs": {"frequency": "instant"},
+    },
+    "saved-search-alerts-daily": {
+        "task": "apps.jobs.tasks.notify_saved_jobs",
+        "schedule": crontab(hour=7, minute=0),
+        "kwargs": {"frequency": "daily"},
+    },
+    "application-digests-sweep": {
+        "task": "apps.applications.tasks.send_pending_application_digests",
+        "schedule": 30 * 60,
+    },
+    "purge-application-exports": {
+        "task": "apps.applications.tasks.purge_application_exports",
+        "schedule": crontab(hour=4, minute=0),
+    },
+    "rollup-events": {
+        "task": "apps.analytics.tasks.rollup_events",
+        "schedule": 5 * 60,
+    },
+    "archive-events": {
+        "task": "apps.analytics.tasks.archive_events",
+        "schedule": crontab(hour=3, minute=30),
+    },
+    "reconcile-site-counters": {
+        "task": "apps.analytics.tasks.reconcile_site_counters",
+        "schedule": 60 * 60,
+    },
+}
@@ -25,4 +25,15 @@ MEDIA_ROOT = BASE_DIR / "media"
 # Additional development settings can be added here
 
 # Email to console in dev
-EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
\ No newline at end of file
+EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+
+# No broker needed locally: run Celery tasks inline
+CELERY_TASK_ALWAYS_EAGER = True
+
+# Write analytics events inline (no flusher thread in runserver/tests)
+ANALYTICS_BUFFER_MODE = "sync"
+# Single process writing inline: every visible event id is already settled
+ANALYTICS_ROLLUP_SETTLE_SECONDS = 0
+
+# In-process rate limiter, no Redis needed
+RATELIMIT_BACKEND = "apps.accounts.ratelimit.MemoryBackend"
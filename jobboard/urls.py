@@ -3,6 +3,7 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 from django.views.generic import RedirectView
+from apps.jobs.views import sitemap_file
 from . import views
 
 urlpatterns = [
@@ -10,8 +11,11 @@ urlpatterns = [
     path("jobs/", include("apps.jobs.urls")),
     path("applications/", include("apps.applications.urls")),
     path("companies/", include("apps.companies.urls")),
+    path("analytics/", include("apps.analytics.urls")),
     path("accounts/", include(("apps.accounts.urls", "accounts"), namespace="accounts")),
     path("admin/", admin.site.urls),
+    path("sitemap.xml", sitemap_file, name="sitemap"),
+    path("sitemaps/<str:name>", sitemap_file, name="sitemap_shard"),
 
     # Back-compat names used by tests
     path("accounts/login/", RedirectView.as_view(pattern_name="accounts:login", permanent=False), name="account_login"),
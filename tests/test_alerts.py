@@ -0,0 +1,98 @@
+import pytest
+from django.core import mail
+from django.urls import reverse
+from apps.jobs import alerts
+from apps.jobs.models import Job, SavedSearch, SavedSearchMatch, SavedSearchTerm
+
+
+@pytest.fixture
+def searches(seeker):
+    def make(**fields):
+        return SavedSearch.objects.create(user=seeker, frequency=SavedSearch.FREQ_INSTANT, **fields)
+    return {
+        "driver": make(q="Șofer", city="cluj"),
+        "driver_salary": make(q="sofer", salary_min=5000),
+        "loc": make(loc="buch"),
+        "it": make(category="it"),
+        "all": make(),
+    }
+
+
+def test_anchor_keys():
+    assert alerts.anchor_keys(SavedSearch(q="sofer c+e")) == ["t:sofe"]
+    assert alerts.anchor_keys(SavedSearch(q="ce", city="iasi")) == ["city:iasi"]
+    assert alerts.anchor_keys(SavedSearch(city="iasi", category="it", salary_min=4000)) == ["city:iasi|cat:it|salary"]
+    assert alerts.anchor_keys(SavedSearch(loc="xyz")) == []
+    assert alerts.anchor_keys(SavedSearch()) == ["*"]
+
+
+def test_job_keys_cover_every_filter_combination():
+    job = Job(city="iasi", category="it", salary_max=5000)
+    keys = alerts.job_keys(job, [])
+    assert set(keys) == {"*", "city:iasi", "cat:it", "salary", "city:iasi|cat:it", "city:iasi|salary",
+                         "cat:it|salary", "city:iasi|cat:it|salary"}
+    assert "cat:it|salary" not in alerts.job_keys(Job(city="iasi", category="it"), [])
+
+
+@pytest.mark.django_db
+def test_searches_are_indexed_on_save(searches):
+    keys = dict(SavedSearchTerm.objects.values_list("saved_search_id", "key"))
+    assert keys[searches["driver"].id] == "t:sofe"
+    assert keys[searches["loc"].id] == "city:bucharest"
+
+
+@pytest.mark.django_db
+def test_percolate_matches_like_the_list_view(searches, make_job):
+    job = make_job(title="Soferi distributie", slug="soferi", city="cluj", category="logistics",
+                   salary_min=3000, salary_max=4000)
+    alerts.percolate(job)
+    matched = set(SavedSearchMatch.objects.filter(job=job).values_list("saved_search_id", flat=True))
+    assert matched == {searches["driver"].id, searches["all"].id}
+
+    # Idempotent
+    alerts.percolate(job)
+    assert SavedSearchMatch.objects.filter(job=job).count() == 2
+
+
+@pytest.mark.django_db
+def test_alert_chunk_sends_one_email_per_user(searches, make_job):
+    for i in range(2):
+        alerts.percolate(make_job(title=f"Sofer {i}", slug=f"sofer-{i}", city="cluj", category="logistics"))
+    hidden = make_job(title="Sofer ascuns", slug="ascuns", city="cluj", category="logistics")
+    alerts.percolate(hidden)
+    Job.objects.filter(id=hidden.id).update(is_active=False)
+
+    chunks = list(alerts.recipient_chunks(SavedSearch.FREQ_INSTANT))
+    assert alerts.send_alert_chunk(chunks[0], SavedSearch.FREQ_INSTANT) == 1
+    assert len(mail.outbox) == 1
+    assert "Sofer 0" in mail.outbox[0].body and "ascuns" not in mail.outbox[0].body
+    assert not SavedSearchMatch.objects.filter(notified_at__isnull=True).exists()
+    alerts._template.cache_clear()
+
+
+@pytest.mark.django_db
+def test_save_search_view(client, seeker):
+    client.force_login(seeker)
+    resp = client.post(reverse("jobs:save_search"), {"q": "sofer", "city": "cluj", "has_salary": "on"})
+    search = SavedSearch.objects.get(user=seeker)
+    assert resp.status_code == 302 and resp["Location"] == search.get_absolute_url()
+    assert search.has_salary and search.frequency == SavedSearch.FREQ_DAILY
+
+
+@pytest.mark.django_db
+def test_only_jobs_becoming_public_are_percolated(make_job, monkeypatch):
+    from apps.jobs import signals
+
+    queued = []
+    monkeypatch.setattr(signals, "enqueue_on_commit", lambda task, *args: queued.append((task, args)))
+    pending = make_job(title="Sofer", slug="sofer", moderation_status=Job.MOD_PENDING, is_active=False)
+    live = make_job(title="Curier", slug="curier")
+    percolated = [args[0] for task, args in queued if task is signals.percolate_jobs]
+    assert percolated == [[live.id]]
+
+    queued.clear()
+    live.title = "Curier livrari"
+    live.save()
+    pending.approve()
+    percolated = [args[0] for task, args in queued if task is signals.percolate_jobs]
+    assert percolated == [[pending.id]]
@@ -0,0 +1,41 @@
+import pytest
+from django.contrib.auth import get_user_model
+from apps.applications import counters
+from apps.applications.models import Application, ApplicationStatusCounter
+
+User = get_user_model()
+
+
+@pytest.fixture
+def applications(job, make_job):
+    other_job = make_job(title="Tester", slug="tester")
+    users = [User.objects.create_user(username=f"c{i}", password="x") for i in range(3)]
+    return [
+        Application.objects.create(job=job, seeker=users[0]),
+        Application.objects.create(job=job, seeker=users[1]),
+        Application.objects.create(job=other_job, seeker=users[2]),
+    ]
+
+
+@pytest.mark.django_db
+def test_counters_follow_status_changes_and_deletes(applications, job, company, django_assert_max_num_queries):
+    first, second, third = applications
+    first.status = "interview"
+    first.save(update_fields=["status"])
+    third.delete()
+
+    with django_assert_max_num_queries(1):
+        totals = counters.status_counts(company.id)
+    assert totals == {"submitted": 1, "viewed": 0, "interview": 1, "offer": 0, "rejected": 0}
+    assert counters.status_counts(company.id, job.id)["interview"] == 1
+    assert counters.job_status_counts([job.id])[job.id]["submitted"] == 1
+
+
+@pytest.mark.django_db
+def test_reconcile_fixes_drift(applications, company):
+    Application.objects.filter(id=applications[0].id).update(status="offer")  # bypasses signals
+    ApplicationStatusCounter.objects.filter(job__isnull=True, status="submitted").update(count=40)
+    assert counters.reconcile([company.id]) == 4
+    assert counters.status_counts(company.id)["submitted"] == 2
+    assert counters.status_counts(company.id)["offer"] == 1
+    assert counters.reconcile() == 0
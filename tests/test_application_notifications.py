@@ -0,0 +1,51 @@
+import pytest
+from django.core import mail
+from django.core.cache import cache
+from django.urls import reverse
+from apps.applications import notifications, tasks
+from apps.applications.models import Application
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+
+
+@pytest.fixture
+def scheduled(monkeypatch):
+    calls = []
+    monkeypatch.setattr(tasks.send_application_digest, "apply_async", lambda args, countdown: calls.append((args, countdown)))
+    cache.clear()
+    yield calls
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_apply_schedules_one_digest_per_window(client, seeker, job, scheduled, django_capture_on_commit_callbacks):
+    client.login(username="seeker", password="test1234")
+    with django_capture_on_commit_callbacks(execute=True):
+        client.post(reverse("applications:apply", kwargs={"slug": job.slug}), data={"cover_letter": "Salut"})
+    other = User.objects.create_user(username="other", email="other@example.com", password="x")
+    Application.objects.create(job=job, seeker=other)
+    tasks.schedule_employer_digest(job.company_id)
+
+    assert Application.objects.filter(job=job, seeker=seeker, cover_letter="Salut").exists()
+    assert scheduled == [([job.company_id], notifications.NOTIFY_WINDOW)]
+
+
+@pytest.mark.django_db
+def test_digest_coalesces_pending_applications(job, make_job, scheduled):
+    second = make_job(title="Tester", slug="tester")
+    for i in range(3):
+        user = User.objects.create_user(username=f"c{i}", email=f"c{i}@example.com", password="x")
+        Application.objects.create(job=job if i else second, seeker=user)
+    tasks.schedule_employer_digest(job.company_id)
+
+    assert notifications.send_company_digest(job.company_id) == 3
+    assert len(mail.outbox) == 1
+    message = mail.outbox[0]
+    assert message.to == [job.company.owner.email]
+    assert "c0" in message.body and "c2" in message.body and "Tester" in message.body
+    assert not notifications.pending(job.company_id).exists()
+    # Lock released: the next application schedules a new digest
+    assert tasks.schedule_employer_digest(job.company_id)
+    assert notifications.send_company_digest(job.company_id) == 0
+    assert len(mail.outbox) == 1
@@ -25,3 +25,16 @@ def test_apply_unique(client, seeker, job):
     resp = client.post(url, data={}, follow=True)
     # Second post should not create a duplicate
     assert Application.objects.filter(job=job, seeker=seeker).count() == 1
+
+
+@pytest.mark.django_db
+def test_apply_race_redirects_instead_of_500(client, seeker, job, monkeypatch):
+    from django.db.models import QuerySet
+
+    Application.objects.create(job=job, seeker=seeker)
+    client.login(username="seeker", password="test1234")
+    # Both submits passed the pre-check; the unique constraint decides
+    monkeypatch.setattr(QuerySet, "exists", lambda self: False)
+    resp = client.post(reverse("applications:apply", kwargs={"slug": job.slug}), data={})
+    assert resp.status_code == 302
+    assert Application.objects.filter(job=job, seeker=seeker).count() == 1
@@ -0,0 +1,74 @@
+import pytest
+from django.contrib.admin.sites import AdminSite
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.test import RequestFactory
+from apps.jobs import moderation
+from apps.jobs.admin import JobAdmin
+from apps.jobs.bulk import jobs_bulk_changed
+from apps.jobs.models import Job
+
+
+@pytest.fixture
+def pending(make_job):
+    return [
+        make_job(title=f"Spam {i}", slug=f"spam-{i}", moderation_status=Job.MOD_PENDING, is_active=False)
+        for i in range(5)
+    ]
+
+
+def _admin_request(user):
+    request = RequestFactory().post("/admin/jobs/job/")
+    request.user = user
+    request.session = {}
+    request._messages = FallbackStorage(request)
+    return request
+
+
+@pytest.mark.django_db
+def test_bulk_approve_in_chunks_and_notifies(pending):
+    received = []
+
+    def listener(sender, job_ids, reason, **kwargs):
+        received.append((reason, sorted(job_ids)))
+
+    jobs_bulk_changed.connect(listener)
+    try:
+        ids = [job.id for job in pending]
+        stats = moderation.bulk_moderate(ids, "approve", chunk_size=3)
+    finally:
+        jobs_bulk_changed.disconnect(listener)
+    assert stats == {"action": "approve", "total": 5, "done": 5, "changed": 5}
+    assert [reason for reason, _ in received] == ["approved", "approved"]
+    assert Job.objects.filter(is_active=True, moderation_status=Job.MOD_APPROVED).count() == 5
+
+    # Already approved jobs are not touched again
+    assert moderation.bulk_moderate(ids, "approve")["changed"] == 0
+
+
+@pytest.mark.django_db
+def test_bulk_reject_keeps_existing_flags(pending):
+    Job.objects.filter(id=pending[0].id).update(flagged_reason="duplicate")
+    moderation.bulk_moderate([job.id for job in pending], "reject", reason="admin")
+    reasons = dict(Job.objects.values_list("slug", "flagged_reason"))
+    assert reasons["spam-0"] == "duplicate" and reasons["spam-1"] == "admin"
+    assert not Job.objects.filter(is_active=True).exists()
+
+
+@pytest.mark.django_db
+def test_admin_action_goes_async_above_limit(pending, employer, monkeypatch):
+    monkeypatch.setattr(moderation, "BULK_SYNC_LIMIT", 2)
+    admin = JobAdmin(Job, AdminSite())
+    admin.reject_jobs(_admin_request(employer), Job.objects.all())
+    # Queued for the background task, nothing changed yet
+    assert Job.objects.filter(moderation_status=Job.MOD_PENDING).count() == 5
+
+    monkeypatch.setattr(moderation, "BULK_SYNC_LIMIT", 500)
+    admin.approve_jobs(_admin_request(employer), Job.objects.all())
+    assert Job.objects.filter(moderation_status=Job.MOD_APPROVED).count() == 5
+
+
+@pytest.mark.django_db
+def test_background_task_reports_progress(pending):
+    from apps.jobs.tasks import bulk_moderate_jobs
+    bulk_moderate_jobs("tok", [job.id for job in pending], "approve")
+    assert moderation.get_progress("tok") == {"state": "done", "action": "approve", "total": 5, "done": 5, "changed": 5}
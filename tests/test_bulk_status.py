@@ -0,0 +1,103 @@
+import inspect
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+
+from apps.applications import bulk, counters
+from apps.applications.models import Application
+from apps.companies.models import Company
+from apps.jobs.models import Job
+
+User = get_user_model()
+
+
+@pytest.fixture
+def applications(job, make_job):
+    other_job = make_job(title="Tester", slug="tester")
+    users = [User.objects.create_user(username=f"c{i}", password="x") for i in range(4)]
+    return [
+        Application.objects.create(job=job, seeker=users[0]),
+        Application.objects.create(job=job, seeker=users[1]),
+        Application.objects.create(job=other_job, seeker=users[2]),
+        Application.objects.create(job=other_job, seeker=users[3], status="rejected"),
+    ]
+
+
+@pytest.mark.django_db
+def test_change_statuses_updates_in_sets_and_keeps_counters(applications, company, job, employer, django_assert_max_num_queries):
+    first, second, third, fourth = applications
+    outsider = Company.objects.create(name="Alta SRL", slug="alta-srl", owner=employer)
+    changes = {first.id: "interview", second.id: "interview", third.id: "rejected", fourth.id: "rejected", 999: "offer"}
+
+    # Cost follows the distinct (job, status) pairs touched, not the number of applications:
+    # select + one UPDATE per target status + one counter UPDATE per key (first-time rows are seeded)
+    with django_assert_max_num_queries(20):
+        results = bulk.change_statuses(company.id, changes)
+
+    assert results == {first.id: bulk.UPDATED, second.id: bulk.UPDATED, third.id: bulk.UPDATED,
+                       fourth.id: bulk.UNCHANGED, 999: bulk.NOT_FOUND}
+    assert bulk.change_statuses(outsider.id, {first.id: "offer"}) == {first.id: bulk.NOT_FOUND}
+    assert Application.objects.get(id=first.id).status == "interview"
+    assert counters.status_counts(company.id) == {"submitted": 0, "viewed": 0, "interview": 2, "offer": 0, "rejected": 2}
+    assert counters.status_counts(company.id, job.id)["interview"] == 2
+    assert counters.reconcile([company.id]) == 0
+
+
+@pytest.mark.django_db
+def test_matching_selects_filtered_applications(applications, company, job, monkeypatch):
+    assert set(bulk.matching(company.id, "rejected", "submitted", job.id)) == {applications[0].id, applications[1].id}
+    assert set(bulk.matching(company.id, "rejected")) == {a.id for a in applications[:3]}
+    monkeypatch.setattr(bulk, "MAX_ITEMS", 2)
+    assert bulk.matching(company.id, "rejected") is None
+
+
+
+
+@pytest.fixture
+def post_bulk(company, employer, monkeypatch):
+    from apps.applications import views
+
+    # No EmployerProfile model in this tree, so skip the decorators and the company lookup
+    view = inspect.unwrap(views.bulk_update_status)
+    monkeypatch.setattr(views, "_employer_company_or_redirect", lambda request: company)
+
+    def post(payload):
+        request = RequestFactory().post("/", json.dumps(payload), content_type="application/json")
+        request.user = employer
+        resp = view(request)
+        return resp.status_code, json.loads(resp.content)
+
+    return post
+
+
+@pytest.mark.django_db
+def test_bulk_view_rejects_duplicate_ids_and_survives_analytics_failure(post_bulk, applications, monkeypatch):
+    from apps.applications import views
+
+    first = applications[0]
+    items = [{"id": first.id, "status": "interview"}, {"id": first.id, "status": "rejected"}]
+    status, body = post_bulk({"items": items})
+    assert status == 400 and body["error"] == "duplicate_id"
+    assert Application.objects.get(id=first.id).status == "submitted"
+
+    monkeypatch.setattr(views, "log_event", lambda *a, **kw: (_ for _ in ()).throw(RuntimeError("analytics down")))
+    status, body = post_bulk({"items": items[:1] + [{"id": "abc", "status": "offer"}, {"status": "offer"}]})
+    assert status == 200 and body["updated"] == 1
+    assert {"id": "abc", "result": "invalid_id"} in body["results"]
+    assert {"id": None, "result": "invalid_id"} in body["results"]
+
+
+@pytest.mark.django_db
+def test_bulk_view_rejects_filters_that_do_not_apply(post_bulk, applications, make_job, employer):
+    outsider = Company.objects.create(name="Alta SRL", slug="alta-srl", owner=employer)
+    foreign_job = make_job(title="Strain", slug="strain")
+    Job.objects.filter(id=foreign_job.id).update(company=outsider)
+    for flt in ({"status": "submited"}, {"job": "abc"}, {"job": foreign_job.id}):
+        status, body = post_bulk({"filter": flt, "status": "rejected"})
+        assert status == 400, flt
+    assert Application.objects.filter(status="rejected").count() == 1
+
+    status, body = post_bulk({"filter": {"status": "submitted", "job": applications[0].job_id}, "status": "viewed"})
+    assert status == 200 and body["updated"] == 2
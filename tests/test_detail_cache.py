@@ -0,0 +1,66 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from apps.analytics.models import Event
+from apps.jobs import page_cache
+from apps.jobs.models import Job, SavedJob
+from apps.jobs.page_cache import detail_page_key, get_user_job_state
+
+
+def _meta(job):
+    return Job.objects.filter(id=job.id).values("id", "slug", "updated_at", "company_id").first()
+
+
+@pytest.mark.django_db
+def test_cache_hit_serves_page_and_logs_view(client, job):
+    cache.set(detail_page_key(_meta(job)), b"<html>cached</html>")
+    resp = client.get(reverse("jobs:detail", kwargs={"slug": job.slug}))
+    assert resp.status_code == 200
+    assert resp.content == b"<html>cached</html>"
+    assert Event.objects.filter(name="job_view", properties__job_id=job.id).exists()
+
+
+@pytest.mark.django_db
+def test_detail_key_changes_on_moderation_and_company_rename(job, company):
+    key = detail_page_key(_meta(job))
+    job.reject(reason="spam")
+    rejected_key = detail_page_key(_meta(job))
+    assert rejected_key != key
+    company.name = "Alt Nume SRL"
+    company.save()
+    assert detail_page_key(_meta(job)) != rejected_key
+
+
+@pytest.mark.django_db
+def test_user_state_is_cached_and_invalidated(client, seeker, job):
+    assert get_user_job_state(seeker, job.id)["is_saved"] is False
+    SavedJob.objects.create(user=seeker, job=job)
+    # Still cached: nothing told the state store
+    assert get_user_job_state(seeker, job.id)["is_saved"] is False
+
+    client.login(username="seeker", password="test1234")
+    client.get(reverse("jobs:save", kwargs={"slug": job.slug}))
+    resp = client.get(reverse("jobs:user_state", kwargs={"slug": job.slug}))
+    assert resp.json()["is_saved"] is True
+
+
+@pytest.mark.django_db
+def test_logged_in_user_gets_cached_shell_with_own_navbar(client, seeker, job, monkeypatch):
+    monkeypatch.setattr(page_cache, "render_to_string", lambda name, request: request.user.get_username())
+    cache.set(detail_page_key(_meta(job)), b"<html>" + page_cache.NAVBAR_HOLE + b"shell</html>")
+    client.login(username="seeker", password="test1234")
+    resp = client.get(reverse("jobs:detail", kwargs={"slug": job.slug}))
+    assert resp.status_code == 200
+    assert resp.content == b"<html>seekershell</html>"
+
+
+@pytest.mark.django_db
+def test_profile_change_invalidates_quick_apply_state(seeker, job):
+    from apps.accounts.models import SeekerProfile
+
+    profile, _ = SeekerProfile.objects.get_or_create(user=seeker)
+    assert get_user_job_state(seeker, job.id)["quick_apply_ready"] is False
+    profile.quick_apply_ready = True
+    profile.save(update_fields=["quick_apply_ready"])
+    seeker.seekerprofile = profile
+    assert get_user_job_state(seeker, job.id)["quick_apply_ready"] is True
@@ -0,0 +1,44 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core import mail
+from apps.accounts.models import UserProfile
+from apps.jobs import digest
+from apps.jobs.models import SavedJob
+from apps.jobs.tasks import send_saved_jobs_digest
+
+User = get_user_model()
+
+
+@pytest.fixture
+def subscribers(make_job):
+    jobs = [make_job(title=f"Job {i}", slug=f"job-{i}") for i in range(3)]
+    users = [User.objects.create_user(username=f"u{i}", email=f"u{i}@example.com", password="x") for i in range(4)]
+    for user in users:
+        for job in jobs:
+            SavedJob.objects.create(user=user, job=job)
+    UserProfile.objects.create(user=users[3], receive_alerts=False)
+    return users
+
+
+@pytest.mark.django_db
+def test_recipient_chunks_skip_opted_out(subscribers):
+    chunks = list(digest.recipient_chunks(chunk_size=2))
+    assert chunks == [[subscribers[0].id, subscribers[1].id], [subscribers[2].id]]
+
+
+@pytest.mark.django_db
+def test_chunk_uses_constant_queries_and_caps_jobs(subscribers, monkeypatch, django_assert_num_queries):
+    monkeypatch.setattr(digest, "MAX_JOBS_PER_DIGEST", 2)
+    with django_assert_num_queries(2):
+        sent = digest.send_digest_chunk([u.id for u in subscribers])
+    assert sent == 3 and len(mail.outbox) == 3
+    assert mail.outbox[0].body.count("- Job") == 2
+
+
+@pytest.mark.django_db
+def test_digest_fans_out_chunks(subscribers, monkeypatch):
+    monkeypatch.setattr(digest, "DIGEST_CHUNK_SIZE", 2)
+    calls = []
+    monkeypatch.setattr("apps.jobs.tasks.send_saved_jobs_digest_chunk.delay", lambda ids, freq: calls.append(ids))
+    assert send_saved_jobs_digest() == 2
+    assert sorted(sum(calls, [])) == sorted(u.id for u in subscribers[:3])
@@ -0,0 +1,28 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+
+from apps.applications.models import Application
+from apps.companies.views import EmployerDashboardView
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_dashboard_lists_only_latest_applications_per_job(employer, job, make_job, django_assert_max_num_queries):
+    other_job = make_job(title="Tester", slug="tester")
+    users = [User.objects.create_user(username=f"c{i}", password="x") for i in range(4)]
+    for user in users:
+        Application.objects.create(job=job, seeker=user)
+    Application.objects.create(job=other_job, seeker=users[0])
+
+    view = EmployerDashboardView(latest_applications=2)
+    view.setup(RequestFactory().get("/"))
+    view.request.user = employer
+    # jobs + latest applications (with seekers) + counters, whatever the number of applications
+    with django_assert_max_num_queries(3):
+        jobs = {j.id: j for j in view.get_context_data()["jobs"]}
+
+    assert [a.seeker.username for a in jobs[job.id].latest_applications] == ["c3", "c2"]
+    assert jobs[job.id].application_total == 4
+    assert len(jobs[other_job.id].latest_applications) == 1
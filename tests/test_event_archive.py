@@ -0,0 +1,55 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from apps.analytics import archive, rollups
+from apps.analytics.models import Event
+
+
+@pytest.fixture
+def old_and_new_events(db):
+    old = timezone.now() - timedelta(days=200)
+    Event.objects.bulk_create(
+        [Event(name="job_view", properties={"job_id": i}, created_at=old) for i in range(3)]
+        + [Event(name="job_posted", created_at=old), Event(name="job_view", created_at=timezone.now())]
+    )
+    return old
+
+
+@pytest.mark.django_db
+def test_archive_waits_for_rollups(old_and_new_events, tmp_path):
+    assert archive.archive(retention_months=2, root=tmp_path) == {"months": 0, "events": 0}
+    assert Event.objects.count() == 5
+
+
+@pytest.mark.django_db
+def test_archive_moves_closed_months_and_reads_back(old_and_new_events, tmp_path):
+    rollups.run()
+    stats = archive.archive(retention_months=2, root=tmp_path)
+    assert stats == {"months": 1, "events": 4}
+    assert list(Event.objects.values_list("name", flat=True)) == ["job_view"]
+    assert len(list(tmp_path.glob("events-*.jsonl.gz"))) == 1
+
+    day = timezone.localdate(old_and_new_events)
+    rows = list(archive.read_archive(day, day, name="job_view", root=tmp_path))
+    assert sorted(r["properties"]["job_id"] for r in rows) == [0, 1, 2]
+    assert rows[0]["created_at"] == old_and_new_events
+    assert list(archive.read_archive(day + timedelta(days=1), day + timedelta(days=1), root=tmp_path)) == []
+
+
+@pytest.mark.django_db
+def test_archive_deletes_only_rows_written_to_the_file(old_and_new_events, tmp_path, monkeypatch):
+    late_id = Event.objects.filter(name="job_view").order_by("id").values_list("id", flat=True)[1]
+    Event.objects.filter(id=late_id).delete()
+    rollups.run()
+    replace = archive.os.replace
+
+    def replace_then_commit_late_row(src, dst):
+        replace(src, dst)
+        # Committed after the file was written, with an id inside its range
+        Event.objects.create(id=late_id, name="job_view", created_at=old_and_new_events)
+
+    monkeypatch.setattr(archive.os, "replace", replace_then_commit_late_row)
+    month = timezone.localtime(old_and_new_events)
+    assert archive.archive_month(month.year, month.month, root=tmp_path) == 3
+    assert Event.objects.filter(id=late_id).exists()
@@ -0,0 +1,99 @@
+import pytest
+from django.test import RequestFactory
+from django.utils import timezone
+from apps.analytics import buffer
+from apps.analytics.models import Event
+from apps.analytics.utils import log_event
+
+
+def _row(name="job_view", **extra):
+    return {"name": name, "path": "/jobs/x/", "properties": {"job_id": 1}, "created_at": timezone.now(), **extra}
+
+
+@pytest.mark.django_db
+def test_sync_mode_writes_inline(seeker):
+    request = RequestFactory().get("/jobs/x/", HTTP_USER_AGENT="pytest")
+    request.user = seeker
+    log_event(request, "job_view", {"job_id": 1})
+    event = Event.objects.get()
+    assert (event.name, event.user_id, event.user_agent) == ("job_view", seeker.id, "pytest")
+
+
+@pytest.mark.django_db
+def test_buffer_batches_and_drops_when_full(django_assert_num_queries):
+    events = buffer.EventBuffer(max_size=3, batch_size=2)
+    accepted = [events.put(_row(f"e{i}")) for i in range(4)]
+    assert accepted == [True, True, True, False]
+    with django_assert_num_queries(2):
+        assert events.flush() == 3
+    assert Event.objects.count() == 3
+    assert events.stats()["flushed"] == 3 and events.stats()["dropped"] == 1
+
+
+@pytest.mark.django_db
+def test_failed_flush_is_spooled_and_replayed(tmp_path, monkeypatch):
+    monkeypatch.setattr(buffer, "SPOOL_DIR", tmp_path)
+    real_write = buffer.write_events
+    monkeypatch.setattr(buffer, "write_events", lambda rows: (_ for _ in ()).throw(RuntimeError("db down")))
+    events = buffer.EventBuffer()
+    events.put(_row())
+    events.put(_row("job_posted"))
+    events.flush()
+    assert events.stats()["spooled"] == 2 and not Event.objects.exists()
+
+    monkeypatch.setattr(buffer, "write_events", real_write)
+    assert buffer.replay_spool() == {"files": 1, "events": 2}
+    assert sorted(Event.objects.values_list("name", flat=True)) == ["job_posted", "job_view"]
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.django_db
+def test_replay_is_all_or_nothing_per_file(tmp_path, monkeypatch):
+    buffer.spool([_row(f"e{i}") for i in range(3)], tmp_path)
+    real_write = buffer.write_events
+    calls = []
+
+    def flaky_write(rows):
+        calls.append(len(rows))
+        if len(calls) == 2:
+            raise RuntimeError("db down")
+        return real_write(rows)
+
+    monkeypatch.setattr(buffer, "write_events", flaky_write)
+    with pytest.raises(RuntimeError):
+        buffer.replay_spool(tmp_path, batch_size=2)
+    assert not Event.objects.exists()
+
+    monkeypatch.setattr(buffer, "write_events", real_write)
+    assert buffer.replay_spool(tmp_path, batch_size=2) == {"files": 1, "events": 3}
+    assert Event.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_ledger_records_events_lost_by_a_dead_process(tmp_path, monkeypatch):
+    ledger = tmp_path / "ledger-1.json"
+    events = buffer.EventBuffer(ledger_path=ledger)
+    events.put(_row())
+    events.flush()
+    events.put(_row())
+    events.put(_row())
+    events.persist()
+    assert ledger.exists()
+
+    # Still running: left alone
+    assert buffer.reap_ledgers(tmp_path) == 0
+    monkeypatch.setattr(buffer, "_pid_alive", lambda pid: False)
+    monkeypatch.setattr(buffer.os, "getpid", lambda: -1)
+    assert buffer.reap_ledgers(tmp_path) == 2
+    assert not ledger.exists()
+
+
+@pytest.mark.django_db
+def test_clean_stop_removes_ledger(tmp_path):
+    ledger = tmp_path / "ledger-1.json"
+    events = buffer.EventBuffer(ledger_path=ledger)
+    events.put(_row())
+    events.persist()
+    events.stop()
+    assert Event.objects.count() == 1
+    assert not ledger.exists()
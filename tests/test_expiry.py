@@ -0,0 +1,46 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from apps.jobs.bulk import jobs_bulk_changed
+from apps.jobs.expiry import expire_jobs
+from apps.jobs.models import Job
+
+
+@pytest.fixture
+def expired(make_job):
+    past = timezone.now() - timedelta(days=1)
+    jobs = [make_job(title=f"Old {i}", slug=f"old-{i}", expires_at=past) for i in range(5)]
+    make_job(title="Fresh", slug="fresh", expires_at=timezone.now() + timedelta(days=3))
+    make_job(title="Open", slug="open")
+    return jobs
+
+
+@pytest.mark.django_db
+def test_dry_run_only_counts(expired):
+    stats = expire_jobs(dry_run=True)
+    assert stats["remaining"] == 5 and stats["expired"] == 0
+    assert Job.objects.filter(is_active=True).count() == 7
+
+
+@pytest.mark.django_db
+def test_expires_in_batches_and_notifies(expired):
+    received = []
+
+    def listener(sender, job_ids, reason, **kwargs):
+        received.append((reason, len(job_ids)))
+
+    jobs_bulk_changed.connect(listener)
+    try:
+        stats = expire_jobs(batch_size=2)
+    finally:
+        jobs_bulk_changed.disconnect(listener)
+    assert stats["expired"] == 5 and stats["batches"] == 3
+    assert received == [("expired", 2), ("expired", 2), ("expired", 1)]
+    assert set(Job.objects.filter(is_active=True).values_list("slug", flat=True)) == {"fresh", "open"}
+
+
+@pytest.mark.django_db
+def test_max_batches_reports_remaining(expired):
+    stats = expire_jobs(batch_size=2, max_batches=1)
+    assert stats["expired"] == 2 and stats["remaining"] == 3
@@ -0,0 +1,70 @@
+import csv
+import gzip
+import io
+import re
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.utils import timezone
+
+from apps.applications import exports
+from apps.applications.models import Application, ApplicationExport
+
+User = get_user_model()
+
+
+@pytest.fixture
+def applications(job, make_job):
+    other_job = make_job(title="Tester", slug="tester")
+    users = [User.objects.create_user(username=f"c{i}", email=f"c{i}@example.com", password="x") for i in range(5)]
+    apps = [Application.objects.create(job=job, seeker=user) for user in users[:4]]
+    apps.append(Application.objects.create(job=other_job, seeker=users[4], status="interview"))
+    return apps
+
+
+def _rows(text):
+    return list(csv.reader(io.StringIO(text)))
+
+
+@pytest.mark.django_db
+def test_csv_chunks_streams_every_row_in_chunks(applications, company, job):
+    stats = {}
+    chunks = list(exports.csv_chunks(exports.filter_applications(company.id), exports.STATUS_LABELS, chunk_size=2, stats=stats))
+    assert len(chunks) == 4  # header + 3 chunks
+    rows = _rows("".join(chunks))
+    assert rows[0] == exports.HEADER
+    assert [r[1] for r in rows[1:]] == ["c4", "c3", "c2", "c1", "c0"]  # newest first
+    assert stats["rows"] == 5
+
+    only_job = _rows("".join(exports.csv_chunks(exports.filter_applications(company.id, job_id=job.id), {})))
+    assert len(only_job) == 5
+    interviews = _rows("".join(exports.csv_chunks(exports.filter_applications(company.id, "interview"), exports.STATUS_LABELS)))
+    assert [r[4] for r in interviews[1:]] == [exports.STATUS_LABELS["interview"]]
+    assert exports.estimated_rows(company.id, "interview") == 1
+    assert exports.estimated_rows(company.id) == 5
+
+
+@pytest.mark.django_db
+def test_run_export_writes_gzip_and_mails_link(applications, company, employer, settings, tmp_path):
+    settings.APPLICATION_EXPORT_ROOT = tmp_path
+    export = ApplicationExport.objects.create(company=company, requested_by=employer, filters={"status": "submitted"})
+
+    exports.run_export(export.id)
+
+    export.refresh_from_db()
+    assert export.status == ApplicationExport.STATUS_DONE
+    assert export.row_count == 4
+    assert export.file.path.startswith(str(tmp_path))
+    assert re.fullmatch(r"applications/[0-9a-f]{32}\.csv\.gz", export.file.name)
+    with gzip.open(export.file.path, "rt", encoding="utf-8") as src:
+        assert len(_rows(src.read())) == 5
+    assert len(mail.outbox) == 1
+    assert f"/exports/{export.id}/" in mail.outbox[0].body
+    assert exports.run_export(export.id) is None  # only pending exports run
+
+    ApplicationExport.objects.filter(id=export.id).update(created_at=timezone.now() - timedelta(days=8))
+    assert exports.purge_expired() == 1
+    assert not ApplicationExport.objects.exists()
+    assert not list(tmp_path.rglob("*.csv.gz"))
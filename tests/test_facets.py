@@ -0,0 +1,70 @@
+import pytest
+from django.http import QueryDict
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from apps.jobs.facets import build_facets, get_facet_counts
+from apps.jobs.models import Job
+from apps.jobs.views import JobListView
+
+
+@pytest.mark.django_db
+def test_facet_counts_single_query(make_job):
+    make_job(title="A", slug="a", category="it", city="cluj", salary_max=5000)
+    make_job(title="B", slug="b", category="it", city="iasi")
+    make_job(title="C", slug="c", category="retail", city="cluj")
+    with CaptureQueriesContext(connection) as ctx:
+        counts = get_facet_counts(Job.objects.all(), QueryDict("q=x"))
+    assert len(ctx.captured_queries) == 1
+    assert counts == {"category": {"it": 2, "retail": 1}, "city": {"cluj": 2, "iasi": 1}, "has_salary": 1}
+
+
+@pytest.mark.django_db
+def test_facets_cached_until_job_changes(make_job):
+    make_job(title="A", slug="a", category="it", city="cluj")
+    params = QueryDict("category=it")
+    assert get_facet_counts(Job.objects.filter(category="it"), params)["category"] == {"it": 1}
+    with CaptureQueriesContext(connection) as ctx:
+        get_facet_counts(Job.objects.filter(category="it"), params)
+    assert len(ctx.captured_queries) == 0
+
+    make_job(title="B", slug="b", category="it", city="iasi")
+    assert get_facet_counts(Job.objects.filter(category="it"), params)["category"] == {"it": 2}
+
+
+@pytest.mark.django_db
+def test_build_facets_toggle_links(make_job):
+    make_job(title="A", slug="a", category="it", city="cluj")
+    facets = build_facets(Job.objects.all(), QueryDict("city=cluj&page=3"))
+    cluj = next(f for f in facets["city"] if f["value"] == "cluj")
+    assert cluj["selected"] and cluj["count"] == 1 and cluj["url"] == "?"
+    it = next(f for f in facets["category"] if f["value"] == "it")
+    assert it["url"] == "?city=cluj&category=it"
+
+
+@pytest.mark.django_db
+def test_selected_facet_keeps_its_other_values(make_job):
+    make_job(title="A", slug="a", category="it", city="cluj", salary_max=5000)
+    make_job(title="B", slug="b", category="it", city="iasi")
+    make_job(title="C", slug="c", category="retail", city="cluj")
+    params = QueryDict("category=it")
+
+    def queryset_for(p):
+        return Job.objects.filter(category=p["category"]) if p.get("category") else Job.objects.all()
+
+    facets = build_facets(queryset_for(params), params, queryset_for)
+    categories = {f["value"]: f["count"] for f in facets["category"] if f["count"]}
+    assert categories == {"it": 2, "retail": 1}
+    cities = {f["value"]: f["count"] for f in facets["city"] if f["count"]}
+    assert cities == {"cluj": 1, "iasi": 1}  # other facets still follow the selection
+
+
+@pytest.mark.django_db
+def test_list_view_facet_queryset_applies_all_filters(make_job):
+    make_job(title="A", slug="a", category="it", city="cluj")
+    make_job(title="B", slug="b", category="it", city="iasi")
+    view = JobListView()
+    view.setup(RequestFactory().get("/jobs/", {"city": "cluj", "sort": "salary"}))
+    view.get_queryset()
+    assert view.facet_queryset(QueryDict("city=iasi")).count() == 1
+    assert view.sort == "salary"
@@ -0,0 +1,54 @@
+import pytest
+from django.core.management import call_command
+from apps.jobs.fingerprint import distance, find_duplicates, scan_duplicates, simhash, title_key
+from apps.jobs.models import Job, JobFingerprint
+
+DESCRIPTION = (
+    "Cautam sofer categoria CE pentru transport international in Uniunea Europeana, "
+    "curse de doua saptamani, salariu fix plus diurna, camion nou si cazare asigurata."
+)
+
+
+def test_title_key_ignores_diacritics_punctuation_and_order():
+    assert title_key("Sofer C+E") == title_key("Șofer CE") == title_key("CE - șofer")
+    assert title_key("Sofer C+E") != title_key("Sofer B")
+
+
+def test_simhash_is_close_for_small_edits():
+    edited = DESCRIPTION.replace("salariu fix", "salariu fix motivant")
+    other = "Angajam programator Python cu experienta in Django si PostgreSQL, lucru remote."
+    assert distance(simhash(DESCRIPTION), simhash(edited)) < distance(simhash(DESCRIPTION), simhash(other))
+    assert simhash("") == 0
+
+
+@pytest.mark.django_db
+def test_find_duplicates_uses_fingerprints(make_job, company):
+    original = make_job(title="Sofer C+E", slug="sofer-1", city="cluj", description=DESCRIPTION)
+    make_job(title="Sofer C+E", slug="sofer-2", city="iasi", description="Alt oras")
+    assert JobFingerprint.objects.filter(job=original).exists()
+
+    assert find_duplicates(company.id, "Șofer CE", "text nou", city="cluj") == [original.id]
+    assert find_duplicates(company.id, "Driver", DESCRIPTION, city="cluj") == [original.id]
+    assert find_duplicates(company.id, "Operator", "altceva complet", city="cluj") == []
+
+
+@pytest.mark.django_db
+def test_scan_flags_and_holds_reposts(make_job):
+    original = make_job(title="Sofer C+E", slug="sofer-1", city="cluj", description=DESCRIPTION)
+    repost = make_job(title="Șofer CE", slug="sofer-2", city="cluj", description=DESCRIPTION + " Urgent!")
+    stats = scan_duplicates(hold=True)
+    assert stats["duplicates"] == 1 and stats["held"] == 1
+
+    repost.refresh_from_db()
+    assert repost.flagged_reason == "duplicate" and repost.moderation_status == Job.MOD_PENDING
+    assert JobFingerprint.objects.get(job=repost).duplicate_of_id == original.id
+    original.refresh_from_db()
+    assert original.flagged_reason == ""
+
+
+@pytest.mark.django_db
+def test_command_backfills_missing_fingerprints(make_job):
+    job = make_job(title="Sofer", slug="sofer")
+    JobFingerprint.objects.all().delete()
+    call_command("scan_duplicates")
+    assert JobFingerprint.objects.filter(job=job).exists()
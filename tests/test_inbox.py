@@ -0,0 +1,39 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+from apps.applications.models import Application
+from apps.applications.views import INBOX_KEYS, _filtered_applications, _get_status_choices
+from apps.companies.models import Company
+from apps.jobs.pagination import KeysetPaginator
+
+User = get_user_model()
+
+
+@pytest.fixture
+def applications(job, make_job):
+    other_job = make_job(title="Tester", slug="tester")
+    apps = []
+    for i in range(5):
+        user = User.objects.create_user(username=f"c{i}", password="x")
+        apps.append(Application.objects.create(job=other_job if i % 2 else job, seeker=user))
+    return apps
+
+
+@pytest.mark.django_db
+def test_company_follows_job(applications, job, employer):
+    assert {a.company_id for a in applications} == {job.company_id}
+    moved_to = Company.objects.create(name="Alta SRL", slug="alta-srl", owner=employer)
+    job.company = moved_to
+    job.save()
+    assert Application.objects.filter(company=moved_to).count() == 3
+
+
+@pytest.mark.django_db
+def test_inbox_keyset_pages_with_filters(applications, job, company):
+    _, label_map = _get_status_choices()
+    request = RequestFactory().get("/", {"job": job.id})
+    paginator = KeysetPaginator(_filtered_applications(request, company, label_map), 2, INBOX_KEYS)
+    first = paginator.get_page(None)
+    second = paginator.get_page(first.next_cursor)
+    assert [a.id for a in first] == [applications[4].id, applications[2].id]
+    assert [a.id for a in second] == [applications[0].id] and not second.has_next()
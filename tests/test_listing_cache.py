@@ -0,0 +1,56 @@
+import pytest
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from apps.jobs.cache import canonical_params
+from apps.jobs.views import JobListView
+
+
+def _page(params):
+    request = RequestFactory().get("/jobs/", params)
+    view = JobListView()
+    view.setup(request)
+    return view.paginate_queryset(view.get_queryset(), 2)
+
+
+def test_canonical_params_normalizes():
+    from django.http import QueryDict
+    a = canonical_params(QueryDict("q=Sofer&loc=&has_salary=on&sort=new"), ("sort", "q", "loc", "has_salary"))
+    b = canonical_params(QueryDict("sort=new&has_salary=1&q=sofer%20"), ("sort", "q", "loc", "has_salary"))
+    assert a == b == (("has_salary", "1"), ("q", "sofer"), ("sort", "new"))
+    # Exact-match filters keep their case: ?category=IT and ?category=it differ
+    keys = ("category", "location")
+    assert canonical_params(QueryDict("category=IT"), keys) != canonical_params(QueryDict("category=it"), keys)
+    assert canonical_params(QueryDict("location=Cluj"), keys) == (("location", "cluj"),)
+
+
+@pytest.mark.django_db
+def test_cached_page_is_single_pk_fetch(make_job):
+    for i in range(3):
+        make_job(title=f"Job {i}", slug=f"job-{i}", category="it")
+    params = {"category": "it", "sort": "new"}
+    first = _page(params)
+    with CaptureQueriesContext(connection) as ctx:
+        second = _page(params)
+    assert len(ctx.captured_queries) == 1
+    assert [j.slug for j in second[2]] == [j.slug for j in first[2]]
+    assert second[1].next_cursor == first[1].next_cursor
+
+
+@pytest.mark.django_db
+def test_offset_page_cache_keeps_totals(make_job):
+    for i in range(3):
+        make_job(title=f"Job {i}", slug=f"job-{i}", category="retail")
+    params = {"category": "retail", "page": "2"}
+    _page(params)
+    paginator, page, jobs, _ = _page(params)
+    assert paginator.count == 3 and page.number == 2 and len(jobs) == 1
+
+
+@pytest.mark.django_db
+def test_job_save_invalidates_cached_pages(make_job):
+    job = make_job(title="Old", slug="old", category="trades")
+    _page({"category": "trades"})
+    job.is_active = False
+    job.save()
+    assert list(_page({"category": "trades"})[2]) == []
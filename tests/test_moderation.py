@@ -0,0 +1,65 @@
+import pytest
+from apps.jobs.models import Job
+from apps.jobs.moderation import Rule, TermMatcher, moderate_job
+
+
+def _pending(make_job, **overrides):
+    data = {"title": "Operator depozit", "slug": "operator", "description": "Program de 8 ore, contract pe perioada nedeterminata."}
+    data.update(overrides)
+    return make_job(moderation_status=Job.MOD_PENDING, is_active=False, **data)
+
+
+@pytest.fixture
+def trusted(make_job, employer):
+    for i in range(5):
+        make_job(title=f"Post vechi {i}", slug=f"vechi-{i}", description=f"Descriere {i} unica")
+
+
+def test_term_matcher_is_whole_word_and_diacritics_insensitive():
+    matcher = TermMatcher(["plata in avans", "spam"])
+    assert matcher.search("Se cere PLATĂ ÎN AVANS.") == "plata in avans"
+    assert matcher.search("filtru antispammer") is None
+    assert TermMatcher([]).search("orice") is None
+
+
+@pytest.mark.django_db
+def test_trusted_employer_job_is_approved(make_job, trusted):
+    job = _pending(make_job)
+    assert moderate_job(job.id) == "approved"
+    job.refresh_from_db()
+    assert job.is_active and job.moderation_status == Job.MOD_APPROVED
+
+
+@pytest.mark.django_db
+def test_new_employer_is_held_without_flag(make_job):
+    job = _pending(make_job)
+    assert moderate_job(job.id) == "held"
+    job.refresh_from_db()
+    assert job.moderation_status == Job.MOD_PENDING and job.flagged_reason == ""
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("description, reason", [
+    ("Suna la 0722 123 456 pentru detalii", "contact_info"),
+    ("Castig garantat, doar o taxa de inscriere mica", "scam"),
+    ("Nu e o teapă, nu suntem escroci", "abuse"),
+])
+def test_flagged_jobs_are_held(make_job, trusted, description, reason):
+    job = _pending(make_job, description=description)
+    assert moderate_job(job.id) == "held"
+    job.refresh_from_db()
+    assert job.flagged_reason == reason
+
+
+@pytest.mark.django_db
+def test_decided_jobs_are_skipped(make_job):
+    job = make_job(title="Aprobat", slug="aprobat")
+    assert moderate_job(job.id) == "skipped"
+
+
+def test_rule_without_check_fails_on_instantiation():
+    class Incomplete(Rule):
+        reason = "x"
+
+    with pytest.raises(TypeError):
+        Incomplete()
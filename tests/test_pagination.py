@@ -0,0 +1,59 @@
+import pytest
+from django.test import RequestFactory
+from apps.jobs.models import Job
+from apps.jobs.pagination import KeysetPaginator, SortKey
+from apps.jobs.views import JobListView
+
+NEW = [SortKey("created_at"), SortKey("id")]
+SALARY = [SortKey("salary_max", nullable=True), SortKey("id")]
+
+
+def _walk(qs, keys, per_page):
+    paginator = KeysetPaginator(qs, per_page, keys)
+    seen, cursor = [], None
+    while True:
+        page = paginator.get_page(cursor)
+        seen.extend(j.slug for j in page)
+        if not page.has_next():
+            return seen
+        cursor = page.next_cursor
+
+
+@pytest.mark.django_db
+def test_keyset_walk_matches_offset_order(make_job):
+    for i in range(7):
+        make_job(title=f"Job {i}", slug=f"job-{i}")
+    expected = list(Job.objects.order_by("-created_at", "-id").values_list("slug", flat=True))
+    assert _walk(Job.objects.all(), NEW, 3) == expected
+
+
+@pytest.mark.django_db
+def test_keyset_salary_sort_puts_missing_salaries_last(make_job):
+    make_job(title="A", slug="a", salary_max=3000)
+    make_job(title="B", slug="b")
+    make_job(title="C", slug="c", salary_max=5000)
+    make_job(title="D", slug="d", salary_max=3000)
+    make_job(title="E", slug="e")
+    assert _walk(Job.objects.all(), SALARY, 2) == ["c", "d", "a", "e", "b"]
+
+
+@pytest.mark.django_db
+def test_invalid_cursor_falls_back_to_first_page(make_job):
+    make_job(title="A", slug="a")
+    page = KeysetPaginator(Job.objects.all(), 10, NEW).get_page("not-a-cursor")
+    assert [j.slug for j in page] == ["a"]
+    assert not page.has_previous()
+
+
+@pytest.mark.django_db
+def test_job_list_view_uses_cursor_links(make_job):
+    for i in range(3):
+        make_job(title=f"Job {i}", slug=f"job-{i}")
+    request = RequestFactory().get("/jobs/", {"has_salary": "", "loc": ""})
+    view = JobListView()
+    view.setup(request)
+    view.paginate_by = 2
+    qs = view.get_queryset()
+    paginator, page, object_list, is_paginated = view.paginate_queryset(qs, 2)
+    assert len(object_list) == 2 and page.has_next()
+    assert page.next_cursor
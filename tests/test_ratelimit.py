@@ -0,0 +1,80 @@
+import pytest
+from django.urls import reverse
+from apps.accounts import ratelimit
+from apps.accounts.ratelimit import SLIDING_WINDOW, Limiter, MemoryBackend
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingBackend(MemoryBackend):
+    def __init__(self, clock):
+        super().__init__(clock)
+        self.calls = 0
+
+    def take(self, *args, **kwargs):
+        self.calls += 1
+        return super().take(*args, **kwargs)
+
+
+def test_token_bucket_refills_evenly():
+    clock = Clock()
+    limiter = Limiter(3, 60, backend=MemoryBackend(clock), clock=clock)
+    assert [limiter.hit("k").allowed for _ in range(4)] == [True, True, True, False]
+    assert limiter.hit("k").retry_after == pytest.approx(20)
+    clock.now += 20
+    assert limiter.hit("k").allowed
+    assert not limiter.hit("k").allowed
+
+
+def test_sliding_window_has_no_edge_burst():
+    clock = Clock()
+    limiter = Limiter(2, 10, algorithm=SLIDING_WINDOW, backend=MemoryBackend(clock), clock=clock)
+    assert limiter.hit("k").allowed
+    clock.now += 9
+    assert limiter.hit("k").allowed
+    clock.now += 0.5
+    refused = limiter.hit("k")
+    assert not refused.allowed and refused.retry_after == pytest.approx(0.5)
+    clock.now += 0.6
+    assert limiter.hit("k").allowed
+
+
+@pytest.mark.parametrize("rate,period,spacing", [(20, 3600, 5), (30, 3600, 60), (100, 60, 0.5)])
+def test_spaced_hits_get_the_full_rate(rate, period, spacing):
+    clock = Clock()
+    limiter = Limiter(rate, period, backend=MemoryBackend(clock), clock=clock)
+    allowed = 0
+    for _ in range(rate):
+        allowed += limiter.hit("k").allowed
+        clock.now += spacing
+    assert allowed == rate
+
+
+def test_local_shortcuts_skip_the_backend():
+    clock = Clock()
+    backend = CountingBackend(clock)
+    limiter = Limiter(6000, 60, backend=backend, clock=clock)
+    assert all(limiter.hit("k").allowed for _ in range(100))
+    assert backend.calls == 1  # one lease of 100 tokens
+
+    small = Limiter(1, 60, backend=backend, clock=clock)
+    small.hit("other")
+    calls = backend.calls
+    assert not any(small.hit("other").allowed for _ in range(5))
+    assert backend.calls == calls + 1  # later refusals answered locally
+
+
+@pytest.mark.django_db
+def test_report_job_returns_429_with_retry_after(client, seeker, job, monkeypatch):
+    monkeypatch.setattr(ratelimit, "get_backend", lambda backend=MemoryBackend(): backend)
+    client.login(username="seeker", password="test1234")
+    url = reverse("jobs:report", kwargs={"slug": job.slug})
+    codes = [client.post(url, {"reason": "spam"}).status_code for _ in range(6)]
+    assert codes == [302] * 5 + [429]
+    assert int(client.post(url, {"reason": "spam"})["Retry-After"]) > 0
@@ -0,0 +1,69 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from apps.jobs.models import Job, JobReport
+from apps.jobs.moderation import moderate_job, review_queue
+from apps.jobs.pagination import KeysetPaginator
+from apps.jobs.views import REVIEW_QUEUE_KEYS
+
+
+@pytest.fixture
+def staff(db):
+    return get_user_model().objects.create_user(username="mod", password="test1234", is_staff=True)
+
+
+@pytest.fixture
+def queue(make_job, seeker):
+    plain = make_job(title="Operator", slug="operator", moderation_status=Job.MOD_PENDING, is_active=False)
+    scam = make_job(title="Castig garantat", slug="scam", description="Doar o taxa de inscriere",
+                    moderation_status=Job.MOD_PENDING, is_active=False)
+    reported = make_job(title="Public raportat", slug="reported")
+    moderate_job(plain.id)
+    moderate_job(scam.id)
+    JobReport.objects.create(job=reported, reporter=seeker, reason=JobReport.REASON_SCAM)
+    JobReport.objects.create(job=reported, reporter=seeker, reason=JobReport.REASON_SPAM)
+    return plain, scam, reported
+
+
+@pytest.mark.django_db
+def test_queue_is_ordered_by_risk_with_report_counts(queue, make_job):
+    plain, scam, reported = queue
+    make_job(title="Curat", slug="curat")  # approved, unreported: not queued
+    page = KeysetPaginator(review_queue(), 2, REVIEW_QUEUE_KEYS).get_page(None)
+    assert [job.slug for job in page.object_list] == ["scam", "reported"]
+    assert page.object_list[1].open_reports == 2
+    rest = KeysetPaginator(review_queue(), 2, REVIEW_QUEUE_KEYS).get_page(page.next_cursor)
+    assert [job.slug for job in rest.object_list] == ["operator"]
+
+
+@pytest.mark.django_db
+def test_queue_action_moderates_and_settles_reports(client, staff, queue):
+    plain, scam, reported = queue
+    client.force_login(staff)
+    resp = client.post(
+        reverse("jobs:moderation_queue_action"),
+        {"action": "approve", "ids": [plain.id, reported.id]},
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+    assert resp.status_code == 200 and resp.json()["changed"] == 1
+    assert not JobReport.objects.filter(handled=False).exists()
+    assert list(Job.objects.filter(needs_review=True).values_list("slug", flat=True)) == ["scam"]
+
+
+@pytest.mark.django_db
+def test_queue_requires_staff(client, seeker):
+    client.force_login(seeker)
+    resp = client.post(reverse("jobs:moderation_queue_action"), {"action": "approve", "ids": [1]})
+    assert resp.status_code == 302
+
+
+@pytest.mark.django_db
+def test_new_pending_jobs_are_queued_and_single_decisions_dequeue(make_job):
+    pending = make_job(title="Nou", slug="nou", moderation_status=Job.MOD_PENDING, is_active=False)
+    other = make_job(title="Altul", slug="altul", moderation_status=Job.MOD_PENDING, is_active=False)
+    # Before moderate_job ever runs
+    assert set(review_queue().values_list("slug", flat=True)) == {"nou", "altul"}
+
+    pending.approve()
+    other.reject(reason="scam")
+    assert not review_queue().exists()
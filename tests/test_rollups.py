@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from apps.analytics import rollups
+from apps.analytics.models import CompanyDailyStat, Event, EventDailyCount, JobDailyStat, RollupWatermark
+
+
+def _events(job, name, n, days_ago=0):
+    when = timezone.now() - timedelta(days=days_ago)
+    Event.objects.bulk_create([Event(name=name, properties={"job_id": job.id}, created_at=when) for _ in range(n)])
+
+
+@pytest.mark.django_db
+def test_rollup_is_incremental(job):
+    _events(job, "job_view", 4, days_ago=1)
+    _events(job, "job_apply", 1, days_ago=1)
+    stats = rollups.run(batch_size=2)
+    assert stats["events"] == 5 and stats["batches"] == 3
+
+    _events(job, "job_view", 2)
+    _events(job, "job_posted", 1)
+    assert rollups.run()["events"] == 3
+    assert rollups.run()["events"] == 0
+
+    today = timezone.localdate()
+    daily = {s.day: (s.views, s.applies) for s in JobDailyStat.objects.filter(job=job)}
+    assert daily == {today - timedelta(days=1): (4, 1), today: (2, 0)}
+    company = CompanyDailyStat.objects.get(company=job.company, day=today)
+    assert (company.views, company.jobs_posted) == (2, 1)
+    assert EventDailyCount.objects.get(name="job_view", day=today).count == 2
+
+
+@pytest.mark.django_db
+def test_rollup_waits_for_ids_to_settle(job):
+    _events(job, "job_view", 3)
+    assert rollups.run(settle_seconds=60)["events"] == 0  # max id becomes the horizon
+    _events(job, "job_view", 2)  # above the horizon: waits for the next one
+    RollupWatermark.objects.filter(name=rollups.WATERMARK).update(horizon_at=timezone.now() - timedelta(seconds=61))
+    assert rollups.run(settle_seconds=60)["events"] == 3
+    assert rollups.run(settle_seconds=60)["events"] == 0
+    assert rollups.run(settle_seconds=0)["events"] == 2
+
+
+@pytest.mark.django_db
+def test_job_stats_api(client, employer, seeker, job):
+    _events(job, "job_view", 8)
+    _events(job, "job_apply", 2)
+    rollups.run()
+    url = reverse("analytics:job_stats", kwargs={"job_id": job.id})
+
+    client.login(username="seeker", password="test1234")
+    assert client.get(url).status_code == 404
+
+    client.login(username="employer", password="test1234")
+    data = client.get(url, {"days": 7}).json()
+    assert len(data["days"]) == 7
+    assert data["days"][-1] == {"day": timezone.localdate().isoformat(), "views": 8, "applies": 2}
+    assert data["totals"] == {"views": 8, "applies": 2, "conversion": 0.25}
@@ -0,0 +1,59 @@
+import pytest
+from apps.jobs.models import Job
+from apps.jobs.salary import get_histogram, rebuild_histograms, salary_range_q
+
+
+@pytest.fixture
+def salaried(make_job):
+    make_job(title="A", slug="a", category="it", city="cluj", salary_min=3000, salary_max=4000)
+    make_job(title="B", slug="b", category="it", city="iasi", salary_min=6000)
+    make_job(title="C", slug="c", category="retail", city="cluj", salary_max=2500)
+    make_job(title="D", slug="d", category="retail", city="cluj")
+    make_job(title="E", slug="e", category="it", city="cluj", salary_max=90000, is_active=False)
+
+
+def _slugs(q):
+    return sorted(Job.objects.filter(q, is_active=True).values_list("slug", flat=True))
+
+
+@pytest.mark.django_db
+def test_salary_range_q(salaried):
+    assert _slugs(salary_range_q(minimum=3500)) == ["a", "b"]
+    assert _slugs(salary_range_q(maximum=3000)) == ["a", "c"]
+    assert _slugs(salary_range_q(minimum=2000, maximum=3500)) == ["a", "c"]
+
+
+@pytest.mark.django_db
+def test_histograms_cover_public_jobs_only(salaried):
+    rebuild_histograms()
+    overall = get_histogram()
+    assert overall["total"] == 3
+    assert [4000, 4500, 1] in overall["buckets"]
+    assert get_histogram("it", "cluj") == {"buckets": [[4000, 4500, 1]], "total": 1}
+    assert get_histogram(city="cluj")["total"] == 2
+    assert get_histogram("trades") == {"buckets": [], "total": 0}
+
+
+@pytest.mark.django_db
+def test_histogram_reads_are_cached_until_rebuild(salaried, make_job, django_assert_num_queries):
+    rebuild_histograms()
+    assert get_histogram("it")["total"] == 2
+    with django_assert_num_queries(0):
+        assert get_histogram("it")["total"] == 2
+    make_job(title="F", slug="f", category="it", city="iasi", salary_min=7000)
+    rebuild_histograms()
+    assert get_histogram("it")["total"] == 3
+
+
+def test_salary_filter_partial_renders_bars_and_keeps_other_filters(rf):
+    from django.template.loader import render_to_string
+
+    request = rf.get("/jobs/", {"city": "cluj", "salary_min": "4000", "after": "abc"})
+    html = render_to_string("jobs/_salary_filter.html", {
+        "salary_histogram": {"buckets": [[4000, 4500, 1], [20000, None, 2]], "total": 3},
+        "salary_peak": 2, "salary_step": 500,
+    }, request=request)
+    assert 'style="height: 50%"' in html and 'style="height: 100%"' in html
+    assert '<input type="hidden" name="city" value="cluj">' in html
+    assert 'name="after"' not in html
+    assert 'name="salary_min" min="0" step="500" value="4000"' in html
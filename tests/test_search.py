@@ -0,0 +1,38 @@
+import pytest
+from apps.jobs.models import Job
+from apps.jobs.search import search_jobs, normalize_text
+
+
+def test_normalize_text_strips_diacritics():
+    assert normalize_text("Șofer Iași") == "sofer iasi"
+
+
+@pytest.mark.django_db
+def test_search_matches_without_diacritics(make_job):
+    make_job(title="Șofer C+E", slug="sofer-ce", description="Transport internațional")
+    make_job(title="Casier", slug="casier", description="Magazin")
+    ids = list(search_jobs(Job.objects.all(), "sofer").values_list("slug", flat=True))
+    assert ids == ["sofer-ce"]
+
+
+@pytest.mark.django_db
+def test_search_ranks_title_matches_first(make_job):
+    make_job(title="Casier", slug="casier", description="Lucru cu depozit si clienti")
+    make_job(title="Lucrator depozit", slug="depozit", description="Manipulare marfa")
+    slugs = list(search_jobs(Job.objects.all(), "depozit").values_list("slug", flat=True))
+    assert slugs == ["depozit", "casier"]
+
+
+@pytest.mark.django_db
+def test_company_rename_reindexes_jobs(company, make_job):
+    make_job(title="Casier", slug="casier")
+    assert not search_jobs(Job.objects.all(), "megastore").exists()
+    company.name = "MegaStore"
+    company.save()
+    assert search_jobs(Job.objects.all(), "megastore").exists()
+
+
+@pytest.mark.django_db
+def test_search_ignores_punctuation_only_query(make_job):
+    make_job(title="Casier", slug="casier")
+    assert search_jobs(Job.objects.all(), "+++").count() == 1
@@ -0,0 +1,71 @@
+import pytest
+from apps.jobs import signals, similarity
+from apps.jobs.models import SimilarJobs
+
+
+@pytest.fixture
+def catalogue(make_job):
+    return {
+        "driver": make_job(title="Sofer camion C+E", slug="driver", category="logistics", city="cluj",
+                           description="Transport marfa international, camion cu remorca"),
+        "driver2": make_job(title="Sofer livrari camion", slug="driver2", category="logistics", city="cluj",
+                            description="Livrari marfa cu camionul in Cluj"),
+        "dev": make_job(title="Programator Python", slug="dev", category="it", city="iasi",
+                        description="Dezvoltare aplicatii web Django"),
+        "dev2": make_job(title="Python developer", slug="dev2", category="it", city="bucharest",
+                         description="Aplicatii web, Django, API"),
+    }
+
+
+@pytest.mark.django_db
+def test_rebuild_index_ranks_related_jobs_first(catalogue):
+    assert similarity.rebuild_index() == 4
+    assert [j.slug for j in similarity.get_similar_jobs(catalogue["driver"])][0] == "driver2"
+    assert [j.slug for j in similarity.get_similar_jobs(catalogue["dev"])][0] == "dev2"
+
+
+@pytest.mark.django_db
+def test_refresh_job_merges_new_job_into_neighbours(catalogue, make_job):
+    similarity.rebuild_index()
+    new = make_job(title="Sofer camion", slug="driver3", category="logistics", city="cluj",
+                   description="Transport marfa cu camion")
+    similarity.refresh_job(new.id)
+    assert SimilarJobs.objects.get(job=new).neighbors
+    driver_neighbors = [pk for pk, _ in SimilarJobs.objects.get(job=catalogue["driver"]).neighbors]
+    assert new.id in driver_neighbors
+
+
+@pytest.mark.django_db
+def test_expired_job_is_hidden_and_dropped(catalogue):
+    similarity.rebuild_index()
+    driver2 = catalogue["driver2"]
+    driver2.is_active = False
+    driver2.save()
+    assert "driver2" not in [j.slug for j in similarity.get_similar_jobs(catalogue["driver"])]
+    similarity.refresh_job(driver2.id)
+    assert not SimilarJobs.objects.filter(job=driver2).exists()
+    driver_neighbors = [pk for pk, _ in SimilarJobs.objects.get(job=catalogue["driver"]).neighbors]
+    assert driver2.id not in driver_neighbors
+
+
+@pytest.mark.django_db
+def test_bulk_refresh_strips_removed_jobs_and_skips_unrelated_saves(catalogue, monkeypatch):
+    similarity.rebuild_index()
+    driver, driver2 = catalogue["driver"], catalogue["driver2"]
+    type(driver).objects.filter(id__in=[driver2.id, catalogue["dev2"].id]).update(is_active=False)
+    recomputed = []
+    monkeypatch.setattr(similarity, "_candidate_corpus", lambda jobs: recomputed.append(jobs))
+    similarity.refresh_jobs([driver2.id, catalogue["dev2"].id])
+    assert recomputed == []  # neighbours are edited in place, not recomputed
+    assert driver2.id not in [pk for pk, _ in SimilarJobs.objects.get(job=driver).neighbors]
+    assert not SimilarJobs.objects.filter(job_id__in=[driver2.id, catalogue["dev2"].id]).exists()
+
+    queued = []
+    monkeypatch.setattr(signals, "enqueue_on_commit", lambda task, *args: queued.append(task))
+    driver.save(update_fields=["risk_score"])
+    driver.salary_max = 5000
+    driver.save()
+    assert signals.refresh_similar_jobs not in queued
+    driver.title = "Sofer TIR"
+    driver.save()
+    assert queued.count(signals.refresh_similar_jobs) == 1
@@ -0,0 +1,66 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from apps.analytics import counters
+from apps.analytics.models import SiteCounter
+from apps.applications.models import Application
+from apps.jobs.expiry import expire_jobs
+from apps.jobs.moderation import bulk_moderate
+from apps.jobs.models import Job
+
+
+def _stored(key):
+    return SiteCounter.objects.get(key=key).value
+
+
+@pytest.mark.django_db
+def test_job_counter_follows_visibility(make_job):
+    job = make_job(title="A", slug="a")
+    make_job(title="B", slug="b")
+    assert _stored(counters.JOBS_ACTIVE) == 2
+
+    job.moderation_status = Job.MOD_PENDING
+    job.save()
+    assert _stored(counters.JOBS_ACTIVE) == 1
+    job.save()
+    assert _stored(counters.JOBS_ACTIVE) == 1
+    job.approve()
+    assert _stored(counters.JOBS_ACTIVE) == 2
+    job.delete()
+    assert _stored(counters.JOBS_ACTIVE) == 1
+
+
+@pytest.mark.django_db
+def test_bulk_expiry_recounts(make_job):
+    make_job(title="Old", slug="old", expires_at=timezone.now() - timedelta(days=1))
+    make_job(title="Open", slug="open")
+    pending = make_job(title="Pending", slug="pending", expires_at=timezone.now() - timedelta(days=1),
+                       moderation_status=Job.MOD_PENDING)  # never public: expiring it changes nothing
+    with CaptureQueriesContext(connection) as ctx:
+        expire_jobs()
+    assert not any("COUNT(" in q["sql"] for q in ctx.captured_queries)  # applied as a delta
+    assert _stored(counters.JOBS_ACTIVE) == 1
+
+    bulk_moderate([pending.id], "approve")
+    assert _stored(counters.JOBS_ACTIVE) == 2
+    bulk_moderate([pending.id], "reject")
+    assert _stored(counters.JOBS_ACTIVE) == 1
+
+
+@pytest.mark.django_db
+def test_company_and_application_counters(job, seeker):
+    assert _stored(counters.COMPANIES) == 1
+    Application.objects.create(job=job, seeker=seeker)
+    assert _stored(counters.applications_month_key()) == 1
+
+
+@pytest.mark.django_db
+def test_reconcile_fixes_drift(make_job):
+    make_job(title="A", slug="a")
+    SiteCounter.objects.filter(key=counters.JOBS_ACTIVE).update(value=42)
+    drift = counters.reconcile()
+    assert drift[counters.JOBS_ACTIVE] == (42, 1)
+    assert counters.get_counters([counters.JOBS_ACTIVE]) == {counters.JOBS_ACTIVE: 1}
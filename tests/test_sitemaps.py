@@ -0,0 +1,58 @@
+import gzip
+
+import pytest
+from django.urls import reverse
+from apps.jobs import sitemap_files
+from apps.jobs.models import Job, SitemapShard
+
+
+@pytest.fixture
+def sitemap_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(sitemap_files, "SITEMAP_ROOT", tmp_path)
+    monkeypatch.setattr("apps.jobs.views.SITEMAP_ROOT", tmp_path)
+    return tmp_path
+
+
+def _urls(path):
+    with gzip.open(path, "rt") as f:
+        return f.read()
+
+
+@pytest.mark.django_db
+def test_full_build_writes_public_shards_and_index(sitemap_root, make_job, monkeypatch):
+    monkeypatch.setattr(sitemap_files, "SHARD_SIZE", 2)
+    jobs = [make_job(title=f"Job {i}", slug=f"job-{i}") for i in range(3)]
+    make_job(title="Pending", slug="pending", moderation_status=Job.MOD_PENDING)
+
+    stats = sitemap_files.build(full=True)
+    shards = sorted(p.name for p in sitemap_root.glob("jobs-*.xml.gz"))
+    assert shards == sorted({sitemap_files.shard_filename("jobs", j.id // 2) for j in jobs})
+    body = "".join(_urls(sitemap_root / name) for name in shards)
+    assert all(f"/jobs/{j.slug}/" in body for j in jobs) and "pending" not in body
+    assert "/companies/exemplu-srl/" in _urls(sitemap_root / "companies-0.xml.gz")
+    index = (sitemap_root / "sitemap.xml").read_text()
+    assert index.count("<sitemap>") == stats["index_entries"] == len(shards) + 1
+
+
+@pytest.mark.django_db
+def test_incremental_build_only_rebuilds_dirty_shards(sitemap_root, make_job):
+    make_job(title="Vechi", slug="vechi")
+    sitemap_files.build(full=True)
+    assert not SitemapShard.objects.filter(dirty=True).exists()
+
+    make_job(title="Nou", slug="nou")
+    assert SitemapShard.objects.filter(section="jobs", dirty=True).count() == 1
+    stats = sitemap_files.build()
+    assert stats["shards"] == 1
+    assert "/jobs/nou/" in _urls(sitemap_root / "jobs-0.xml.gz")
+
+
+@pytest.mark.django_db
+def test_view_serves_files_without_queries(client, sitemap_root, make_job, django_assert_num_queries):
+    make_job(title="Job", slug="job")
+    sitemap_files.build(full=True)
+    with django_assert_num_queries(0):
+        assert client.get(reverse("sitemap")).status_code == 200
+        resp = client.get(reverse("sitemap_shard", args=["jobs-0.xml.gz"]))
+    assert resp["Content-Type"] == "application/gzip"
+    assert client.get("/sitemaps/..%2Fsettings.py").status_code == 404